@@ -27,14 +27,118 @@ class Config(BaseSettings):
     DATABASE_URL: Optional[PostgresDsn] = Field(
         default=None, description="Database URL"
     )
+    DATABASE_READ_URL: Optional[PostgresDsn] = Field(
+        default=None,
+        description="Read replica URL, listing and search queries go to it when set",
+    )
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = Field(
+        default=5,
+        description="Seconds after a write during which the reads of the same "
+        "user stay on the primary, covering the replica lag",
+    )
+    DATABASE_READ_YOUR_WRITES_SECRET: Optional[str] = Field(
+        default=None,
+        description="Key signing the write tokens returned to clients, shared by "
+        "every process so that any of them honours read-your-writes",
+    )
     DATABASE_LOG_ENABLED: bool = Field(
         default=False, description="Enable database logging"
     )
+    DATABASE_ASYNC_ENABLED: bool = Field(
+        default=False,
+        description="Enable the asyncpg engine and the async repositories",
+    )
+    DATABASE_POOL_SIZE: int = Field(
+        default=5, description="Number of connections kept open in the pool"
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=10, description="Connections allowed above the pool size under load"
+    )
+    DATABASE_POOL_TIMEOUT: float = Field(
+        default=30, description="Seconds to wait for a free connection before failing"
+    )
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800, description="Seconds after which a connection is replaced"
+    )
+    DATABASE_POOL_PRE_PING: bool = Field(
+        default=True, description="Test connections for liveness on checkout"
+    )
 
     AUTH_FILE_UPLOAD_TOKEN_SECRET: str = Field(
         ..., description="Secret key for file upload token"
     )
     CASBIN_MODEL_FILE: str = Field(..., description="Casbin model file")
+    CLIENT_CACHE_MAX_SIZE: int = Field(
+        default=1024, description="Max number of API clients kept in the registry"
+    )
+    CLIENT_CACHE_TTL_SECONDS: int = Field(
+        default=60, description="Time to live of an API client in the registry"
+    )
+    AUTH_CREDENTIAL_CACHE_MAX_SIZE: int = Field(
+        default=1024, description="Max number of verified API credentials cached"
+    )
+    AUTH_CREDENTIAL_CACHE_TTL_SECONDS: int = Field(
+        default=300, description="Time to live of a verified API credential"
+    )
+    AUTH_CONTEXT_CACHE_MAX_SIZE: int = Field(
+        default=4096, description="Max number of user tenancy contexts cached"
+    )
+    AUTH_CONTEXT_CACHE_TTL_SECONDS: int = Field(
+        default=10, description="Time to live of a cached user tenancy context"
+    )
+    AUTHORIZATION_DECISION_CACHE_MAX_SIZE: int = Field(
+        default=10000, description="Max number of authorization decisions cached"
+    )
+    AUTHORIZATION_DECISION_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="Time to live of an authorization decision, they are also "
+        "dropped on every policy change",
+    )
+    AUTHORIZATION_CONCRETE_PATH_TEMPLATES: list[str] = Field(
+        default=[],
+        description="Route templates (e.g. /api/v1/users/{id}) authorized on the "
+        "concrete request path instead of the template, for policies bound to "
+        "specific resources",
+    )
+    DATASET_SEARCH_COUNT_STRATEGY: str = Field(
+        default="cached",
+        description="How dataset searches count their results when the request "
+        "does not choose: exact, cached or estimated",
+    )
+    DATASET_COUNT_CACHE_MAX_SIZE: int = Field(
+        default=1024, description="Max number of dataset search counts cached"
+    )
+    DATASET_COUNT_CACHE_TTL_SECONDS: int = Field(
+        default=30, description="Time to live of a cached dataset search count"
+    )
+    DATASET_COUNT_ESTIMATE_THRESHOLD: int = Field(
+        default=10000,
+        description="Planner estimate above which the estimated count strategy "
+        "returns the estimate instead of counting",
+    )
+    DATASET_FACET_CACHE_MAX_SIZE: int = Field(
+        default=1024, description="Max number of dataset filter facet counts cached"
+    )
+    DATASET_FACET_CACHE_TTL_SECONDS: int = Field(
+        default=60, description="Time to live of cached dataset filter facet counts"
+    )
+    DATASET_CACHE_MAX_SIZE: int = Field(
+        default=1024, description="Max number of dataset detail reads cached"
+    )
+    DATASET_CACHE_TTL_SECONDS: int = Field(
+        default=300,
+        description="Time to live of a cached dataset detail read, mutations "
+        "invalidate them earlier",
+    )
+    DATASET_CACHE_REDIS_URL: Optional[str] = Field(
+        default=None,
+        description="Redis URL sharing the dataset detail cache between "
+        "processes, requires the redis package",
+    )
+    EXECUTOR_MAX_WORKERS: int = Field(
+        default=32,
+        description="Max number of threads running blocking calls for async handlers",
+    )
 
     DOI_BASE_URL: str = Field(..., description="Base URL for DOI service")
     DOI_PREFIX: str = Field(..., description="Prefix/Repository for DOI service")
@@ -11,7 +11,11 @@ from app.repository.dataset import DatasetRepository
 from app.repository.dataset_version import DatasetVersionRepository
 from app.repository.doi import DOIRepository
 from app.repository.user import UserRepository
+from app.repository.aio.dataset import AsyncDatasetRepository
+from app.repository.aio.dataset_version import AsyncDatasetVersionRepository
+from app.repository.aio.user import AsyncUserRepository
 
+from app.service.available_filters import AvailableFilters
 from app.service.dataset import DatasetService
 from app.service.dataset_collocation import DatasetCollocationService
 from app.service.doi import DOIService
@@ -20,10 +24,19 @@ from app.service.user import UserService
 
 from app.repository.tenancy import TenancyRepository
 from app.service.tenancy import TenancyService
+from app.service.tenancy_registry import TenancyRegistry
 from app.service.auth import AuthService
+from app.service.authorization_engine import AuthorizationEngine
+from app.service.auth_context import AuthContextService
 from app.database import Database
 from app.repository.client import ClientRepository
 from app.service.client import ClientService
+from app.service.metrics import MetricsService
+from app.service.dataset_cache import DatasetCache, connect_redis
+from app.cache import TTLCache
+from app.executor import BlockingExecutor
+from app.notification import NotificationListener
+from app.policy_watcher import CasbinPolicyWatcher
 from app.config import settings
 
 logger = logging.getLogger("uvicorn")
@@ -35,11 +48,13 @@ class Container(containers.DeclarativeContainer):
             "app.controller.v1.client.client",
             "app.controller.v1.dataset.dataset",
             "app.controller.v1.dataset.dataset_filter",
+            "app.controller.v1.dataset.dataset_suggestion",
             "app.controller.v1.dataset.dataset_snapshot",
             "app.controller.v1.user.user",
             "app.controller.v1.tenancy.tenancy",
             "app.controller.v1.tus.tus",
             "app.controller.v1.internal.dataset_collocation",
+            "app.controller.v1.internal.metrics",
         ]
     )
 
@@ -51,6 +66,81 @@ class Container(containers.DeclarativeContainer):
         Database,
         db_url=config.DATABASE_URL,
         log_enabled=config.DATABASE_LOG_ENABLED,
+        async_enabled=config.DATABASE_ASYNC_ENABLED,
+        pool_size=config.DATABASE_POOL_SIZE,
+        max_overflow=config.DATABASE_MAX_OVERFLOW,
+        pool_timeout=config.DATABASE_POOL_TIMEOUT,
+        pool_recycle=config.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=config.DATABASE_POOL_PRE_PING,
+        read_db_url=config.DATABASE_READ_URL,
+        read_your_writes_seconds=config.DATABASE_READ_YOUR_WRITES_SECONDS,
+        read_your_writes_secret=config.DATABASE_READ_YOUR_WRITES_SECRET,
+    )
+
+    notification_listener = providers.Singleton(
+        NotificationListener,
+        db_url=config.DATABASE_URL,
+    )
+
+    executor = providers.Singleton(
+        BlockingExecutor,
+        max_workers=config.EXECUTOR_MAX_WORKERS,
+    )
+
+    credential_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.AUTH_CREDENTIAL_CACHE_MAX_SIZE,
+        ttl_seconds=config.AUTH_CREDENTIAL_CACHE_TTL_SECONDS,
+    )
+
+    client_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.CLIENT_CACHE_MAX_SIZE,
+        ttl_seconds=config.CLIENT_CACHE_TTL_SECONDS,
+    )
+
+    auth_context_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.AUTH_CONTEXT_CACHE_MAX_SIZE,
+        ttl_seconds=config.AUTH_CONTEXT_CACHE_TTL_SECONDS,
+    )
+    dataset_count_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.DATASET_COUNT_CACHE_MAX_SIZE,
+        ttl_seconds=config.DATASET_COUNT_CACHE_TTL_SECONDS,
+    )
+    dataset_facet_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.DATASET_FACET_CACHE_MAX_SIZE,
+        ttl_seconds=config.DATASET_FACET_CACHE_TTL_SECONDS,
+    )
+    dataset_detail_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.DATASET_CACHE_MAX_SIZE,
+        ttl_seconds=config.DATASET_CACHE_TTL_SECONDS,
+    )
+    dataset_generation_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.DATASET_CACHE_MAX_SIZE,
+        ttl_seconds=config.DATASET_CACHE_TTL_SECONDS,
+    )
+    dataset_cache_redis = providers.Singleton(
+        connect_redis,
+        url=config.DATASET_CACHE_REDIS_URL,
+    )
+    dataset_cache = providers.Singleton(
+        DatasetCache,
+        local=dataset_detail_cache,
+        generations=dataset_generation_cache,
+        ttl_seconds=config.DATASET_CACHE_TTL_SECONDS,
+        redis_client=dataset_cache_redis,
+        engine=db.provided.get_engine.call(),
+    )
+
+    authorization_decision_cache = providers.Singleton(
+        TTLCache,
+        max_size=config.AUTHORIZATION_DECISION_CACHE_MAX_SIZE,
+        ttl_seconds=config.AUTHORIZATION_DECISION_CACHE_TTL_SECONDS,
     )
 
     client_repository = providers.Factory(
@@ -61,6 +151,8 @@ class Container(containers.DeclarativeContainer):
     client_service = providers.Factory(
         ClientService,
         repository=client_repository,
+        client_cache=client_cache,
+        credential_cache=credential_cache,
     )
 
     tenancy_repository = providers.Factory(
@@ -68,9 +160,16 @@ class Container(containers.DeclarativeContainer):
         session_factory=db.provided.session,
     )
 
+    tenancy_registry = providers.Singleton(
+        TenancyRegistry,
+        repository=tenancy_repository,
+    )
+
     tenancy_service = providers.Factory(
         TenancyService,
         repository=tenancy_repository,
+        registry=tenancy_registry,
+        auth_context_cache=auth_context_cache,
     )
 
     casbin_adapter = providers.Singleton(
@@ -81,24 +180,50 @@ class Container(containers.DeclarativeContainer):
         config.CASBIN_MODEL_FILE,
         casbin_adapter,
     )
+    casbin_policy_watcher = providers.Singleton(
+        CasbinPolicyWatcher,
+        engine=db.provided.get_engine.call(),
+        enforcer=casbin_enforcer,
+    )
+    authorization_engine = providers.Singleton(
+        AuthorizationEngine,
+        enforcer=casbin_enforcer,
+        policy_watcher=casbin_policy_watcher,
+        decision_cache=authorization_decision_cache,
+    )
 
     user_repository = providers.Factory(
         UserRepository,
         session_factory=db.provided.session,
     )
 
+    async_user_repository = providers.Factory(
+        AsyncUserRepository,
+        session_factory=db.provided.async_session,
+    )
+
     user_service = providers.Factory(
         UserService,
         repository=user_repository,
         tenancy_repository=tenancy_repository,
         casbin_enforcer=casbin_enforcer,
+        policy_watcher=casbin_policy_watcher,
+        auth_context_cache=auth_context_cache,
+    )
+
+    auth_context_service = providers.Factory(
+        AuthContextService,
+        user_repository=user_repository,
+        cache=auth_context_cache,
+        async_user_repository=async_user_repository,
     )
 
     auth_service = providers.Factory(
         AuthService,
         client_service=client_service,
-        casbin_enforcer=casbin_enforcer,
+        authorization_engine=authorization_engine,
         file_upload_token_secret=config.AUTH_FILE_UPLOAD_TOKEN_SECRET,
+        credential_cache=credential_cache,
     )
 
     doi_gateway = providers.Factory(
@@ -140,6 +265,7 @@ class Container(containers.DeclarativeContainer):
     dataset_repository = providers.Factory(
         DatasetRepository,
         session_factory=db.provided.session,
+        read_session_factory=db.provided.read_session,
     )
 
     dataset_version_repository = providers.Factory(
@@ -152,25 +278,62 @@ class Container(containers.DeclarativeContainer):
         session_factory=db.provided.session,
     )
 
+    async_dataset_repository = providers.Factory(
+        AsyncDatasetRepository,
+        session_factory=db.provided.async_session,
+        read_session_factory=db.provided.async_read_session,
+    )
+
+    async_dataset_version_repository = providers.Factory(
+        AsyncDatasetVersionRepository,
+        session_factory=db.provided.async_session,
+    )
+
+    available_filters = providers.Singleton(AvailableFilters)
+
     dataset_service = providers.Factory(
         DatasetService,
         repository=dataset_repository,
         version_repository=dataset_version_repository,
         data_file_repository=data_file_repository,
-        user_service=user_service,
+        auth_context_service=auth_context_service,
         doi_service=doi_service,
         minio_gateway=minio_gateway,
-        tenancy_service=tenancy_service,
+        tenancy_registry=tenancy_registry,
         dataset_bucket=config.MINIO_DATASET_BUCKET,
+        count_cache=dataset_count_cache,
+        default_count_strategy=config.DATASET_SEARCH_COUNT_STRATEGY,
+        count_estimate_threshold=config.DATASET_COUNT_ESTIMATE_THRESHOLD,
+        facet_cache=dataset_facet_cache,
+        available_filters=available_filters,
+        unit_of_work=db.provided.unit_of_work,
+        dataset_cache=dataset_cache,
+        async_enabled=config.DATABASE_ASYNC_ENABLED,
+        async_repository=async_dataset_repository,
+        async_version_repository=async_dataset_version_repository,
     )
 
     dataset_collocation_service = providers.Factory(
         DatasetCollocationService,
         dataset_repository=dataset_repository,
         datafile_repository=data_file_repository,
+        dataset_cache=dataset_cache,
     )
 
     tus_service = providers.Factory(
         TusService,
         dataset_service=dataset_service,
     )
+
+    metrics_service = providers.Factory(
+        MetricsService,
+        client_cache=client_cache,
+        credential_cache=credential_cache,
+        auth_context_cache=auth_context_cache,
+        authorization_decision_cache=authorization_decision_cache,
+        dataset_count_cache=dataset_count_cache,
+        dataset_facet_cache=dataset_facet_cache,
+        dataset_detail_cache=dataset_detail_cache,
+        executor=executor,
+        db=db,
+    )
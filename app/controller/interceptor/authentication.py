@@ -1,6 +1,7 @@
 from dependency_injector.wiring import inject, Provide
 
 from app.container import Container
+from app.executor import BlockingExecutor
 from app.service.auth import AuthService
 from app.exception.unauthorized import UnauthorizedException
 from fastapi import Depends, HTTPException
@@ -18,8 +19,11 @@ async def authenticate(
     api_key: str = Depends(api_key),
     api_secret: str = Depends(api_secret),
     auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ):
     try:
-        auth_service.authorize_client(api_key=api_key, salted_api_secret=api_secret)
+        await executor.run(
+            auth_service.authorize_client, api_key=api_key, salted_api_secret=api_secret
+        )
     except UnauthorizedException:
         raise HTTPException(status_code=401, detail="Unauthorized")
@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse
 from dependency_injector.wiring import inject, Provide
 
 from app.container import Container
+from app.executor import BlockingExecutor
 from app.controller.interceptor.user_parser import (
     parse_tus_user_id,
     parse_tus_user_token,
@@ -16,16 +17,47 @@ from app.model.tus import TusResult
 from app.service.auth import AuthService
 
 
+def _resource(request: Request, concrete_path_templates: list[str]) -> str:
+    """
+    Authorization resource of a request: the matched route template (e.g.
+    /api/v1/datasets/{id}), so decisions are shared by every dataset instead of
+    cached per concrete URL. Templates listed in `concrete_path_templates`, and
+    requests that did not match a route, are authorized on the concrete path.
+    """
+    path = request.url.path
+    route = request.scope.get("route")
+    path_format = getattr(route, "path_format", None)
+    path_regex = getattr(route, "path_regex", None)
+    if path_format is None or path_regex is None:
+        return path
+
+    # The route only knows its own path, the mount prefixes (/api, /v1, router
+    # prefixes) are whatever precedes the part of the path it matched.
+    template = None
+    for i, char in enumerate(path):
+        if char == "/" and path_regex.match(path[i:]):
+            template = path[:i] + path_format
+            break
+
+    if template is None or template in concrete_path_templates:
+        return path
+    return template
+
+
 @inject
 async def authorize(
     request: Request,
     user_id: UUID = Depends(parse_user_header),
     auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
+    concrete_path_templates: list[str] = Depends(
+        Provide[Container.config.AUTHORIZATION_CONCRETE_PATH_TEMPLATES]
+    ),
 ):
-    resource = request.url.path
+    resource = _resource(request, concrete_path_templates)
     action = request.method
 
-    auth_service.authorize_user(user_id, resource, action)
+    await executor.run(auth_service.authorize_user, user_id, resource, action)
 
 
 def _adapt_tus_response(res: TusResult):
@@ -44,14 +76,23 @@ async def authorize_tus(
     user_id: UUID = Depends(parse_tus_user_id),
     user_token: str = Depends(parse_tus_user_token),
     auth_service: AuthService = Depends(Provide[Container.auth_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
+    concrete_path_templates: list[str] = Depends(
+        Provide[Container.config.AUTHORIZATION_CONCRETE_PATH_TEMPLATES]
+    ),
 ):
-    resource = request.url.path
+    resource = _resource(request, concrete_path_templates)
     action = request.method
 
     try:
         # TODO Get user id from token when available
         auth_service.validate_jwt_and_decode(user_token=user_token)
-        auth_service.authorize_user(user_id=user_id, resource=resource, action=action)
+        await executor.run(
+            auth_service.authorize_user,
+            user_id=user_id,
+            resource=resource,
+            action=action,
+        )
     except UnauthorizedException as e:
         return JSONResponse(
             content=_adapt_tus_response(TusResult(401, str(e), True)), status_code=401
@@ -0,0 +1,56 @@
+import unittest
+
+from fastapi import Request
+from fastapi.routing import APIRoute
+
+from app.controller.interceptor.authorization import _resource
+
+
+def _endpoint():
+    pass
+
+
+def _request(path: str, route_path: str = None) -> Request:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+    }
+    if route_path is not None:
+        scope["route"] = APIRoute(route_path, _endpoint)
+    return Request(scope)
+
+
+class TestAuthorizationResource(unittest.TestCase):
+    def test_uses_route_template(self):
+        request = _request(
+            "/api/v1/datasets/8572ebba-2a3c-45d7-8fc6-13950bced3bc", "/datasets/{id}"
+        )
+
+        self.assertEqual(_resource(request, []), "/api/v1/datasets/{id}")
+
+    def test_uses_route_template_with_path_parameter(self):
+        request = _request(
+            "/api/v1/tenancies/ardc/dev/enable", "/tenancies/{name:path}/enable"
+        )
+
+        self.assertEqual(_resource(request, []), "/api/v1/tenancies/{name}/enable")
+
+    def test_uses_concrete_path_for_configured_templates(self):
+        request = _request("/api/v1/users/123", "/users/{id}")
+
+        self.assertEqual(
+            _resource(request, ["/api/v1/users/{id}"]), "/api/v1/users/123"
+        )
+
+    def test_uses_concrete_path_without_route(self):
+        request = _request("/api/v1/datasets/123")
+
+        self.assertEqual(_resource(request, []), "/api/v1/datasets/123")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import math
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.database import Database, RequestWrites, request_writes
+
+WRITE_TOKEN_HEADER = "X-Write-Token"
+WRITE_TOKEN_COOKIE = "write_token"
+
+
+def read_your_writes_middleware(
+    db: Database, window_seconds: float
+) -> Callable[[Request, Callable], Awaitable[Response]]:
+    """
+    Keeps the reads of a client on the primary database right after it wrote,
+    whichever process serves them.
+
+    A response to a request that wrote rows carries a signed write token, as a
+    header and a cookie. Requests presenting it, in either form, read from the
+    primary until the read-your-writes window expires.
+    """
+
+    async def middleware(request: Request, call_next: Callable) -> Response:
+        writes = RequestWrites(
+            token=request.headers.get(WRITE_TOKEN_HEADER)
+            or request.cookies.get(WRITE_TOKEN_COOKIE)
+        )
+        # Handlers run in a copy of this context, they share `writes`
+        reset_token = request_writes.set(writes)
+        try:
+            response = await call_next(request)
+        finally:
+            request_writes.reset(reset_token)
+
+        write_token = db.write_token(writes)
+        if write_token is not None:
+            response.headers[WRITE_TOKEN_HEADER] = write_token
+            response.set_cookie(
+                WRITE_TOKEN_COOKIE,
+                write_token,
+                max_age=math.ceil(window_seconds),
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
+    return middleware
@@ -1,6 +1,7 @@
 from uuid import UUID
 from fastapi import Depends, Request
 from fastapi.security import APIKeyHeader
+from app.database import current_user_id
 from app.exception.unauthorized import UnauthorizedException
 
 user_id = APIKeyHeader(name="X-User-Id", auto_error=False, scheme_name="X-User-Id")
@@ -10,7 +11,9 @@ async def parse_user_header(request: Request, user_id: str = Depends(user_id)) -
     if not user_id:
         raise UnauthorizedException("user_id header not found")
 
-    return UUID(user_id)
+    parsed = UUID(user_id)
+    current_user_id.set(parsed)
+    return parsed
 
 
 async def parse_tus_user_id(request: Request) -> UUID:
@@ -19,7 +22,9 @@ async def parse_tus_user_id(request: Request) -> UUID:
     if not user_id:
         raise UnauthorizedException(f"unauthorized: {user_id}")
 
-    return UUID(user_id)
+    parsed = UUID(user_id)
+    current_user_id.set(parsed)
+    return parsed
 
 
 async def parse_tus_user_token(request: Request) -> str:
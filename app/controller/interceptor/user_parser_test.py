@@ -5,6 +5,7 @@ from uuid import UUID
 from fastapi import Request
 
 from app.controller.interceptor.user_parser import parse_user_header
+from app.database import current_user_id
 from app.exception.unauthorized import UnauthorizedException
 
 
@@ -55,3 +56,10 @@ class TestUserParserInterceptor(unittest.IsolatedAsyncioTestCase):
                         case.name, case.expected, actual
                     ),
                 )
+
+    async def test_parse_user_header_sets_current_user(self):
+        user_id = await parse_user_header(
+            request=None, user_id="8572EBBA-2A3C-45D7-8FC6-13950BCED3BC"
+        )
+
+        self.assertEqual(current_user_id.get(), user_id)
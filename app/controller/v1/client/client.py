@@ -2,6 +2,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Response
 from dependency_injector.wiring import inject, Provide
 from app.container import Container
+from app.executor import BlockingExecutor
 from app.controller.interceptor.authentication import authenticate
 from app.controller.interceptor.authorization import authorize
 from app.controller.v1.client.resource import (
@@ -25,8 +26,9 @@ router = APIRouter(
 @inject
 async def get_all(
     service: ClientService = Depends(Provide[Container.client_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> list[ClientGetResponse]:
-    clients: list[Client] = service.fetch_all()
+    clients: list[Client] = await executor.run(service.fetch_all)
     return [
         ClientGetResponse(
             key=client.key, name=client.name, is_enabled=client.is_enabled
@@ -42,8 +44,9 @@ async def get_by_key(
     key: UUID,
     response: Response,
     service: ClientService = Depends(Provide[Container.client_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> ClientGetResponse:
-    client: list[Client] = service.fetch(key)
+    client: list[Client] = await executor.run(service.fetch, key)
     if client is not None:
         return ClientGetResponse(
             key=client.key, name=client.name, is_enabled=client.is_enabled
@@ -60,8 +63,11 @@ async def update_by_key(
     key: UUID,
     payload: ClientUpdateRequest,
     service: ClientService = Depends(Provide[Container.client_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.update(key=key, name=payload.name, secret=payload.secret)
+    await executor.run(
+        service.update, key=key, name=payload.name, secret=payload.secret
+    )
     return {}
 
 
@@ -73,8 +79,9 @@ async def update_by_key(
 async def create(
     payload: ClientCreateRequest,
     service: ClientService = Depends(Provide[Container.client_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> ClientCreateResponse:
-    key = service.create(name=payload.name, secret=payload.secret)
+    key = await executor.run(service.create, name=payload.name, secret=payload.secret)
     return ClientCreateResponse(key=key)
 
 
@@ -86,8 +93,9 @@ async def create(
 async def delete(
     key: UUID,
     service: ClientService = Depends(Provide[Container.client_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.disable(key)
+    await executor.run(service.disable, key)
     return {}
 
 
@@ -97,6 +105,7 @@ async def delete(
 async def enable(
     key: UUID,
     service: ClientService = Depends(Provide[Container.client_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.enable(key)
+    await executor.run(service.enable, key)
     return {}
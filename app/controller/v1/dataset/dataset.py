@@ -3,6 +3,7 @@ from uuid import UUID
 import json
 from fastapi import APIRouter, Depends, Response
 from app.container import Container
+from app.executor import BlockingExecutor
 from dependency_injector.wiring import inject, Provide
 
 from app.controller.interceptor.authentication import authenticate
@@ -28,6 +29,7 @@ from app.controller.v1.dataset.resource import (
     PagedDatasetGetResponse,
 )
 from app.model.dataset import (
+    CountStrategy,
     DataFile,
     Dataset,
     DatasetQuery,
@@ -180,9 +182,12 @@ async def get_datasets(
     minimal: bool = False,
     page: int = 1,
     page_size: int = 10,
+    cursor: str = None,
+    count: CountStrategy = None,
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> PagedDatasetGetResponse:
     # Validate pagination params
     page = max(1, page)
@@ -202,11 +207,18 @@ async def get_datasets(
         minimal=minimal,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count_strategy=count,
     )
 
-    result: PaginatedResult = service.search_datasets(
-        query=query, user_id=user_id, tenancies=tenancies
-    )
+    if service.async_enabled:
+        result: PaginatedResult = await service.search_datasets_async(
+            query=query, user_id=user_id, tenancies=tenancies
+        )
+    else:
+        result: PaginatedResult = await executor.run(
+            service.search_datasets, query=query, user_id=user_id, tenancies=tenancies
+        )
 
     if minimal:
         content = [_adapt_minimal_dataset(dataset) for dataset in result.items]
@@ -222,6 +234,10 @@ async def get_datasets(
         total_pages=result.total_pages,
         has_next=result.has_next,
         has_previous=result.has_previous,
+        next_cursor=result.next_cursor,
+        count_strategy=result.count_strategy.value
+        if result.count_strategy is not None
+        else None,
     )
 
 
@@ -238,8 +254,9 @@ async def get_dataset(
     version_is_enabled: bool = True,
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DatasetGetResponse:
-    dataset = service.fetch_dataset(
+    fetch_options = dict(
         dataset_id=id,
         is_enabled=is_enabled,
         user_id=user_id,
@@ -248,6 +265,10 @@ async def get_dataset(
         version_design_state=version_design_state,
         version_is_enabled=version_is_enabled,
     )
+    if service.async_enabled:
+        dataset = await service.fetch_dataset_async(**fetch_options)
+    else:
+        dataset = await executor.run(service.fetch_dataset, **fetch_options)
 
     if dataset is not None:
         return _adapt_dataset(dataset)
@@ -265,8 +286,10 @@ async def update_dataset(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.update_dataset(
+    await executor.run(
+        service.update_dataset,
         dataset_id=id,
         dataset_request=Dataset(
             id=id,
@@ -287,8 +310,9 @@ async def delete_dataset(
     id: str,
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.disable_dataset(dataset_id=id, tenancies=tenancies)
+    await executor.run(service.disable_dataset, dataset_id=id, tenancies=tenancies)
     return {}
 
 
@@ -299,8 +323,10 @@ async def create_dataset(
     dataset_request: DatasetCreateRequest,
     user_id: UUID = Depends(parse_user_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DatasetCreateResponse:
-    created = service.create_dataset(
+    created = await executor.run(
+        service.create_dataset,
         dataset=Dataset(
             name=dataset_request.name,
             data=dataset_request.data,
@@ -328,8 +354,9 @@ async def enable_dataset(
     id: str,
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.enable_dataset(dataset_id=id, tenancies=tenancies)
+    await executor.run(service.enable_dataset, dataset_id=id, tenancies=tenancies)
     return {}
 
 
@@ -342,8 +369,10 @@ async def delete_dataset_version(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.disable_dataset_version(
+    await executor.run(
+        service.disable_dataset_version,
         dataset_id=dataset_id,
         user_id=user_id,
         version_name=version_name,
@@ -361,8 +390,10 @@ async def publish_dataset_version(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.publish_dataset_version(
+    await executor.run(
+        service.publish_dataset_version,
         dataset_id=dataset_id,
         user_id=user_id,
         version_name=version_name,
@@ -380,8 +411,10 @@ async def enable_dataset_version(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.enable_dataset_version(
+    await executor.run(
+        service.enable_dataset_version,
         dataset_id=dataset_id,
         user_id=user_id,
         version_name=version_name,
@@ -400,8 +433,10 @@ async def change_doi_state(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DOIChangeStateResponse:
-    service.change_doi_state(
+    await executor.run(
+        service.change_doi_state,
         dataset_id=dataset_id,
         version_name=version_name,
         new_state=DOIState[change_state_request.state.upper()],
@@ -422,6 +457,7 @@ async def create_doi(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DOICreateResponse:
     if create_doi_request.mode not in DOIMode.__members__:
         return Response(
@@ -430,7 +466,8 @@ async def create_doi(
             media_type="application/json",
         )
 
-    res = service.create_doi(
+    res = await executor.run(
+        service.create_doi,
         dataset_id=dataset_id,
         version_name=version_name,
         doi=DOI(
@@ -455,8 +492,10 @@ async def get_doi(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DOIResponse:
-    res: DOI = service.get_doi(
+    res: DOI = await executor.run(
+        service.get_doi,
         dataset_id=dataset_id,
         version_name=version_name,
         user_id=user_id,
@@ -476,8 +515,10 @@ async def delete_doi(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.delete_doi(
+    await executor.run(
+        service.delete_doi,
         dataset_id=dataset_id,
         version_name=version_name,
         user_id=user_id,
@@ -496,8 +537,10 @@ async def get_file_download_url(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DataFileDownloadResponse:
-    file = service.get_file_download_url(
+    file = await executor.run(
+        service.get_file_download_url,
         dataset_id=dataset_id,
         version_name=version_name,
         file_id=file_id,
@@ -516,8 +559,10 @@ async def create_dataset_version(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DatasetVersionCreateResponse:
-    new_version = service.create_new_version(
+    new_version = await executor.run(
+        service.create_new_version,
         dataset_id=dataset_id,
         datafilesPreviouslyUploaded=dataset_request.datafilesPreviouslyUploaded,
         user_id=user_id,
@@ -536,11 +581,21 @@ async def get_dataset_version(
     user_id: UUID = Depends(parse_user_header),
     tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DatasetVersionGetResponse:
-    res = service.fetch_dataset_version(
-        dataset_id=dataset_id,
-        version_name=version_name,
-        user_id=user_id,
-        tenancies=tenancies,
-    )
+    if service.async_enabled:
+        res = await service.fetch_dataset_version_async(
+            dataset_id=dataset_id,
+            version_name=version_name,
+            user_id=user_id,
+            tenancies=tenancies,
+        )
+    else:
+        res = await executor.run(
+            service.fetch_dataset_version,
+            dataset_id=dataset_id,
+            version_name=version_name,
+            user_id=user_id,
+            tenancies=tenancies,
+        )
     return _adapt_dataset_specific_version(dataset=res)
@@ -1,9 +1,16 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from uuid import UUID
+from fastapi import APIRouter, Depends, Header, Response
 from app.container import Container
+from app.executor import BlockingExecutor
 from dependency_injector.wiring import inject, Provide
 
 from app.controller.interceptor.authentication import authenticate
 from app.controller.interceptor.authorization import authorize
+from app.controller.interceptor.tenancy_parser import parse_tenancy_header
+from app.controller.interceptor.user_parser import parse_user_header
+from app.model.dataset import DatasetQuery
+from app.service.available_filters import AvailableFilters
 from app.service.dataset import DatasetService
 
 router = APIRouter(
@@ -14,10 +21,61 @@ router = APIRouter(
 )
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as If-None-Match requires
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return etag in [candidate.removeprefix("W/") for candidate in candidates]
+
+
 # GET /filters
 @router.get("/filters")
 @inject
 async def get_filters(
+    facets: bool = False,
+    categories: str = None,
+    level: str = None,
+    data_types: str = None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+    full_text: str = None,
+    include_disabled: bool = False,
+    design_state: str = None,
+    version: str = None,
+    visibility: str = None,
+    if_none_match: str = Header(None),
+    user_id: UUID = Depends(parse_user_header),
+    tenancies: list[str] = Depends(parse_tenancy_header),
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    available_filters: AvailableFilters = Depends(Provide[Container.available_filters]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ):
-    return service.fetch_available_filters()
+    if not facets:
+        # Served from memory, with the body serialized once
+        document = available_filters.document()
+        headers = {"ETag": document.etag, "Cache-Control": "no-cache"}
+        if _etag_matches(if_none_match, document.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=document.body, media_type="application/json", headers=headers
+        )
+
+    # Options are counted among the datasets GET /datasets returns for the query
+    query = DatasetQuery(
+        categories=categories.split(",") if categories else [],
+        level=level,
+        data_types=data_types.split(",") if data_types else [],
+        date_from=date_from,
+        date_to=date_to,
+        full_text=full_text,
+        include_disabled=include_disabled,
+        version=version,
+        design_state=design_state,
+        visibility=visibility,
+    )
+    return await executor.run(
+        service.fetch_filter_facets, query=query, user_id=user_id, tenancies=tenancies
+    )
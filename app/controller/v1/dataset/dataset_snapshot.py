@@ -1,6 +1,7 @@
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from app.container import Container
+from app.executor import BlockingExecutor
 from dependency_injector.wiring import inject, Provide
 
 from app.controller.v1.dataset.resource import (
@@ -128,6 +129,7 @@ def _adapt_latest_snapshot_response(
 async def get_dataset_latest_snapshot(
     dataset_id: UUID,
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DatasetLatestSnapshotResponse:
     """
     Get the latest published snapshot of a dataset.
@@ -138,7 +140,9 @@ async def get_dataset_latest_snapshot(
     TODO: Add rate limiting for public endpoints to prevent abuse
     """
     try:
-        snapshot_data = service.get_dataset_latest_snapshot(dataset_id)
+        snapshot_data = await executor.run(
+            service.get_dataset_latest_snapshot, dataset_id
+        )
         return _adapt_latest_snapshot_response(snapshot_data)
     except NotFoundException:
         raise HTTPException(status_code=404, detail="Snapshot not found")
@@ -156,6 +160,7 @@ async def get_dataset_version_snapshot(
     dataset_id: UUID,
     version_name: str,
     service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> DatasetSnapshotResponse:
     """
     Get a specific version snapshot of a dataset.
@@ -166,7 +171,9 @@ async def get_dataset_version_snapshot(
     TODO: Add rate limiting for public endpoints to prevent abuse
     """
     try:
-        snapshot_data = service.get_dataset_version_snapshot(dataset_id, version_name)
+        snapshot_data = await executor.run(
+            service.get_dataset_version_snapshot, dataset_id, version_name
+        )
         return _adapt_snapshot_response(snapshot_data)
     except NotFoundException:
         raise HTTPException(status_code=404, detail="Snapshot not found")
@@ -0,0 +1,44 @@
+from uuid import UUID
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from app.container import Container
+from app.controller.interceptor.authentication import authenticate
+from app.controller.interceptor.authorization import authorize
+from app.controller.interceptor.tenancy_parser import parse_tenancy_header
+from app.controller.interceptor.user_parser import parse_user_header
+from app.controller.v1.dataset.resource import DatasetSuggestionResponse
+from app.executor import BlockingExecutor
+from app.service.dataset import DatasetService
+
+router = APIRouter(
+    prefix="/datasets",
+    tags=["datasets"],
+    dependencies=[Depends(authenticate), Depends(authorize)],
+    responses={404: {"description": "Not found"}},
+)
+
+
+# GET /datasets/suggest
+@router.get("/suggest")
+@inject
+async def suggest_datasets(
+    q: str = "",
+    limit: int = 10,
+    user_id: UUID = Depends(parse_user_header),
+    tenancies: list[str] = Depends(parse_tenancy_header),
+    service: DatasetService = Depends(Provide[Container.dataset_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
+) -> list[DatasetSuggestionResponse]:
+    suggestions = await executor.run(
+        service.suggest_datasets,
+        text=q,
+        user_id=user_id,
+        tenancies=tenancies,
+        limit=limit,
+    )
+    return [
+        DatasetSuggestionResponse(id=suggestion.id, name=suggestion.name)
+        for suggestion in suggestions
+    ]
@@ -109,6 +109,17 @@ class PagedDatasetGetResponse(BaseModel):
     total_pages: int = Field(..., title="Total number of pages")
     has_next: bool = Field(..., title="Whether there is a next page")
     has_previous: bool = Field(..., title="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(
+        None, title="Cursor of the next page, pass it as `cursor` to fetch it"
+    )
+    count_strategy: Optional[str] = Field(
+        None, title="How total_count was computed: exact, cached or estimated"
+    )
+
+
+class DatasetSuggestionResponse(BaseModel):
+    id: UUID = Field(..., title="Dataset ID")
+    name: str = Field(..., title="Name")
 
 
 class DatasetUpdateRequest(BaseModel):
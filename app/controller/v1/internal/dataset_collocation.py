@@ -4,6 +4,7 @@ from dependency_injector.wiring import inject, Provide
 from typing import List
 
 from app.container import Container
+from app.executor import BlockingExecutor
 from app.controller.interceptor.authentication import authenticate
 from app.controller.v1.internal.resource import (
     DatasetPendingCollocationResponse,
@@ -31,12 +32,13 @@ async def get_pending_datasets(
     service: DatasetCollocationService = Depends(
         Provide[Container.dataset_collocation_service]
     ),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> List[DatasetPendingCollocationResponse]:
     """
     Get all datasets with file_collocation_status IS NULL or 'PENDING'.
     Used by archivist service to fetch datasets that need file collocation.
     """
-    datasets = service.get_pending_datasets()
+    datasets = await executor.run(service.get_pending_datasets)
 
     return [
         DatasetPendingCollocationResponse(
@@ -48,9 +50,7 @@ async def get_pending_datasets(
                 if dataset.file_collocation_status
                 else None
             ),
-            file_count=len(
-                [file for version in dataset.versions for file in version.files_in]
-            ),
+            file_count=sum(version.files_count for version in dataset.versions),
         )
         for dataset in datasets
     ]
@@ -67,12 +67,13 @@ async def get_dataset_files(
     service: DatasetCollocationService = Depends(
         Provide[Container.dataset_collocation_service]
     ),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> List[DataFileCollocationResponse]:
     """
     Get all files for a specific dataset across all versions.
     Used by archivist service to fetch files that need to be moved.
     """
-    files = service.get_dataset_files(dataset_id)
+    files = await executor.run(service.get_dataset_files, dataset_id)
 
     return [
         DataFileCollocationResponse(
@@ -103,12 +104,15 @@ async def update_file_path(
     service: DatasetCollocationService = Depends(
         Provide[Container.dataset_collocation_service]
     ),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
     """
     Update the storage_path for a specific file.
     Used by archivist service after moving a file to its new location.
     """
-    service.update_file_path(file_id=file_id, new_path=payload.storage_path)
+    await executor.run(
+        service.update_file_path, file_id=file_id, new_path=payload.storage_path
+    )
 
 
 @router.put(
@@ -123,9 +127,12 @@ async def update_collocation_status(
     service: DatasetCollocationService = Depends(
         Provide[Container.dataset_collocation_service]
     ),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
     """
     Update the file_collocation_status for a dataset.
     Used by archivist service to mark datasets as PROCESSING or COMPLETED.
     """
-    service.update_collocation_status(dataset_id=dataset_id, status=payload.status)
+    await executor.run(
+        service.update_collocation_status, dataset_id=dataset_id, status=payload.status
+    )
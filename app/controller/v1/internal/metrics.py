@@ -0,0 +1,25 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from app.container import Container
+from app.controller.interceptor.authentication import authenticate
+from app.service.metrics import MetricsService
+
+router = APIRouter(
+    prefix="/internal/metrics",
+    tags=["internal"],
+    dependencies=[Depends(authenticate)],
+)
+
+
+# GET /internal/metrics
+@router.get("/")
+@inject
+async def get_metrics(
+    service: MetricsService = Depends(Provide[Container.metrics_service]),
+) -> dict:
+    """
+    Get in-process runtime metrics (cache hit/miss counters, etc.) of this worker.
+    Each uvicorn worker keeps its own counters.
+    """
+    return service.collect()
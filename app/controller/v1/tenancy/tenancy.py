@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, Response
 
 from app.model.tenancy import Tenancy
 from app.container import Container
+from app.executor import BlockingExecutor
 from app.controller.interceptor.authentication import authenticate
 from app.controller.interceptor.authorization import authorize
 from app.controller.v1.tenancy.resource import (
@@ -27,8 +28,9 @@ router = APIRouter(
 @inject
 async def get_all(
     service: TenancyService = Depends(Provide[Container.tenancy_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> list[TenancyGetResponse]:
-    tenancies = service.fetch_all()
+    tenancies = await executor.run(service.fetch_all)
     return [
         TenancyGetResponse(name=tenancy.name, is_enabled=tenancy.is_enabled)
         for tenancy in tenancies
@@ -43,8 +45,9 @@ async def get_by_name(
     response: Response,
     is_enabled: Union[bool, None] = True,
     service: TenancyService = Depends(Provide[Container.tenancy_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> TenancyGetResponse:
-    tenancy = service.fetch(name, is_enabled)
+    tenancy = await executor.run(service.fetch, name, is_enabled)
     if tenancy is not None:
         return TenancyGetResponse(name=tenancy.name, is_enabled=tenancy.is_enabled)
     else:
@@ -59,8 +62,9 @@ async def update_by_name(
     name: str,
     payload: TenancyUpdateRequest,
     service: TenancyService = Depends(Provide[Container.tenancy_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.update(name, Tenancy(payload.name, payload.is_enabled))
+    await executor.run(service.update, name, Tenancy(payload.name, payload.is_enabled))
     return {}
 
 
@@ -70,8 +74,9 @@ async def update_by_name(
 async def create(
     payload: TenancyCreateRequest,
     service: TenancyService = Depends(Provide[Container.tenancy_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.create(Tenancy(payload.name, payload.is_enabled))
+    await executor.run(service.create, Tenancy(payload.name, payload.is_enabled))
     return {}
 
 
@@ -81,8 +86,9 @@ async def create(
 async def delete(
     name: str,
     service: TenancyService = Depends(Provide[Container.tenancy_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.disable(name)
+    await executor.run(service.disable, name)
     return {}
 
 
@@ -92,6 +98,7 @@ async def delete(
 async def enable(
     name: str,
     service: TenancyService = Depends(Provide[Container.tenancy_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.enable(name)
+    await executor.run(service.enable, name)
     return {}
@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Response
 
 from app.container import Container
+from app.executor import BlockingExecutor
 from app.controller.interceptor.authorization import authorize_tus
 from dependency_injector.wiring import inject, Provide
 
@@ -39,6 +40,7 @@ async def post(
     response: Response,
     user_id: UUID = Depends(parse_tus_user_id),
     service: TusService = Depends(Provide[Container.tus_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> dict:
     logger.debug(payload)
     payload_type = payload["Type"]
@@ -47,7 +49,7 @@ async def post(
         f"user_id={user_id} payload.type={payload_type} payload.event.upload={payload_event_upload}"
     )
 
-    res = service.handle(payload=payload, user_id=user_id)
+    res = await executor.run(service.handle, payload=payload, user_id=user_id)
 
     response.status_code = res.status_code
     response.body = json.dumps(_adapt(res)).encode()
@@ -3,6 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 
 from app.container import Container
+from app.executor import BlockingExecutor
 from app.controller.interceptor.authentication import authenticate
 from app.controller.interceptor.authorization import authorize
 from app.controller.v1.user.resource import (
@@ -54,9 +55,10 @@ async def search(
     email: str = None,
     is_enabled: Union[bool, None] = True,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> list[UserGetResponse]:
     query = UserQuery(email=email, is_enabled=is_enabled)
-    users = service.search(query)
+    users = await executor.run(service.search, query)
     return [_adapt_get_response(user) for user in users]
 
 
@@ -67,8 +69,9 @@ async def get(
     id: UUID,
     is_enabled: Union[bool, None] = True,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> UserGetResponse:
-    user: User = service.fetch_by_id(id=id, is_enabled=is_enabled)
+    user: User = await executor.run(service.fetch_by_id, id=id, is_enabled=is_enabled)
     return _adapt_get_response(user)
 
 
@@ -78,14 +81,16 @@ async def get(
 async def create(
     payload: UserCreateRequest,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> UserCreateResponse:
-    user_id = service.create(
+    user_id = await executor.run(
+        service.create,
         User(
             name=payload.name,
             email=payload.email,
             providers=payload.providers,
             roles=payload.roles,
-        )
+        ),
     )
 
     return _adapt_post_response(user_id=user_id)
@@ -98,8 +103,11 @@ async def update(
     id: UUID,
     payload: UserUpdateRequest,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> UserGetResponse:
-    user: User = service.update(id=id, name=payload.name, email=payload.email)
+    user: User = await executor.run(
+        service.update, id=id, name=payload.name, email=payload.email
+    )
     return _adapt_get_response(user)
 
 
@@ -109,8 +117,9 @@ async def update(
 async def delete(
     id: UUID,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.disable(id=id)
+    await executor.run(service.disable, id=id)
     return {}
 
 
@@ -120,8 +129,9 @@ async def delete(
 async def enable(
     id: UUID,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.enable(id=id)
+    await executor.run(service.enable, id=id)
     return {}
 
 
@@ -132,8 +142,9 @@ async def add_roles(
     id: UUID,
     roles: list[str],
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.add_roles(id=id, roles=roles)
+    await executor.run(service.add_roles, id=id, roles=roles)
     return {}
 
 
@@ -144,8 +155,9 @@ async def remove_roles(
     id: UUID,
     roles: list[str],
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.remove_roles(id=id, roles=roles)
+    await executor.run(service.remove_roles, id=id, roles=roles)
     return {}
 
 
@@ -156,8 +168,11 @@ async def add_provider(
     id: UUID,
     payload: UserProviderAddRequest,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.add_provider(id=id, provider=payload.name, reference=payload.reference)
+    await executor.run(
+        service.add_provider, id=id, provider=payload.name, reference=payload.reference
+    )
     return {}
 
 
@@ -171,8 +186,11 @@ async def remove_provider(
     provider: str,
     reference: str,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.remove_provider(id=id, provider_name=provider, reference=reference)
+    await executor.run(
+        service.remove_provider, id=id, provider_name=provider, reference=reference
+    )
     return {}
 
 
@@ -184,9 +202,13 @@ async def get_by_provider_reference(
     reference: str,
     is_enabled: Union[bool, None] = True,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> UserGetResponse:
-    user: User = service.fetch_by_provider(
-        provider_name=provider, reference=reference, is_enabled=is_enabled
+    user: User = await executor.run(
+        service.fetch_by_provider,
+        provider_name=provider,
+        reference=reference,
+        is_enabled=is_enabled,
     )
     return _adapt_get_response(user)
 
@@ -200,8 +222,9 @@ async def add_tenancy(
     id: UUID,
     payload: UserTenanciesRequest,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.add_tenancies(user_id=id, tenancies=payload.tenancies)
+    await executor.run(service.add_tenancies, user_id=id, tenancies=payload.tenancies)
     return {}
 
 
@@ -214,8 +237,11 @@ async def remove_tenancy(
     id: UUID,
     payload: UserTenanciesRequest,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.remove_tenancies(user_id=id, tenancies=payload.tenancies)
+    await executor.run(
+        service.remove_tenancies, user_id=id, tenancies=payload.tenancies
+    )
     return {}
 
 
@@ -226,9 +252,10 @@ async def enforce(
     id: UUID,
     payload: UserEnforceRequest,
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> UserEnforceResponse:
-    is_authorized: bool = service.enforce(
-        user_id=id, resource=payload.resource, action=payload.action
+    is_authorized: bool = await executor.run(
+        service.enforce, user_id=id, resource=payload.resource, action=payload.action
     )
     return UserEnforceResponse(allow=is_authorized)
 
@@ -240,6 +267,7 @@ async def enforce(
 @inject
 async def force_policy_reload(
     service: UserService = Depends(Provide[Container.user_service]),
+    executor: BlockingExecutor = Depends(Provide[Container.executor]),
 ) -> None:
-    service.load_policy()
+    await executor.run(service.load_policy)
     return {}
@@ -1,33 +1,349 @@
-from contextlib import contextmanager, AbstractContextManager
-from typing import Callable
+from contextlib import asynccontextmanager, contextmanager, AbstractContextManager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Hashable, Optional
+import hashlib
+import hmac
 import logging
+import secrets
+import threading
+import time
 
 from pydantic import PostgresDsn
-from sqlalchemy import create_engine, orm
+from sqlalchemy import create_engine, event, exc, orm
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.cache import TTLCache
 
 Base = declarative_base()
 
+ASYNC_DRIVER = "postgresql+asyncpg"
+
+# User of the current request, set by `parse_user_header`. Commits that write
+# rows keep the reads of this user on the primary for a short window.
+current_user_id: ContextVar[Optional[Hashable]] = ContextVar(
+    "current_user_id", default=None
+)
+
+
+@dataclass
+class RequestWrites:
+    """
+    Read-your-writes state of a request, shared by reference with the threads
+    and tasks serving it. `token` is the write token presented by the client,
+    `written_at` is set when the request itself writes rows.
+    """
+
+    token: Optional[str] = None
+    user_id: Optional[Hashable] = None
+    written_at: Optional[float] = None
+
+
+# Set by the read-your-writes middleware for the duration of a request
+request_writes: ContextVar[Optional[RequestWrites]] = ContextVar(
+    "request_writes", default=None
+)
+
+
+@dataclass
+class PoolStats:
+    size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    saturation: float
+    checkouts: int
+    timeouts: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class _CheckoutTimingMixin:
+    """Records how long callers wait to check a connection out of the pool."""
+
+    def _init_checkout_stats(self) -> None:
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _do_get(self):
+        started_at = time.monotonic()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+
+        wait = time.monotonic() - started_at
+        with self._stats_lock:
+            self._checkouts += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        return connection
+
+    def stats(self) -> PoolStats:
+        capacity = self.size() + self._max_overflow
+        checked_out = self.checkedout()
+        with self._stats_lock:
+            return PoolStats(
+                size=self.size(),
+                max_overflow=self._max_overflow,
+                checked_in=self.checkedin(),
+                checked_out=checked_out,
+                overflow=max(0, self.overflow()),
+                saturation=(checked_out / capacity) if capacity > 0 else 0.0,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                avg_wait_ms=(
+                    self._total_wait / self._checkouts * 1000
+                    if self._checkouts
+                    else 0.0
+                ),
+                max_wait_ms=self._max_wait * 1000,
+            )
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._init_checkout_stats()
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._init_checkout_stats()
+
+
+class PrimarySession(Session):
+    """
+    Session bound to the primary database. Inside a unit of work (see
+    `Database.unit_of_work`) commits only flush, the transaction is committed
+    once when the unit of work ends.
+    """
+
+    def commit(self) -> None:
+        if self.info.get("unit_of_work"):
+            self.flush()
+            return
+        super().commit()
+
+
+# Sessions, sync or async, whose `info` holds an `on_write` callback call it
+# after a commit that inserted, updated or deleted rows. Listening on the base
+# class covers the sync session of an AsyncSession as well.
+@event.listens_for(Session, "after_flush")
+def _mark_flush_write(session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_write(orm_execute_state) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _report_write(session) -> None:
+    if session.info.pop("wrote", False):
+        on_write = session.info.get("on_write")
+        if on_write is not None:
+            on_write()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_write(session) -> None:
+    session.info.pop("wrote", None)
+
 
 class Database:
-    def __init__(self, db_url: PostgresDsn, log_enabled: bool) -> None:
+    def __init__(
+        self,
+        db_url: PostgresDsn,
+        log_enabled: bool,
+        async_enabled: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        read_db_url: Optional[PostgresDsn] = None,
+        read_your_writes_seconds: float = 5,
+        read_your_writes_max_size: int = 10000,
+        read_your_writes_secret: Optional[str] = None,
+    ) -> None:
         self._logger = logging.getLogger("database")
-        self._engine = create_engine(db_url.unicode_string(), echo=log_enabled)
+        # Session of the unit of work running in the current context
+        self._unit_of_work: ContextVar[Optional[Session]] = ContextVar(
+            "unit_of_work", default=None
+        )
+        # Users whose recent writes the replica may not have replayed yet, as
+        # seen by this process. Other processes rely on the write token.
+        self._recent_writers = TTLCache(
+            max_size=read_your_writes_max_size, ttl_seconds=read_your_writes_seconds
+        )
+        self._read_your_writes_seconds = read_your_writes_seconds
+        if read_your_writes_secret is None and read_db_url is not None:
+            self._logger.warning(
+                "DATABASE_READ_YOUR_WRITES_SECRET is not set, write tokens are "
+                "only accepted by the process that issued them"
+            )
+        self._write_token_key = (
+            read_your_writes_secret.encode()
+            if read_your_writes_secret is not None
+            else secrets.token_bytes(32)
+        )
+        pool_options = dict(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+        self._engine = create_engine(
+            db_url.unicode_string(),
+            echo=log_enabled,
+            poolclass=InstrumentedQueuePool,
+            **pool_options,
+        )
         self._session_factory = orm.scoped_session(
             orm.sessionmaker(
+                class_=PrimarySession,
                 autocommit=False,
                 autoflush=False,
                 bind=self._engine,
+                info={"on_write": self._record_write},
             ),
         )
 
+        # Without a replica, reads share the primary engine and sessions
+        self._read_engine = None
+        self._read_session_factory = self._session_factory
+        if read_db_url is not None:
+            self._read_engine = create_engine(
+                read_db_url.unicode_string(),
+                echo=log_enabled,
+                poolclass=InstrumentedQueuePool,
+                **pool_options,
+            )
+            self._read_session_factory = orm.scoped_session(
+                orm.sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    bind=self._read_engine,
+                ),
+            )
+
+        self._async_engine = None
+        self._async_session_factory = None
+        self._async_read_engine = None
+        self._async_read_session_factory = None
+        if async_enabled:
+            self._async_engine = create_async_engine(
+                to_async_url(db_url.unicode_string()),
+                echo=log_enabled,
+                poolclass=InstrumentedAsyncQueuePool,
+                **pool_options,
+            )
+            # Objects are returned to callers after the session is closed, so
+            # they must not be expired on commit: an async session cannot
+            # lazily reload attributes outside of an awaitable context.
+            self._async_session_factory = orm.sessionmaker(
+                bind=self._async_engine,
+                class_=AsyncSession,
+                autoflush=False,
+                expire_on_commit=False,
+                info={"on_write": self._record_write},
+            )
+            self._async_read_session_factory = self._async_session_factory
+            if read_db_url is not None:
+                self._async_read_engine = create_async_engine(
+                    to_async_url(read_db_url.unicode_string()),
+                    echo=log_enabled,
+                    poolclass=InstrumentedAsyncQueuePool,
+                    **pool_options,
+                )
+                self._async_read_session_factory = orm.sessionmaker(
+                    bind=self._async_read_engine,
+                    class_=AsyncSession,
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+
     def create_database(self) -> None:
         Base.metadata.create_all(self._engine)
 
     @contextmanager
     def session(self) -> Callable[..., AbstractContextManager[Session]]:
-        session: Session = self._session_factory()
+        unit_of_work = self._unit_of_work.get()
+        if unit_of_work is not None:
+            yield unit_of_work
+            return
+
+        with self._scoped(self._session_factory) as session:
+            yield session
+
+    @contextmanager
+    def unit_of_work(self) -> Callable[..., AbstractContextManager[Session]]:
+        """
+        Runs every session opened in its block, by any repository, on a single
+        session and transaction of the primary database. Repository commits
+        only flush, the block commits once at its end or rolls back entirely
+        on an exception. Nested units of work join the outer one.
+        """
+        if self._unit_of_work.get() is not None:
+            yield self._unit_of_work.get()
+            return
+
+        with self._scoped(self._session_factory) as session:
+            session.info["unit_of_work"] = True
+            # Objects are returned to callers after the session is closed
+            session.expire_on_commit = False
+            token = self._unit_of_work.set(session)
+            try:
+                yield session
+                session.info.pop("unit_of_work")
+                session.commit()
+            finally:
+                self._unit_of_work.reset(token)
+                session.info.pop("unit_of_work", None)
+                session.expire_on_commit = True
+
+    @contextmanager
+    def read_session(self) -> Callable[..., AbstractContextManager[Session]]:
+        """
+        Session for queries that only read. Served by the read replica when
+        configured, unless the current user wrote within the read-your-writes
+        window. Inside a unit of work it is the unit of work session.
+        """
+        unit_of_work = self._unit_of_work.get()
+        if unit_of_work is not None:
+            yield unit_of_work
+            return
+
+        factory = (
+            self._session_factory
+            if self._reads_from_primary()
+            else self._read_session_factory
+        )
+        with self._scoped(factory) as session:
+            yield session
+
+    @contextmanager
+    def _scoped(self, factory) -> Callable[..., AbstractContextManager[Session]]:
+        session: Session = factory()
         try:
             yield session
         except Exception:
@@ -37,5 +353,130 @@ class Database:
         finally:
             session.close()
 
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[AsyncSession]:
+        async with self._async_scoped(self._async_session_factory) as session:
+            yield session
+
+    @asynccontextmanager
+    async def async_read_session(self) -> AsyncIterator[AsyncSession]:
+        """Async counterpart of `read_session`."""
+        factory = (
+            self._async_session_factory
+            if self._reads_from_primary()
+            else self._async_read_session_factory
+        )
+        async with self._async_scoped(factory) as session:
+            yield session
+
+    @asynccontextmanager
+    async def _async_scoped(self, factory) -> AsyncIterator[AsyncSession]:
+        if factory is None:
+            raise RuntimeError(
+                "async database mode is disabled, set DATABASE_ASYNC_ENABLED"
+            )
+
+        session: AsyncSession = factory()
+        try:
+            yield session
+        except Exception:
+            self._logger.exception("Async session rollback because of exception")
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    def write_token(self, writes: RequestWrites) -> Optional[str]:
+        """
+        Signed token of the last write of a request, None when it did not
+        write. Clients present it back so that any process keeps their reads
+        on the primary during the read-your-writes window.
+        """
+        if writes.written_at is None or writes.user_id is None:
+            return None
+        written_at_ms = str(int(writes.written_at * 1000))
+        return f"{written_at_ms}.{self._sign(writes.user_id, written_at_ms)}"
+
+    def _record_write(self) -> None:
+        user_id = current_user_id.get()
+        if user_id is None:
+            return
+        self._recent_writers.set(user_id, True)
+
+        writes = request_writes.get()
+        if writes is not None:
+            writes.user_id = user_id
+            writes.written_at = time.time()
+
+    def _reads_from_primary(self) -> bool:
+        if self._read_engine is None:
+            return True
+        user_id = current_user_id.get()
+        if user_id is None:
+            return False
+        return self._recent_writers.get(user_id, False) or self._presented_write(
+            user_id
+        )
+
+    def _presented_write(self, user_id: Hashable) -> bool:
+        """Whether the client presented a valid token of a write still in the window."""
+        writes = request_writes.get()
+        if writes is None or not writes.token:
+            return False
+
+        written_at_ms, _, signature = writes.token.partition(".")
+        if not written_at_ms.isdigit() or not hmac.compare_digest(
+            signature, self._sign(user_id, written_at_ms)
+        ):
+            return False
+        age = time.time() - int(written_at_ms) / 1000
+        return age <= self._read_your_writes_seconds
+
+    def _sign(self, user_id: Hashable, written_at_ms: str) -> str:
+        return hmac.new(
+            self._write_token_key,
+            f"{user_id}:{written_at_ms}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+
+    @property
+    def replica_enabled(self) -> bool:
+        return self._read_engine is not None
+
+    @property
+    def async_enabled(self) -> bool:
+        return self._async_engine is not None
+
     def get_engine(self):
         return self._engine
+
+    def pool_stats(self) -> PoolStats:
+        return self._engine.pool.stats()
+
+    def read_pool_stats(self) -> Optional[PoolStats]:
+        if self._read_engine is None:
+            return None
+        return self._read_engine.pool.stats()
+
+    def async_pool_stats(self) -> Optional[PoolStats]:
+        if self._async_engine is None:
+            return None
+        return self._async_engine.sync_engine.pool.stats()
+
+    def get_async_engine(self) -> AsyncEngine:
+        return self._async_engine
+
+    async def dispose_async_engine(self) -> None:
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+        if self._async_read_engine is not None:
+            await self._async_read_engine.dispose()
+
+
+def to_async_url(db_url: str) -> str:
+    """Returns the given database URL using the asyncpg driver."""
+    return (
+        make_url(db_url)
+        .set(drivername=ASYNC_DRIVER)
+        .render_as_string(hide_password=False)
+    )
@@ -0,0 +1,97 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class ExecutorStats:
+    max_workers: int
+    queued: int
+    running: int
+    completed: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class BlockingExecutor:
+    """
+    Runs blocking calls (SQLAlchemy, bcrypt, MinIO, DOI HTTP requests) on a sized
+    thread pool, so async FastAPI handlers never block the event loop.
+
+    Controllers await `run(service.method, ...)` instead of calling the service
+    directly. Queue depth and the time a call waited for a free worker are
+    tracked and reported through `stats()`.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._logger = logging.getLogger("executor")
+        self._max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="blocking"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        # Copy the caller context so context variables set by the request
+        # (e.g. the current user) are visible inside the worker thread.
+        context = contextvars.copy_context()
+        submitted_at = time.monotonic()
+
+        def call() -> T:
+            self._on_start(wait=time.monotonic() - submitted_at)
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                self._on_finish()
+
+        with self._lock:
+            self._queued += 1
+
+        future = self._pool.submit(call)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def _on_start(self, wait: float) -> None:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+    def _on_finish(self) -> None:
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            started = self._completed + self._running
+            return ExecutorStats(
+                max_workers=self._max_workers,
+                queued=self._queued,
+                running=self._running,
+                completed=self._completed,
+                avg_wait_ms=(self._total_wait / started * 1000) if started else 0.0,
+                max_wait_ms=self._max_wait * 1000,
+            )
+
+    def shutdown(self) -> None:
+        self._logger.info("Shutting down blocking executor")
+        self._pool.shutdown(wait=True)
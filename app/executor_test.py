@@ -0,0 +1,55 @@
+import contextvars
+import threading
+import unittest
+
+from app.executor import BlockingExecutor
+
+request_value = contextvars.ContextVar("request_value", default=None)
+
+
+class TestBlockingExecutor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.executor = BlockingExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    async def test_run_returns_result_from_worker_thread(self):
+        def work(a, b=0):
+            return a + b, threading.current_thread().name
+
+        result, thread_name = await self.executor.run(work, 1, b=2)
+
+        self.assertEqual(result, 3)
+        self.assertTrue(thread_name.startswith("blocking"))
+
+    async def test_run_propagates_exceptions(self):
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            await self.executor.run(fail)
+
+        self.assertEqual(self.executor.stats().running, 0)
+
+    async def test_run_copies_context_variables(self):
+        request_value.set("user-1")
+
+        actual = await self.executor.run(request_value.get)
+
+        self.assertEqual(actual, "user-1")
+
+    async def test_stats(self):
+        await self.executor.run(lambda: None)
+        await self.executor.run(lambda: None)
+
+        stats = self.executor.stats()
+        self.assertEqual(stats.max_workers, 2)
+        self.assertEqual(stats.queued, 0)
+        self.assertEqual(stats.running, 0)
+        self.assertEqual(stats.completed, 2)
+        self.assertGreaterEqual(stats.max_wait_ms, stats.avg_wait_ms)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,10 @@ import uvicorn
 from fastapi import FastAPI
 from app.container import Container
 from app import setup
+from app.policy_watcher import POLICY_CHANGED_CHANNEL
+from app.service.client import CLIENTS_CHANGED_CHANNEL
+from app.service.dataset_cache import DATASET_CHANGED_CHANNEL
+from app.service.tenancy_registry import TENANCIES_CHANGED_CHANNEL
 
 container = Container()
 
@@ -9,10 +13,52 @@ container = Container()
 db = container.db()
 db.create_database()
 
-# Setup casbin auto reload policy
+# Setup casbin policy watcher, changes are published to and applied by every process
 casbin_enforcer = container.casbin_enforcer()
 casbin_enforcer.enable_auto_build_role_links(True)
-casbin_enforcer.start_auto_load_policy(5)  # reload policy every 5 seconds
+casbin_policy_watcher = container.casbin_policy_watcher()
+casbin_enforcer.set_watcher(casbin_policy_watcher)
+
+# Load tenancies in memory and reload them when another process changes them
+tenancy_registry = container.tenancy_registry()
+tenancy_registry.load()
+auth_context_cache = container.auth_context_cache()
+
+# Clients and their verified credentials are dropped in every process when
+# the client changes
+client_cache = container.client_cache()
+credential_cache = container.credential_cache()
+
+# Without Redis, cached datasets are invalidated in every process by notification
+dataset_cache = container.dataset_cache()
+
+# Parse and serialize the available filters once, they are served from memory
+container.available_filters().load()
+
+
+def on_tenancies_changed(_: str) -> None:
+    tenancy_registry.load()
+    auth_context_cache.clear()
+
+
+def on_clients_changed(key: str) -> None:
+    # An empty payload means notifications may have been missed
+    if not key:
+        client_cache.clear()
+        credential_cache.clear()
+        return
+    client_cache.invalidate(key)
+    credential_cache.invalidate(key)
+
+
+notification_listener = container.notification_listener()
+notification_listener.subscribe(TENANCIES_CHANGED_CHANNEL, on_tenancies_changed)
+notification_listener.subscribe(CLIENTS_CHANGED_CHANNEL, on_clients_changed)
+notification_listener.subscribe(DATASET_CHANGED_CHANNEL, dataset_cache.on_notification)
+notification_listener.subscribe(
+    POLICY_CHANGED_CHANNEL, casbin_policy_watcher.on_notification
+)
+notification_listener.start()
 
 fastAPIApp = FastAPI(
     title="Gatekeeper API",
@@ -23,8 +69,12 @@ fastAPIApp = FastAPI(
 )
 
 fastAPIApp.container = container
+fastAPIApp.add_event_handler("shutdown", container.executor().shutdown)
+fastAPIApp.add_event_handler("shutdown", db.dispose_async_engine)
+fastAPIApp.add_event_handler("shutdown", notification_listener.stop)
 
 setup.setup_logging()
+setup.setup_middlewares(fastAPIApp)
 setup.setup_routes(fastAPIApp)
 setup.setup_error_handlers(fastAPIApp)
 
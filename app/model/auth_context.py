@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+
+@dataclass
+class AuthContext:
+    user_id: UUID
+    # Tenancies the user is a member of, mapped to whether they are enabled
+    tenancies: dict[str, bool] = field(default_factory=dict)
+
+    def is_member(self, tenancy: str) -> bool:
+        return tenancy in self.tenancies
+
+    def enabled_tenancies(self) -> list[str]:
+        return [name for name, is_enabled in self.tenancies.items() if is_enabled]
@@ -35,6 +35,19 @@ class FileCollocationStatus(enum.Enum):
     COMPLETED = "completed"
 
 
+class CountStrategy(enum.Enum):
+    """
+    Determines how the total count of a dataset search is computed.
+    """
+
+    # Count every matching row
+    EXACT = "exact"
+    # Exact count reused for a short time by searches with the same filters
+    CACHED = "cached"
+    # Planner row estimate for large results, exact count below a threshold
+    ESTIMATED = "estimated"
+
+
 @dataclass
 class DataFile:
     name: str
@@ -87,6 +100,12 @@ class Dataset:
     file_count: int = None
 
 
+@dataclass
+class DatasetSuggestion:
+    id: UUID
+    name: str
+
+
 @dataclass
 class DatasetQuery:
     categories: list[str] = field(default_factory=lambda: [])
@@ -102,6 +121,9 @@ class DatasetQuery:
     minimal: bool = False
     page: int = 1
     page_size: int = 10
+    # Opaque keyset cursor, when set it positions the page instead of `page`
+    cursor: str = None
+    count_strategy: CountStrategy = None
 
 
 @dataclass
@@ -112,6 +134,11 @@ class PaginatedResult:
     total_count: int
     page: int
     page_size: int
+    # Cursor the page was fetched with, None for offset pagination
+    cursor: str = None
+    next_cursor: str = None
+    # How total_count was computed
+    count_strategy: CountStrategy = None
 
     @property
     def total_pages(self) -> int:
@@ -121,8 +148,12 @@ class PaginatedResult:
 
     @property
     def has_next(self) -> bool:
+        if self.cursor is not None:
+            return self.next_cursor is not None
         return self.page < self.total_pages
 
     @property
     def has_previous(self) -> bool:
+        if self.cursor is not None:
+            return True
         return self.page > 1
@@ -1,5 +1,5 @@
 import sqlalchemy
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy import (
     Index,
     Enum,
@@ -9,8 +9,11 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     BigInteger,
+    Integer,
     UniqueConstraint,
     Table,
+    DDL,
+    event,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -33,6 +36,8 @@ version_data_file_association = Table(
         ForeignKey("data_files.id"),
         primary_key=True,
     ),
+    # Versions holding a file, the primary key only serves lookups by version
+    Index("idx_dataset_versions_data_files_data_file_id", "data_file_id"),
 )
 
 
@@ -67,11 +72,80 @@ class Dataset(Base):
         ),
         nullable=True,
     )
-    search_vector = Column(String, nullable=True)
+    # Weighted name/category/institution/description vector kept by a trigger
+    search_vector = Column(TSVECTOR, nullable=True)
+    # Most recent version, and most recent enabled version with a DOI, kept by
+    # triggers on dataset_versions and dois, see VERSION_POINTERS_DDL
+    current_version_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(
+            "dataset_versions.id",
+            name="fk_datasets_current_version_id",
+            use_alter=True,
+            ondelete="SET NULL",
+        ),
+        nullable=True,
+    )
+    latest_published_version_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(
+            "dataset_versions.id",
+            name="fk_datasets_latest_published_version_id",
+            use_alter=True,
+            ondelete="SET NULL",
+        ),
+        nullable=True,
+    )
+
+    versions = relationship(
+        "DatasetVersion",
+        lazy="subquery",
+        backref="dataset",
+        foreign_keys="DatasetVersion.dataset_id",
+    )
+
+    __table_args__ = (
+        Index("idx_is_enabled", "is_enabled"),
+        Index("idx_name", "name"),
+        Index("idx_datasets_search_vector", "search_vector", postgresql_using="gin"),
+        # Structured filters (category, data_type, level) match by containment
+        Index(
+            "idx_datasets_data",
+            "data",
+            postgresql_using="gin",
+            postgresql_ops={"data": "jsonb_path_ops"},
+        ),
+        # Typeahead on names, see DatasetRepository.suggest
+        Index(
+            "idx_datasets_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # Search listings of enabled datasets, newest first
+        Index(
+            "idx_datasets_enabled_tenancy_created_at",
+            tenancy,
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=is_enabled,
+        ),
+        # Pending collocation listing, oldest first
+        Index(
+            "idx_datasets_enabled_collocation_status_created_at",
+            file_collocation_status,
+            created_at,
+            postgresql_where=is_enabled,
+        ),
+    )
 
-    versions = relationship("DatasetVersion", lazy="subquery", backref="dataset")
 
-    __table_args__ = (Index("idx_is_enabled", "is_enabled"), Index("idx_name", "name"))
+# `create_database` builds the trigram index too, the operator class must exist
+event.listen(
+    Dataset.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
 
 
 class DatasetVersion(Base):
@@ -98,6 +172,14 @@ class DatasetVersion(Base):
     design_state = Column(Enum(DesignState), nullable=True)
     doi_identifier = Column(String(256), nullable=True)
     doi_state = Column(String(256), nullable=True)
+    # Aggregates over `files_in` kept by triggers on dataset_versions_data_files,
+    # extensions maps ".csv" to {"count": ..., "total_size_bytes": ...}, see
+    # FILE_STATS_DDL
+    files_count = Column(Integer, nullable=False, server_default="0")
+    files_size_in_bytes = Column(BigInteger, nullable=False, server_default="0")
+    files_extensions = Column(
+        JSONB, nullable=False, server_default=sqlalchemy.text("'{}'::jsonb")
+    )
 
     # TODO: files must be deprecated after migrated to files_in
     files = relationship("DataFile", lazy="subquery", backref="dataset_version")
@@ -112,6 +194,15 @@ class DatasetVersion(Base):
     __table_args__ = (
         Index("idx_dataset_versions_name", "name"),
         Index("idx_dataset_versions_created_at", "created_at"),
+        Index("idx_dataset_versions_dataset_id_created_at", "dataset_id", "created_at"),
+        # Draft lookup of a dataset, newest first. Lookups by (dataset_id, name)
+        # use uc_dataset_versions_name_dataset_id
+        Index(
+            "idx_dataset_versions_dataset_id_design_state_created_at",
+            dataset_id,
+            design_state,
+            created_at.desc(),
+        ),
         UniqueConstraint(
             "name", "dataset_id", name="uc_dataset_versions_name_dataset_id"
         ),
@@ -148,4 +239,177 @@ class DataFile(Base):
     __table_args__ = (
         Index("idx_data_files_name", "name"),
         Index("idx_data_files_created_at", "created_at"),
+        Index("idx_data_files_version_id", "version_id"),
+    )
+
+
+# `create_database` builds a fresh database from this metadata, without the
+# migrations. The triggers keeping the version pointers and the file
+# aggregates are created along with their tables, as in migrations
+# d5f7b9c1e3a6 and c3e5a7b9d1f4.
+
+# Current version: the most recent one. Latest published version: the most
+# recent enabled one with a DOI. The trigger on dois is in app.model.db.doi
+VERSION_POINTERS_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION datasets_version_pointers_refresh(target uuid)
+    RETURNS void AS $$
+    BEGIN
+        UPDATE datasets
+        SET current_version_id = (
+                SELECT v.id FROM dataset_versions v
+                WHERE v.dataset_id = target
+                ORDER BY v.created_at DESC
+                LIMIT 1
+            ),
+            latest_published_version_id = (
+                SELECT v.id FROM dataset_versions v
+                WHERE v.dataset_id = target
+                AND v.is_enabled
+                AND EXISTS (SELECT 1 FROM dois d WHERE d.version_id = v.id)
+                ORDER BY v.created_at DESC
+                LIMIT 1
+            )
+        WHERE id = target;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION dataset_versions_pointers_update()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' AND OLD.dataset_id IS NOT NULL THEN
+            PERFORM datasets_version_pointers_refresh(OLD.dataset_id);
+        END IF;
+        IF TG_OP <> 'DELETE' AND NEW.dataset_id IS NOT NULL
+            AND (
+                TG_OP = 'INSERT' OR NEW.dataset_id IS DISTINCT FROM OLD.dataset_id
+            ) THEN
+            PERFORM datasets_version_pointers_refresh(NEW.dataset_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER dataset_versions_pointers_trigger
+    AFTER INSERT OR DELETE
+    OR UPDATE OF dataset_id, design_state, is_enabled, created_at
+    ON dataset_versions
+    FOR EACH ROW EXECUTE FUNCTION dataset_versions_pointers_update()
+    """,
+]
+
+# Counts, sizes and extensions of the files attached to a version. The
+# extension of "data.backup.csv" is ".csv", "readme" has "(no extension)"
+FILE_STATS_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION data_file_extension(file_name text)
+    RETURNS text AS $$
+        SELECT CASE
+            WHEN position('.' IN file_name) > 0
+            THEN '.' || substring(file_name FROM '[^.]*$')
+            ELSE '(no extension)'
+        END;
+    $$ LANGUAGE sql IMMUTABLE
+    """,
+    """
+    CREATE OR REPLACE FUNCTION dataset_version_file_stats_apply(
+        version_id uuid, file_name text, file_size bigint, sign integer
+    ) RETURNS void AS $$
+    DECLARE
+        ext text := data_file_extension(file_name);
+        size bigint := sign * coalesce(file_size, 0);
+    BEGIN
+        UPDATE dataset_versions
+        SET files_count = files_count + sign,
+            files_size_in_bytes = files_size_in_bytes + size,
+            files_extensions = CASE
+                WHEN coalesce(
+                    (files_extensions->ext->>'count')::integer, 0
+                ) + sign <= 0
+                THEN files_extensions - ext
+                ELSE jsonb_set(
+                    files_extensions,
+                    ARRAY[ext],
+                    jsonb_build_object(
+                        'count',
+                        coalesce(
+                            (files_extensions->ext->>'count')::integer, 0
+                        ) + sign,
+                        'total_size_bytes',
+                        coalesce(
+                            (files_extensions->ext->>'total_size_bytes')::bigint, 0
+                        ) + size
+                    )
+                )
+            END
+        WHERE id = version_id;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION dataset_versions_data_files_stats_update()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            PERFORM dataset_version_file_stats_apply(
+                NEW.dataset_version_id, f.name, f.size_bytes, 1
+            )
+            FROM data_files f WHERE f.id = NEW.data_file_id;
+            RETURN NEW;
+        END IF;
+
+        PERFORM dataset_version_file_stats_apply(
+            OLD.dataset_version_id, f.name, f.size_bytes, -1
+        )
+        FROM data_files f WHERE f.id = OLD.data_file_id;
+        RETURN OLD;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER dataset_versions_data_files_stats_trigger
+    AFTER INSERT OR DELETE ON dataset_versions_data_files
+    FOR EACH ROW EXECUTE FUNCTION dataset_versions_data_files_stats_update()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION data_files_stats_update() RETURNS trigger AS $$
+    BEGIN
+        PERFORM dataset_version_file_stats_apply(
+                    a.dataset_version_id, OLD.name, OLD.size_bytes, -1
+                ),
+                dataset_version_file_stats_apply(
+                    a.dataset_version_id, NEW.name, NEW.size_bytes, 1
+                )
+        FROM dataset_versions_data_files a WHERE a.data_file_id = NEW.id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER data_files_stats_trigger
+    AFTER UPDATE OF name, size_bytes ON data_files
+    FOR EACH ROW
+    WHEN (
+        OLD.name IS DISTINCT FROM NEW.name
+        OR OLD.size_bytes IS DISTINCT FROM NEW.size_bytes
+    )
+    EXECUTE FUNCTION data_files_stats_update()
+    """,
+]
+
+for statement in VERSION_POINTERS_DDL:
+    event.listen(
+        DatasetVersion.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+
+# The association table is created after dataset_versions and data_files
+for statement in FILE_STATS_DDL:
+    event.listen(
+        version_data_file_association,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
     )
@@ -0,0 +1,75 @@
+import unittest
+
+from sqlalchemy import create_mock_engine
+
+from app.database import Base
+
+# Every mapped model must be imported to build the whole schema
+from app.model.db import casbin_rule, client, dataset, doi, tenancy, user  # noqa: F401
+
+
+class TestCreateDatabase(unittest.TestCase):
+    def setUp(self):
+        self.statements = []
+
+        def record(statement, *args, **kwargs):
+            self.statements.append(
+                " ".join(str(statement.compile(dialect=engine.dialect)).split())
+            )
+
+        engine = create_mock_engine("postgresql://", record)
+        Base.metadata.create_all(engine, checkfirst=False)
+
+    def index_of(self, prefix: str) -> int:
+        return next(
+            i
+            for i, statement in enumerate(self.statements)
+            if statement.startswith(prefix)
+        )
+
+    def test_version_pointer_triggers_created_with_their_tables(self):
+        refresh = self.index_of(
+            "CREATE OR REPLACE FUNCTION datasets_version_pointers_refresh"
+        )
+        versions_trigger = self.index_of(
+            "CREATE TRIGGER dataset_versions_pointers_trigger"
+        )
+        dois_trigger = self.index_of("CREATE TRIGGER dois_version_pointers_trigger")
+
+        self.assertLess(self.index_of("CREATE TABLE dataset_versions "), refresh)
+        self.assertLess(refresh, versions_trigger)
+        self.assertLess(self.index_of("CREATE TABLE dois "), dois_trigger)
+        self.assertIn(
+            "AFTER INSERT OR DELETE OR UPDATE OF dataset_id, design_state, "
+            "is_enabled, created_at ON dataset_versions",
+            self.statements[versions_trigger],
+        )
+        self.assertIn(
+            "AFTER INSERT OR DELETE OR UPDATE OF version_id ON dois",
+            self.statements[dois_trigger],
+        )
+
+    def test_file_stats_triggers_created_with_their_tables(self):
+        extension = self.index_of("CREATE OR REPLACE FUNCTION data_file_extension")
+        association_trigger = self.index_of(
+            "CREATE TRIGGER dataset_versions_data_files_stats_trigger"
+        )
+        data_files_trigger = self.index_of("CREATE TRIGGER data_files_stats_trigger")
+
+        self.assertLess(
+            self.index_of("CREATE TABLE dataset_versions_data_files "), extension
+        )
+        self.assertLess(extension, association_trigger)
+        self.assertLess(extension, data_files_trigger)
+        self.assertIn(
+            "AFTER INSERT OR DELETE ON dataset_versions_data_files",
+            self.statements[association_trigger],
+        )
+        self.assertIn(
+            "AFTER UPDATE OF name, size_bytes ON data_files",
+            self.statements[data_files_trigger],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import sqlalchemy
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy import Index, Column, String, DateTime, ForeignKey
+from sqlalchemy import Index, Column, String, DateTime, ForeignKey, DDL, event
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -34,4 +34,40 @@ class DOI(Base):
         UUID(as_uuid=True), ForeignKey("dataset_versions.id"), nullable=False
     )
 
-    __table_args__ = (Index("idx_identifier", identifier, unique=True),)
+    __table_args__ = (
+        Index("idx_identifier", identifier, unique=True),
+        Index("idx_dois_version_id", version_id),
+    )
+
+
+# A version counts as published once it holds a DOI, see VERSION_POINTERS_DDL
+# in app.model.db.dataset
+VERSION_POINTERS_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION dois_version_pointers_update() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM datasets_version_pointers_refresh(v.dataset_id)
+            FROM dataset_versions v WHERE v.id = OLD.version_id;
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM datasets_version_pointers_refresh(v.dataset_id)
+            FROM dataset_versions v WHERE v.id = NEW.version_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER dois_version_pointers_trigger
+    AFTER INSERT OR DELETE OR UPDATE OF version_id ON dois
+    FOR EACH ROW EXECUTE FUNCTION dois_version_pointers_update()
+    """,
+]
+
+for statement in VERSION_POINTERS_DDL:
+    event.listen(
+        DOI.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
@@ -0,0 +1,112 @@
+import logging
+import select
+import threading
+from collections import defaultdict
+from typing import Callable
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from pydantic import PostgresDsn
+from sqlalchemy.engine import make_url
+
+NotificationCallback = Callable[[str], None]
+
+
+class NotificationListener:
+    """
+    Listens to Postgres `LISTEN/NOTIFY` channels on a dedicated connection and
+    background thread, dispatching each payload to the subscribed callbacks.
+
+    Callbacks are also invoked with an empty payload after every (re)connection,
+    since notifications sent while disconnected are lost: subscribers should
+    treat any call as "reload your state".
+    """
+
+    def __init__(
+        self,
+        db_url: PostgresDsn,
+        poll_interval_seconds: float = 1.0,
+        reconnect_delay_seconds: float = 5.0,
+    ) -> None:
+        self._logger = logging.getLogger("notification")
+        self._dsn = to_libpq_url(db_url.unicode_string())
+        self._poll_interval_seconds = poll_interval_seconds
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._callbacks: dict[str, list[NotificationCallback]] = defaultdict(list)
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._connected_once = False
+
+    def subscribe(self, channel: str, callback: NotificationCallback) -> None:
+        if self._thread is not None:
+            raise RuntimeError("subscribe must be called before start")
+        self._callbacks[channel].append(callback)
+
+    def start(self) -> None:
+        if self._thread is not None or not self._callbacks:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="notification-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._poll_interval_seconds * 2)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+            except Exception:
+                self._logger.exception(
+                    f"Notification listener failed, reconnecting in "
+                    f"{self._reconnect_delay_seconds}s"
+                )
+                self._stopped.wait(self._reconnect_delay_seconds)
+
+    def _listen(self) -> None:
+        connection = psycopg2.connect(self._dsn)
+        try:
+            connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with connection.cursor() as cursor:
+                for channel in self._callbacks:
+                    cursor.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+            self._logger.info(f"Listening to {list(self._callbacks)}")
+
+            if self._connected_once:
+                for channel in self._callbacks:
+                    self._dispatch(channel, "")
+            self._connected_once = True
+
+            while not self._stopped.is_set():
+                readable, _, _ = select.select(
+                    [connection], [], [], self._poll_interval_seconds
+                )
+                if not readable:
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    notification = connection.notifies.pop(0)
+                    self._dispatch(notification.channel, notification.payload)
+        finally:
+            connection.close()
+
+    def _dispatch(self, channel: str, payload: str) -> None:
+        for callback in self._callbacks.get(channel, []):
+            try:
+                callback(payload)
+            except Exception:
+                self._logger.exception(f"Callback failed for channel {channel}")
+
+
+def to_libpq_url(db_url: str) -> str:
+    """Returns the given SQLAlchemy database URL without the driver suffix."""
+    return (
+        make_url(db_url)
+        .set(drivername="postgresql")
+        .render_as_string(hide_password=False)
+    )
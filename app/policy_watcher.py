@@ -0,0 +1,201 @@
+import json
+import logging
+from contextlib import contextmanager
+from typing import Callable
+from uuid import uuid4
+
+from casbin import SyncedEnforcer
+from casbin.model.policy_op import PolicyOp
+from casbin.persist.watcher_ex import WatcherEx
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+POLICY_CHANGED_CHANNEL = "casbin_policy_changed"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+
+class CasbinPolicyWatcher(WatcherEx):
+    """
+    Keeps the casbin policy of every process in sync without periodic reloads.
+
+    Casbin calls the `update_*` methods after the adapter persisted a change;
+    they publish it on the `casbin_policy_changed` channel. Other processes
+    receive it through `app.notification.NotificationListener` and apply the
+    same rules to their in-memory model, falling back to a full reload when
+    the change cannot be described incrementally.
+    """
+
+    def __init__(self, engine: Engine, enforcer: SyncedEnforcer) -> None:
+        self._logger = logging.getLogger("policy_watcher")
+        self._engine = engine
+        self._enforcer = enforcer
+        self._origin = uuid4().hex
+        self._change_listeners: list[Callable[[], None]] = []
+
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """Registers a callback invoked after any local or remote policy change."""
+        self._change_listeners.append(listener)
+
+    def set_update_callback(self, callback) -> None:
+        # Notifications are received by NotificationListener, see on_notification
+        pass
+
+    def update(self) -> None:
+        self._publish({"op": "reload"})
+
+    def update_for_save_policy(self, model) -> None:
+        self._publish({"op": "reload"})
+
+    def update_for_add_policy(self, sec: str, ptype: str, *params) -> None:
+        self._publish_rules("add", sec, ptype, [_as_rule(params)])
+
+    def update_for_remove_policy(self, sec: str, ptype: str, *params) -> None:
+        self._publish_rules("remove", sec, ptype, [_as_rule(params)])
+
+    def update_for_add_policies(self, sec: str, ptype: str, *rules) -> None:
+        self._publish_rules("add", sec, ptype, _as_rules(rules))
+
+    def update_for_remove_policies(self, sec: str, ptype: str, *rules) -> None:
+        self._publish_rules("remove", sec, ptype, _as_rules(rules))
+
+    def update_for_remove_filtered_policy(
+        self, sec: str, ptype: str, field_index: int, *field_values
+    ) -> None:
+        self._publish(
+            {
+                "op": "remove_filtered",
+                "sec": sec,
+                "ptype": ptype,
+                "field_index": field_index,
+                "field_values": list(field_values),
+            }
+        )
+
+    def on_notification(self, payload: str) -> None:
+        # An empty payload means notifications may have been missed
+        if not payload:
+            self._reload()
+            self._notify_change()
+            return
+
+        message = json.loads(payload)
+        if message.get("origin") == self._origin:
+            return
+
+        try:
+            self._apply_message(message)
+        finally:
+            self._notify_change()
+
+    def _apply_message(self, message: dict) -> None:
+        op = message["op"]
+        if op == "add":
+            self._apply(
+                PolicyOp.Policy_add, message["sec"], message["ptype"], message["rules"]
+            )
+        elif op == "remove":
+            self._apply(
+                PolicyOp.Policy_remove,
+                message["sec"],
+                message["ptype"],
+                message["rules"],
+            )
+        elif op == "remove_filtered":
+            self._apply_remove_filtered(
+                message["sec"],
+                message["ptype"],
+                message["field_index"],
+                message["field_values"],
+            )
+        else:
+            self._reload()
+
+    def _reload(self) -> None:
+        self._logger.info("Reloading casbin policy")
+        self._enforcer.load_policy()
+
+    def _notify_change(self) -> None:
+        for listener in self._change_listeners:
+            listener()
+
+    def _apply(
+        self, op: PolicyOp, sec: str, ptype: str, rules: list[list[str]]
+    ) -> None:
+        with self._locked_enforcer() as enforcer:
+            changed = []
+            for rule in rules:
+                if op == PolicyOp.Policy_add:
+                    applied = enforcer.model.add_policy(sec, ptype, rule)
+                else:
+                    applied = enforcer.model.remove_policy(sec, ptype, rule)
+                if applied:
+                    changed.append(rule)
+
+            if sec == "g" and changed and enforcer.auto_build_role_links:
+                enforcer.model.build_incremental_role_links(
+                    enforcer.rm_map[ptype], op, sec, ptype, changed
+                )
+
+    def _apply_remove_filtered(
+        self, sec: str, ptype: str, field_index: int, field_values: list[str]
+    ) -> None:
+        with self._locked_enforcer() as enforcer:
+            removed = enforcer.model.remove_filtered_policy_returns_effects(
+                sec, ptype, field_index, *field_values
+            )
+            if sec == "g" and removed and enforcer.auto_build_role_links:
+                enforcer.model.build_incremental_role_links(
+                    enforcer.rm_map[ptype], PolicyOp.Policy_remove, sec, ptype, removed
+                )
+
+    @contextmanager
+    def _locked_enforcer(self):
+        # Changes are applied to the wrapped enforcer's model directly, under
+        # the SyncedEnforcer write lock, so they are neither persisted again
+        # through the adapter nor published back to the other processes. The
+        # public add/remove API would write them to the adapter again, and
+        # turning auto_save off around it would also skip the adapter for
+        # concurrent local changes. `_wl` and `_e` are private to casbin, which
+        # is pinned in requirements.txt; TestCasbinInternals fails if they change.
+        with self._enforcer._wl:
+            yield self._enforcer._e
+
+    def _publish_rules(
+        self, op: str, sec: str, ptype: str, rules: list[list[str]]
+    ) -> None:
+        self._publish({"op": op, "sec": sec, "ptype": ptype, "rules": rules})
+
+    def _publish(self, message: dict) -> None:
+        # The local policy has already changed when casbin calls the watcher
+        self._notify_change()
+
+        message["origin"] = self._origin
+        payload = json.dumps(message, default=str)
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            payload = json.dumps({"op": "reload", "origin": self._origin})
+
+        try:
+            with self._engine.begin() as connection:
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": POLICY_CHANGED_CHANNEL, "payload": payload},
+                )
+        except Exception:
+            # The change is already persisted; other processes pick it up on
+            # their next full reload
+            self._logger.exception("Failed to publish casbin policy change")
+
+
+def _as_rule(params: tuple) -> list[str]:
+    # Casbin passes a single rule list, WatcherEx documents variadic params
+    if len(params) == 1 and isinstance(params[0], (list, tuple)):
+        return list(params[0])
+    return list(params)
+
+
+def _as_rules(rules: tuple) -> list[list[str]]:
+    if len(rules) == 1 and rules[0] and isinstance(rules[0][0], (list, tuple)):
+        rules = rules[0]
+    return [list(rule) for rule in rules]
@@ -0,0 +1,153 @@
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from casbin import Enforcer, SyncedEnforcer
+from casbin.model.policy_op import PolicyOp
+
+from app.policy_watcher import POLICY_CHANGED_CHANNEL, CasbinPolicyWatcher
+
+MODEL_FILE = "app/resources/casbin_model.conf"
+
+
+class TestCasbinPolicyWatcher(unittest.TestCase):
+    def setUp(self):
+        self.engine = MagicMock()
+        self.connection = self.engine.begin.return_value.__enter__.return_value
+        self.enforcer = SyncedEnforcer(MODEL_FILE)
+        self.enforcer.enable_auto_build_role_links(True)
+        self.enforcer.add_policy("admin", "/datasets", "GET", "allow")
+        self.watcher = CasbinPolicyWatcher(self.engine, self.enforcer)
+
+    def published(self) -> dict:
+        params = self.connection.execute.call_args.args[1]
+        self.assertEqual(params["channel"], POLICY_CHANGED_CHANNEL)
+        return json.loads(params["payload"])
+
+    def notification(self, **message) -> str:
+        return json.dumps({"origin": "another-process", **message})
+
+    def test_publishes_added_rule(self):
+        self.watcher.update_for_add_policy("g", "g", ["user-1", "admin"])
+
+        message = self.published()
+        self.assertEqual(message["op"], "add")
+        self.assertEqual(message["rules"], [["user-1", "admin"]])
+
+    def test_publishes_reload_when_payload_is_too_large(self):
+        rules = [[f"user-{i}", "admin"] for i in range(1000)]
+
+        self.watcher.update_for_add_policies("g", "g", rules)
+
+        self.assertEqual(self.published()["op"], "reload")
+
+    def test_applies_added_grouping_policy_incrementally(self):
+        self.assertFalse(self.enforcer.enforce("user-1", "/datasets", "GET"))
+
+        self.watcher.on_notification(
+            self.notification(op="add", sec="g", ptype="g", rules=[["user-1", "admin"]])
+        )
+
+        self.assertTrue(self.enforcer.enforce("user-1", "/datasets", "GET"))
+        self.engine.begin.assert_not_called()
+
+    def test_applies_removed_grouping_policy_incrementally(self):
+        self.enforcer.add_grouping_policy("user-1", "admin")
+
+        self.watcher.on_notification(
+            self.notification(
+                op="remove", sec="g", ptype="g", rules=[["user-1", "admin"]]
+            )
+        )
+
+        self.assertFalse(self.enforcer.enforce("user-1", "/datasets", "GET"))
+
+    def test_applies_removed_filtered_policy(self):
+        self.enforcer.add_grouping_policy("user-1", "admin")
+
+        self.watcher.on_notification(
+            self.notification(
+                op="remove_filtered",
+                sec="g",
+                ptype="g",
+                field_index=0,
+                field_values=["user-1"],
+            )
+        )
+
+        self.assertEqual(self.enforcer.get_roles_for_user("user-1"), [])
+
+    def test_ignores_own_notifications(self):
+        self.watcher.update_for_add_policy("g", "g", ["user-1", "admin"])
+        payload = self.connection.execute.call_args.args[1]["payload"]
+
+        self.watcher.on_notification(payload)
+
+        self.assertFalse(self.enforcer.enforce("user-1", "/datasets", "GET"))
+
+    def test_reloads_on_reconnection(self):
+        enforcer = MagicMock(spec=SyncedEnforcer)
+        watcher = CasbinPolicyWatcher(self.engine, enforcer)
+
+        watcher.on_notification("")
+        watcher.on_notification(self.notification(op="reload"))
+
+        self.assertEqual(enforcer.load_policy.call_count, 2)
+
+
+class TestCasbinInternals(unittest.TestCase):
+    """
+    Guards the private SyncedEnforcer attributes the watcher relies on to
+    apply remote changes without persisting or publishing them again.
+    """
+
+    def setUp(self):
+        self.enforcer = SyncedEnforcer(MODEL_FILE)
+        self.enforcer.enable_auto_build_role_links(True)
+        self.enforcer.add_policy("admin", "/datasets", "GET", "allow")
+        self.watcher = CasbinPolicyWatcher(MagicMock(), self.enforcer)
+
+    def test_locked_enforcer_yields_the_wrapped_enforcer(self):
+        model = self.enforcer.get_model()
+
+        with self.watcher._locked_enforcer() as enforcer:
+            self.assertIsInstance(enforcer, Enforcer)
+            self.assertIs(enforcer.model, model)
+            self.assertIn("g", enforcer.rm_map)
+
+    def test_locked_enforcer_holds_the_enforce_lock(self):
+        allowed = []
+        enforce = threading.Thread(
+            target=lambda: allowed.append(
+                self.enforcer.enforce("admin", "/datasets", "GET")
+            )
+        )
+
+        with self.watcher._locked_enforcer():
+            enforce.start()
+            enforce.join(timeout=0.1)
+            self.assertTrue(enforce.is_alive())
+
+        enforce.join(timeout=1)
+        self.assertEqual(allowed, [True])
+
+    def test_model_applies_changes_without_the_adapter(self):
+        with self.watcher._locked_enforcer() as enforcer:
+            self.assertTrue(enforcer.model.add_policy("g", "g", ["user-1", "admin"]))
+            enforcer.model.build_incremental_role_links(
+                enforcer.rm_map["g"],
+                PolicyOp.Policy_add,
+                "g",
+                "g",
+                [["user-1", "admin"]],
+            )
+            removed = enforcer.model.remove_filtered_policy_returns_effects(
+                "g", "g", 0, "user-1"
+            )
+
+        self.assertEqual(removed, [["user-1", "admin"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.dataset import DatasetQuery, PaginatedResult
+from app.model.db.dataset import Dataset, DatasetVersion, DesignState
+from app.repository.dataset import (
+    build_count_query,
+    build_cursor_criteria,
+    build_listing_query,
+    build_matching_query,
+    build_rank,
+    build_search_criteria,
+    build_version_summary_query,
+    next_cursor,
+    paginate,
+    to_dataset_summaries,
+)
+from app.repository.explain import Explain, root_plan
+from app.repository.load_plan import DATASET_FULL, LoadPlan
+
+
+class AsyncDatasetRepository:
+    """Async counterpart of `app.repository.dataset.DatasetRepository`."""
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        read_session_factory: Optional[
+            Callable[..., AbstractAsyncContextManager[AsyncSession]]
+        ] = None,
+    ) -> None:
+        self._session_factory = session_factory
+        # Listings and counts only read, they may be served by a replica
+        self._read_session_factory = read_session_factory or session_factory
+
+    async def fetch(
+        self,
+        dataset_id: UUID,
+        is_enabled: bool = True,
+        tenancies: list[str] = [],
+        latest_version: bool = False,
+        version_design_state: DesignState = None,
+        version_is_enabled: bool = True,
+        load_plan: LoadPlan = DATASET_FULL,
+    ) -> Dataset:
+        async with self._session_factory() as session:
+            stmt = select(Dataset).options(*load_plan).where(Dataset.id == dataset_id)
+
+            if is_enabled:
+                stmt = stmt.where(Dataset.is_enabled == is_enabled)
+
+            stmt = stmt.where(Dataset.tenancy.in_(tenancies))
+
+            if latest_version:
+                stmt = stmt.join(
+                    DatasetVersion,
+                    and_(
+                        DatasetVersion.id == Dataset.current_version_id,
+                        DatasetVersion.design_state == version_design_state
+                        if version_design_state
+                        else True,
+                        DatasetVersion.is_enabled == version_is_enabled,
+                    ),
+                )
+            elif version_is_enabled:
+                stmt = stmt.where(
+                    Dataset.versions.any(
+                        DatasetVersion.is_enabled == version_is_enabled
+                    )
+                )
+
+            result = await session.execute(stmt.limit(1))
+            return result.scalars().first()
+
+    async def search(
+        self,
+        query_params: DatasetQuery,
+        tenancies: list[str] = [],
+        include_count: bool = True,
+    ) -> PaginatedResult:
+        async with self._read_session_factory() as session:
+            criteria, order_by = build_search_criteria(query_params, tenancies)
+            cursor_criteria = build_cursor_criteria(query_params)
+
+            total_count = (
+                await session.scalar(build_count_query(query_params, tenancies))
+                if include_count
+                else None
+            )
+
+            page, page_size, offset = paginate(query_params)
+
+            result = await session.execute(
+                select(Dataset, build_rank(query_params).label("rank"))
+                .where(*criteria, *cursor_criteria)
+                .order_by(*order_by)
+                .offset(offset)
+                .limit(page_size + 1)
+            )
+            rows = result.all()
+
+            return PaginatedResult(
+                items=[row.Dataset for row in rows[:page_size]],
+                total_count=total_count,
+                page=page,
+                page_size=page_size,
+                cursor=query_params.cursor,
+                next_cursor=next_cursor(
+                    [
+                        (row.rank, row.Dataset.created_at, row.Dataset.id)
+                        for row in rows
+                    ],
+                    page_size,
+                ),
+            )
+
+    async def search_minimal(
+        self,
+        query_params: DatasetQuery,
+        tenancies: list[str] = [],
+        include_count: bool = True,
+    ) -> PaginatedResult:
+        async with self._read_session_factory() as session:
+            stmt = build_listing_query(query_params, tenancies)
+            cursor_criteria = build_cursor_criteria(query_params)
+
+            total_count = (
+                await session.scalar(build_count_query(query_params, tenancies))
+                if include_count
+                else None
+            )
+
+            page, page_size, offset = paginate(query_params)
+
+            rows = (
+                await session.execute(
+                    stmt.where(*cursor_criteria).offset(offset).limit(page_size + 1)
+                )
+            ).all()
+            cursor_keys = [(row.rank, row.created_at, row.id) for row in rows]
+            rows = rows[:page_size]
+            version_rows = (
+                (
+                    await session.execute(
+                        build_version_summary_query([row.id for row in rows])
+                    )
+                ).all()
+                if rows
+                else []
+            )
+
+            return PaginatedResult(
+                items=to_dataset_summaries(rows, version_rows),
+                total_count=total_count,
+                page=page,
+                page_size=page_size,
+                cursor=query_params.cursor,
+                next_cursor=next_cursor(cursor_keys, page_size),
+            )
+
+    async def count(self, query_params: DatasetQuery, tenancies: list[str] = []) -> int:
+        async with self._read_session_factory() as session:
+            return await session.scalar(build_count_query(query_params, tenancies))
+
+    async def estimate_count(
+        self, query_params: DatasetQuery, tenancies: list[str] = []
+    ) -> int:
+        async with self._read_session_factory() as session:
+            plan = await session.scalar(
+                Explain(build_matching_query(query_params, tenancies))
+            )
+            return int(root_plan(plan)["Plan Rows"])
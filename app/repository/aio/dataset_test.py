@@ -0,0 +1,177 @@
+import json
+import unittest
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.model.dataset import DatasetQuery
+from app.model.db.dataset import DesignState
+from app.repository.aio.dataset import AsyncDatasetRepository
+
+
+def compile_statement(statement) -> str:
+    return " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+
+
+class TestAsyncDatasetRepository(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.session = AsyncMock()
+        self.read_session = AsyncMock()
+        self.repository = AsyncDatasetRepository(
+            session_factory=self.factory(self.session),
+            read_session_factory=self.factory(self.read_session),
+        )
+
+    def factory(self, session):
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        return session_factory
+
+    def listing_row(self, current_version_id, created_at):
+        return SimpleNamespace(
+            id=uuid4(),
+            name="dataset",
+            data={},
+            is_enabled=True,
+            created_at=created_at,
+            updated_at=None,
+            tenancy="tenancy1",
+            design_state=DesignState.DRAFT,
+            visibility=None,
+            current_version_id=current_version_id,
+            rank=None,
+        )
+
+    def version_row(self, dataset_id, name):
+        return SimpleNamespace(
+            id=uuid4(),
+            dataset_id=dataset_id,
+            name=name,
+            description=None,
+            created_at=None,
+            updated_at=None,
+            created_by=None,
+            is_enabled=True,
+            design_state=DesignState.DRAFT,
+            files_count=2,
+            files_size_in_bytes=300,
+            doi_identifier=None,
+        )
+
+    async def test_fetch_latest_version_joins_current_version(self):
+        dataset = MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = dataset
+        self.session.execute.return_value = result
+        dataset_id = uuid4()
+
+        fetched = await self.repository.fetch(
+            dataset_id,
+            tenancies=["tenancy1"],
+            latest_version=True,
+            version_design_state=DesignState.PUBLISHED,
+        )
+
+        self.assertIs(fetched, dataset)
+        self.read_session.execute.assert_not_called()
+        statement = self.session.execute.call_args.args[0]
+        sql = compile_statement(statement)
+        self.assertIn(
+            "JOIN dataset_versions ON dataset_versions.id = "
+            "datasets.current_version_id AND dataset_versions.design_state = ",
+            sql,
+        )
+        self.assertIn("dataset_versions.is_enabled = ", sql)
+        self.assertIn("datasets.id = ", sql)
+        self.assertIn("datasets.tenancy IN ", sql)
+        self.assertTrue(sql.endswith("LIMIT %(param_1)s"))
+
+    async def test_fetch_without_latest_version_requires_an_enabled_version(self):
+        self.session.execute.return_value = MagicMock()
+
+        await self.repository.fetch(uuid4(), tenancies=["tenancy1"])
+
+        sql = compile_statement(self.session.execute.call_args.args[0])
+        self.assertNotIn("current_version_id AND", sql)
+        self.assertIn("EXISTS (SELECT 1 FROM dataset_versions", sql)
+
+    async def test_search_minimal_projects_page_and_versions(self):
+        first = self.listing_row(None, datetime(2024, 1, 2))
+        second = self.listing_row(None, datetime(2024, 1, 1))
+        extra = self.listing_row(None, datetime(2023, 12, 31))
+        version = self.version_row(first.id, "1")
+        first.current_version_id = version.id
+        listing, versions = MagicMock(), MagicMock()
+        listing.all.return_value = [first, second, extra]
+        versions.all.return_value = [version]
+        self.read_session.execute.side_effect = [listing, versions]
+
+        result = await self.repository.search_minimal(
+            DatasetQuery(page_size=2), tenancies=["tenancy1"], include_count=False
+        )
+
+        self.session.execute.assert_not_called()
+        self.read_session.scalar.assert_not_called()
+        self.assertIsNone(result.total_count)
+        self.assertEqual([item.id for item in result.items], [first.id, second.id])
+        self.assertEqual(result.items[0].current_version.id, version.id)
+        self.assertEqual(result.items[0].current_version.files_count, 2)
+        self.assertIsNone(result.items[1].current_version)
+        self.assertIsNotNone(result.next_cursor)
+
+        listing_sql = compile_statement(
+            self.read_session.execute.call_args_list[0].args[0]
+        )
+        self.assertIn("datasets.current_version_id", listing_sql)
+        self.assertNotIn("dataset_versions", listing_sql)
+        self.assertIn(
+            "ORDER BY datasets.created_at DESC, datasets.id DESC", listing_sql
+        )
+        versions_sql = compile_statement(
+            self.read_session.execute.call_args_list[1].args[0]
+        )
+        self.assertIn("dataset_versions.files_count", versions_sql)
+        self.assertIn("dataset_versions.dataset_id IN ", versions_sql)
+
+    async def test_search_minimal_counts_when_asked(self):
+        listing = MagicMock()
+        listing.all.return_value = []
+        self.read_session.execute.return_value = listing
+        self.read_session.scalar.return_value = 0
+
+        result = await self.repository.search_minimal(
+            DatasetQuery(), tenancies=["tenancy1"]
+        )
+
+        self.assertEqual(result.total_count, 0)
+        self.assertEqual(result.items, [])
+        # No page rows, no versions query
+        self.read_session.execute.assert_called_once()
+        self.assertIn(
+            "count(*)", compile_statement(self.read_session.scalar.call_args.args[0])
+        )
+
+    async def test_estimate_count_reads_planner_rows(self):
+        self.read_session.scalar.return_value = json.dumps(
+            [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}]
+        )
+
+        estimate = await self.repository.estimate_count(
+            DatasetQuery(categories=["AEROSOLS"]), tenancies=["tenancy1"]
+        )
+
+        self.assertEqual(estimate, 1234)
+        self.session.scalar.assert_not_called()
+        sql = compile_statement(self.read_session.scalar.call_args.args[0])
+        self.assertTrue(sql.startswith("EXPLAIN (FORMAT JSON) SELECT datasets.id"))
+        self.assertIn("datasets.data @> ", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
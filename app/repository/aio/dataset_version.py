@@ -0,0 +1,29 @@
+from contextlib import AbstractAsyncContextManager
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.db.dataset import DatasetVersion
+from app.repository.load_plan import VERSION_FULL, LoadPlan
+
+
+class AsyncDatasetVersionRepository:
+    """Async counterpart of `DatasetVersionRepository`."""
+
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        self._session_factory = session_factory
+
+    async def fetch_version_by_name(
+        self, dataset_id, version_name, load_plan: LoadPlan = VERSION_FULL
+    ) -> DatasetVersion:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(DatasetVersion)
+                .options(*load_plan)
+                .filter_by(dataset_id=dataset_id, name=version_name)
+                .limit(1)
+            )
+            return result.unique().scalars().first()
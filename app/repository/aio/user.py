@@ -0,0 +1,37 @@
+from contextlib import AbstractAsyncContextManager
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import true
+
+from app.model.db.tenancy import Tenancy
+from app.model.db.user import (
+    User,
+    user_tenancy_association,
+)
+
+
+class AsyncUserRepository:
+    """Async counterpart of `app.repository.user.UserRepository`."""
+
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        self._session_factory = session_factory
+
+    async def fetch_tenancy_memberships(self, id: UUID) -> list[tuple[str, bool]]:
+        """See `UserRepository.fetch_tenancy_memberships`."""
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(Tenancy.name, Tenancy.is_enabled)
+                .select_from(User)
+                .outerjoin(
+                    user_tenancy_association,
+                    user_tenancy_association.c.user_id == User.id,
+                )
+                .outerjoin(Tenancy, Tenancy.name == user_tenancy_association.c.tenancy)
+                .where(User.id == id, User.is_enabled == true())
+            )
+            return [tuple(row) for row in result.all()]
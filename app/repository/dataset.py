@@ -1,7 +1,29 @@
+import base64
+import binascii
+from datetime import datetime
+import json
 from uuid import UUID
-from app.model.dataset import DatasetQuery, FileCollocationStatus, PaginatedResult
-from app.model.db.dataset import DatasetVersion, Dataset, DesignState
-from sqlalchemy import and_, or_, func, text
+from app.exception.bad_request import BadRequestException, ErrorDetails
+from app.model.dataset import (
+    Dataset as DatasetModel,
+    DatasetQuery,
+    DatasetSuggestion,
+    DatasetVersion as DatasetVersionModel,
+    FileCollocationStatus,
+    PaginatedResult,
+)
+from app.model.db.dataset import (
+    DatasetVersion,
+    Dataset,
+    DesignState,
+)
+from app.model.db.doi import DOI
+from app.repository.explain import Explain, root_plan
+from app.repository.load_plan import DATASET_FULL, LoadPlan
+from app.model.doi import DOI as DOIModel, Mode as DOIMode, State as DOIState
+from sqlalchemy import and_, or_, func, null, select, text, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import ColumnElement, Select
 from sqlalchemy.sql.expression import true
 from contextlib import AbstractContextManager
 from sqlalchemy.orm import Session
@@ -10,11 +32,26 @@ from app.exception.conflict import ConflictException
 from sqlalchemy.exc import IntegrityError
 
 
+# Filters of available_filters.json matched by containment, and the key of
+# Dataset.data holding their value
+DATA_FILTER_KEYS = {
+    "categories": "category",
+    "data_type": "data_type",
+    "level": "level",
+}
+
+
 class DatasetRepository:
     def __init__(
-        self, session_factory: Callable[..., AbstractContextManager[Session]]
+        self,
+        session_factory: Callable[..., AbstractContextManager[Session]],
+        read_session_factory: Optional[
+            Callable[..., AbstractContextManager[Session]]
+        ] = None,
     ) -> None:
         self._session_factory = session_factory
+        # Listings and counts only read, they may be served by a replica
+        self._read_session_factory = read_session_factory or session_factory
 
     def fetch(
         self,
@@ -24,9 +61,10 @@ class DatasetRepository:
         latest_version: bool = False,
         version_design_state: DesignState = None,
         version_is_enabled: bool = True,
+        load_plan: LoadPlan = DATASET_FULL,
     ) -> Dataset:
         with self._session_factory() as session:
-            query = session.query(Dataset)
+            query = session.query(Dataset).options(*load_plan)
             query = query.filter(Dataset.id == dataset_id)
 
             if is_enabled:
@@ -35,20 +73,10 @@ class DatasetRepository:
             query = query.filter(Dataset.tenancy.in_(tenancies))
 
             if latest_version:
-                subquery = (
-                    session.query(
-                        DatasetVersion.dataset_id,
-                        func.max(DatasetVersion.created_at).label("max_created_at"),
-                    )
-                    .group_by(DatasetVersion.dataset_id)
-                    .subquery()
-                )
-
-                query = query.join(subquery, subquery.c.dataset_id == Dataset.id).join(
+                query = query.join(
                     DatasetVersion,
                     and_(
-                        Dataset.id == DatasetVersion.dataset_id,
-                        DatasetVersion.created_at == subquery.c.max_created_at,
+                        DatasetVersion.id == Dataset.current_version_id,
                         DatasetVersion.design_state == version_design_state
                         if version_design_state
                         else True,
@@ -64,123 +92,174 @@ class DatasetRepository:
 
             return query.first()
 
-    def upsert(self, dataset: Dataset) -> Dataset:
+    def upsert(self, dataset: Dataset, refresh: bool = True) -> Dataset:
+        """
+        Persists the dataset. Without `refresh` the returned dataset is expired
+        and detached, callers that only write skip reloading its versions.
+        """
         try:
             with self._session_factory() as session:
                 session.add(dataset)
                 session.commit()
-                session.refresh(dataset)
+                if refresh:
+                    session.refresh(dataset)
                 return dataset
         except IntegrityError:
             raise ConflictException(f"dataset_already_exists: {dataset.id}")
 
     def search(
-        self, query_params: DatasetQuery, tenancies: list[str] = []
+        self,
+        query_params: DatasetQuery,
+        tenancies: list[str] = [],
+        include_count: bool = True,
     ) -> PaginatedResult:
         """
         Search datasets with full-text search and pagination.
 
         Returns a PaginatedResult containing:
         - items: list of Dataset objects for the current page
-        - total_count: total number of matching datasets
+        - total_count: total number of matching datasets, None when
+          `include_count` is False and the caller counts with `count` or
+          `estimate_count` instead
         - page: current page number
         - page_size: number of items per page
+        - next_cursor: opaque cursor of the next page, None on the last one
         """
-        with self._session_factory() as session:
-            query = session.query(Dataset)
-
-            search_conditions = []
-
-            for category in query_params.categories:
-                search_term = f"%{category.strip()}%"
-                search_conditions.append(
-                    Dataset.data["category"].astext.ilike(search_term)
-                )
-
-            for data_type in query_params.data_types:
-                search_term = f"%{data_type.strip()}%"
-                search_conditions.append(
-                    Dataset.data["data_type"].astext.ilike(search_term)
-                )
-
-            if query_params.level is not None:
-                search_conditions.append(
-                    Dataset.data["level"].astext.ilike(query_params.level)
-                )
-
-            if search_conditions:
-                query = query.filter(*search_conditions)
-
-            if query_params.date_from is not None:
-                query = query.filter(Dataset.created_at >= query_params.date_from)
-
-            if query_params.date_to is not None:
-                query = query.filter(Dataset.created_at <= query_params.date_to)
+        with self._read_session_factory() as session:
+            criteria, order_by = build_search_criteria(query_params, tenancies)
+            cursor_criteria = build_cursor_criteria(query_params)
+            query = session.query(Dataset).filter(*criteria)
 
-            if not query_params.include_disabled:
-                query = query.filter(Dataset.is_enabled == true())
-
-            if query_params.design_state is not None:
-                query = query.filter(Dataset.design_state == query_params.design_state)
-
-            if query_params.visibility is not None:
-                query = query.filter(Dataset.visibility == query_params.visibility)
-
-            if query_params.version is not None:
-                query = query.filter(
-                    Dataset.versions.any(DatasetVersion.name == query_params.version)
-                )
-
-            query = query.filter(Dataset.tenancy.in_(tenancies))
-
-            # Full-text search with relevance ranking
-            if query_params.full_text is not None and query_params.full_text.strip():
-                # Use PostgreSQL full-text search with unaccent for accent-insensitive matching
-                # plainto_tsquery safely handles user input (no special syntax needed)
-                search_term = func.plainto_tsquery(
-                    text("'simple'"), func.unaccent(query_params.full_text)
-                )
-                search_vector = func.to_tsvector(
-                    text("'simple'"), func.coalesce(Dataset.search_vector, "")
-                )
-
-                query = query.filter(search_vector.op("@@")(search_term))
+            # Get total count before pagination
+            total_count = query.count() if include_count else None
+
+            # Apply pagination, a cursor replaces the offset
+            page, page_size, offset = paginate(query_params)
+
+            rows = (
+                query.add_columns(build_rank(query_params).label("rank"))
+                .filter(*cursor_criteria)
+                .order_by(*order_by)
+                .offset(offset)
+                .limit(page_size + 1)
+                .all()
+            )
 
-                # Order by relevance when searching
-                query = query.order_by(
-                    func.ts_rank(search_vector, search_term).desc(),
-                    Dataset.created_at.desc(),
-                )
-            else:
-                # Order by date when not searching
-                query = query.order_by(Dataset.created_at.desc())
+            return PaginatedResult(
+                items=[row.Dataset for row in rows[:page_size]],
+                total_count=total_count,
+                page=page,
+                page_size=page_size,
+                cursor=query_params.cursor,
+                next_cursor=next_cursor(
+                    [
+                        (row.rank, row.Dataset.created_at, row.Dataset.id)
+                        for row in rows
+                    ],
+                    page_size,
+                ),
+            )
 
-            # Get total count before pagination
-            total_count = query.count()
+    def search_minimal(
+        self,
+        query_params: DatasetQuery,
+        tenancies: list[str] = [],
+        include_count: bool = True,
+    ) -> PaginatedResult:
+        """
+        Same search as `search`, but selects only the columns of a listing and
+        aggregates the files of each version in SQL instead of loading them.
 
-            # Apply pagination
-            page = max(1, query_params.page)
-            page_size = max(1, min(20, query_params.page_size))
-            offset = (page - 1) * page_size
+        Returns a PaginatedResult of `app.model.dataset.Dataset` objects whose
+        versions carry files_count and files_size_in_bytes but no files.
+        """
+        with self._read_session_factory() as session:
+            stmt = build_listing_query(query_params, tenancies)
+            cursor_criteria = build_cursor_criteria(query_params)
+
+            total_count = (
+                session.execute(build_count_query(query_params, tenancies)).scalar()
+                if include_count
+                else None
+            )
 
-            datasets = query.offset(offset).limit(page_size).all()
+            page, page_size, offset = paginate(query_params)
+
+            rows = session.execute(
+                stmt.where(*cursor_criteria).offset(offset).limit(page_size + 1)
+            ).all()
+            cursor_keys = [(row.rank, row.created_at, row.id) for row in rows]
+            rows = rows[:page_size]
+            version_rows = (
+                session.execute(
+                    build_version_summary_query([row.id for row in rows])
+                ).all()
+                if rows
+                else []
+            )
 
             return PaginatedResult(
-                items=datasets,
+                items=to_dataset_summaries(rows, version_rows),
                 total_count=total_count,
                 page=page,
                 page_size=page_size,
+                cursor=query_params.cursor,
+                next_cursor=next_cursor(cursor_keys, page_size),
             )
 
+    def count(self, query_params: DatasetQuery, tenancies: list[str] = []) -> int:
+        """Exact number of datasets matching a search."""
+        with self._read_session_factory() as session:
+            return session.execute(build_count_query(query_params, tenancies)).scalar()
+
+    def count_facets(
+        self, query_params: DatasetQuery, tenancies: list[str] = []
+    ) -> dict[str, dict[str, int]]:
+        """
+        Number of datasets matching a search for every option of the category,
+        data_type, level and design_state filters, in a single grouped query.
+
+        Returns the counts by filter id and then by option value.
+        """
+        with self._read_session_factory() as session:
+            rows = session.execute(build_facet_query(query_params, tenancies))
+            return to_facet_counts(rows)
+
+    def estimate_count(
+        self, query_params: DatasetQuery, tenancies: list[str] = []
+    ) -> int:
+        """
+        Number of datasets matching a search as estimated by the query planner,
+        without executing the search.
+        """
+        with self._read_session_factory() as session:
+            plan = session.execute(
+                Explain(build_matching_query(query_params, tenancies))
+            ).scalar()
+            return int(root_plan(plan)["Plan Rows"])
+
+    def suggest(
+        self, term: str, tenancies: list[str] = [], limit: int = 10
+    ) -> list[DatasetSuggestion]:
+        """
+        Enabled datasets whose name contains or resembles `term`, names
+        starting with it first. Served by the trigram index on the name.
+        """
+        with self._read_session_factory() as session:
+            rows = session.execute(build_suggestion_query(term, tenancies, limit))
+            return [DatasetSuggestion(id=row.id, name=row.name) for row in rows]
+
     def fetch_by_collocation_status(
-        self, statuses: List[Optional[FileCollocationStatus]]
+        self,
+        statuses: List[Optional[FileCollocationStatus]],
+        load_plan: LoadPlan = DATASET_FULL,
     ) -> List[Dataset]:
         """
         Fetch datasets by file collocation status.
         Supports None (NULL in DB) to fetch legacy datasets.
         """
         with self._session_factory() as session:
-            query = session.query(Dataset)
+            query = session.query(Dataset).options(*load_plan)
 
             # Build OR condition for multiple statuses
             conditions = []
@@ -196,3 +275,361 @@ class DatasetRepository:
             query = query.filter(Dataset.is_enabled == true())
             query = query.order_by(Dataset.created_at.asc())
             return query.all()
+
+
+def build_search_criteria(
+    query_params: DatasetQuery, tenancies: list[str]
+) -> tuple[list, list]:
+    """
+    Builds the WHERE criteria and ORDER BY clauses of a dataset search.
+
+    Shared by the sync and async repositories so both return the same results.
+    """
+    criteria = []
+
+    for category in query_params.categories:
+        criteria.append(_data_filter("category", category))
+
+    for data_type in query_params.data_types:
+        criteria.append(_data_filter("data_type", data_type))
+
+    if query_params.level is not None:
+        criteria.append(_data_filter("level", query_params.level))
+
+    if query_params.date_from is not None:
+        criteria.append(Dataset.created_at >= query_params.date_from)
+
+    if query_params.date_to is not None:
+        criteria.append(Dataset.created_at <= query_params.date_to)
+
+    if not query_params.include_disabled:
+        criteria.append(Dataset.is_enabled == true())
+
+    if query_params.design_state is not None:
+        criteria.append(Dataset.design_state == query_params.design_state)
+
+    if query_params.visibility is not None:
+        criteria.append(Dataset.visibility == query_params.visibility)
+
+    if query_params.version is not None:
+        criteria.append(
+            Dataset.versions.any(DatasetVersion.name == query_params.version)
+        )
+
+    criteria.append(Dataset.tenancy.in_(tenancies))
+
+    # Full-text search with relevance ranking
+    if _has_full_text(query_params):
+        # Use PostgreSQL full-text search with unaccent for accent-insensitive matching
+        # plainto_tsquery safely handles user input (no special syntax needed)
+        criteria.append(_search_vector().op("@@")(_search_term(query_params)))
+
+        # Order by relevance when searching
+        order_by = [
+            build_rank(query_params).desc(),
+            Dataset.created_at.desc(),
+            Dataset.id.desc(),
+        ]
+    else:
+        # Order by date when not searching
+        order_by = [Dataset.created_at.desc(), Dataset.id.desc()]
+
+    return criteria, order_by
+
+
+def _data_filter(key: str, value: str) -> ColumnElement:
+    """
+    Matches datasets whose data[key] is the given filter option, with a JSONB
+    containment the GIN index on data can answer. Stored values and query
+    values are both normalized to the option values by `AvailableFilters`.
+    """
+    return Dataset.data.contains({key: value})
+
+
+def _has_full_text(query_params: DatasetQuery) -> bool:
+    return query_params.full_text is not None and bool(query_params.full_text.strip())
+
+
+def _search_term(query_params: DatasetQuery) -> ColumnElement:
+    return func.plainto_tsquery(text("'simple'"), func.unaccent(query_params.full_text))
+
+
+def _search_vector() -> ColumnElement:
+    # Stored weighted tsvector, ts_rank favours name over category, institution
+    # and description matches
+    return Dataset.search_vector
+
+
+def build_rank(query_params: DatasetQuery) -> ColumnElement:
+    """
+    Relevance of a dataset for the full-text search, NULL when not searching.
+    """
+    if not _has_full_text(query_params):
+        return null()
+    return func.ts_rank(_search_vector(), _search_term(query_params))
+
+
+def paginate(query_params: DatasetQuery) -> tuple[int, int, int]:
+    """
+    Returns the page, page size and offset of a search. The offset is always
+    zero in cursor mode, the cursor itself positions the page.
+    """
+    page = max(1, query_params.page)
+    page_size = max(1, min(20, query_params.page_size))
+    if query_params.cursor is not None:
+        return page, page_size, 0
+    return page, page_size, (page - 1) * page_size
+
+
+def build_cursor_criteria(query_params: DatasetQuery) -> list:
+    """
+    Builds the keyset criteria selecting the rows after the query cursor in
+    the (rank, created_at, id) order of `build_search_criteria`.
+    """
+    if query_params.cursor is None:
+        return []
+
+    rank, created_at, id = decode_cursor(query_params.cursor)
+    if (rank is None) == _has_full_text(query_params):
+        raise BadRequestException(errors=[ErrorDetails(code="invalid", field="cursor")])
+
+    after = tuple_(Dataset.created_at, Dataset.id) < tuple_(created_at, id)
+    if rank is None:
+        return [after]
+
+    rank_expr = build_rank(query_params)
+    return [or_(rank_expr < rank, and_(rank_expr == rank, after))]
+
+
+def encode_cursor(rank: Optional[float], created_at: datetime, id: UUID) -> str:
+    payload = json.dumps([rank, created_at.isoformat(), str(id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[float], datetime, UUID]:
+    try:
+        rank, created_at, id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if rank is not None:
+            rank = float(rank)
+        return rank, datetime.fromisoformat(created_at), UUID(id)
+    except (binascii.Error, TypeError, ValueError):
+        raise BadRequestException(errors=[ErrorDetails(code="invalid", field="cursor")])
+
+
+def next_cursor(
+    keys: list[tuple[Optional[float], datetime, UUID]], page_size: int
+) -> Optional[str]:
+    """
+    Cursor of the page following a page fetched with `page_size + 1` rows,
+    None when the extra row is missing and there is no next page.
+    """
+    if len(keys) <= page_size:
+        return None
+    return encode_cursor(*keys[page_size - 1])
+
+
+def build_listing_query(query_params: DatasetQuery, tenancies: list[str]) -> Select:
+    """
+    Builds the page statement of a projection listing, selecting only the
+    dataset columns returned by a minimal search.
+    """
+    criteria, order_by = build_search_criteria(query_params, tenancies)
+
+    return (
+        select(
+            Dataset.id,
+            Dataset.name,
+            Dataset.data,
+            Dataset.is_enabled,
+            Dataset.created_at,
+            Dataset.updated_at,
+            Dataset.tenancy,
+            Dataset.design_state,
+            Dataset.visibility,
+            Dataset.current_version_id,
+            build_rank(query_params).label("rank"),
+        )
+        .where(*criteria)
+        .order_by(*order_by)
+    )
+
+
+def build_matching_query(query_params: DatasetQuery, tenancies: list[str]) -> Select:
+    """Builds the statement selecting the ids of every dataset of a search."""
+    criteria, _ = build_search_criteria(query_params, tenancies)
+    return select(Dataset.id).where(*criteria)
+
+
+def build_count_query(query_params: DatasetQuery, tenancies: list[str]) -> Select:
+    """Builds the statement counting the datasets of a search."""
+    return select(func.count()).select_from(
+        build_matching_query(query_params, tenancies).subquery()
+    )
+
+
+def _facet_columns() -> dict[str, ColumnElement]:
+    # Filter ids of available_filters.json and the column holding their value
+    columns = {
+        filter_id: Dataset.data[key].astext
+        for filter_id, key in DATA_FILTER_KEYS.items()
+    }
+    columns["design_state"] = Dataset.design_state
+    return columns
+
+
+def build_facet_query(query_params: DatasetQuery, tenancies: list[str]) -> Select:
+    """
+    Builds the statement counting the datasets of a search by the value of
+    each faceted filter, one GROUPING SETS pass over the matching rows.
+    """
+    criteria, _ = build_search_criteria(query_params, tenancies)
+    matching = (
+        select(
+            *[column.label(filter_id) for filter_id, column in _facet_columns().items()]
+        )
+        .where(*criteria)
+        .subquery()
+    )
+
+    facets = [matching.c[filter_id] for filter_id in _facet_columns()]
+    return select(
+        *facets,
+        *[func.grouping(facet).label(f"grouping_{facet.name}") for facet in facets],
+        func.count().label("count"),
+    ).group_by(func.grouping_sets(*facets))
+
+
+def to_facet_counts(rows) -> dict[str, dict[str, int]]:
+    """
+    Maps the rows of `build_facet_query` into counts by filter id and stored
+    value, the value the search filters match.
+    """
+    counts: dict[str, dict[str, int]] = {
+        filter_id: {} for filter_id in _facet_columns()
+    }
+    for row in rows:
+        mapping = row._mapping
+        # GROUPING() is 0 for the column the row is grouped by
+        filter_id = next(
+            filter_id for filter_id in counts if mapping[f"grouping_{filter_id}"] == 0
+        )
+
+        value = mapping[filter_id]
+        if value is None:
+            continue
+        if filter_id == "design_state":
+            value = value.name
+
+        facet = counts[filter_id]
+        facet[value] = facet.get(value, 0) + mapping["count"]
+    return counts
+
+
+def build_suggestion_query(term: str, tenancies: list[str], limit: int) -> Select:
+    """
+    Builds the typeahead statement over dataset names. ILIKE and the pg_trgm
+    similarity operator are both answered by the GIN trigram index.
+    """
+    escaped = term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return (
+        select(Dataset.id, Dataset.name)
+        .where(
+            Dataset.tenancy.in_(tenancies),
+            Dataset.is_enabled == true(),
+            or_(
+                Dataset.name.ilike(f"%{escaped}%", escape="/"),
+                Dataset.name.op("%")(term),
+            ),
+        )
+        .order_by(
+            Dataset.name.ilike(f"{escaped}%", escape="/").desc(),
+            func.similarity(Dataset.name, term).desc(),
+            Dataset.name,
+        )
+        .limit(limit)
+    )
+
+
+def build_version_summary_query(dataset_ids: list[UUID]) -> Select:
+    """
+    Builds the statement loading the versions of the given datasets, with their
+    DOI and the count and total size of their files stored on each version.
+    """
+    return (
+        select(
+            DatasetVersion.id,
+            DatasetVersion.dataset_id,
+            DatasetVersion.name,
+            DatasetVersion.description,
+            DatasetVersion.created_at,
+            DatasetVersion.updated_at,
+            DatasetVersion.created_by,
+            DatasetVersion.is_enabled,
+            DatasetVersion.design_state,
+            DOI.identifier.label("doi_identifier"),
+            DOI.state.label("doi_state"),
+            DOI.mode.label("doi_mode"),
+            DatasetVersion.files_count,
+            DatasetVersion.files_size_in_bytes,
+        )
+        .outerjoin(DOI, DOI.version_id == DatasetVersion.id)
+        .where(DatasetVersion.dataset_id.in_(dataset_ids))
+        .order_by(DatasetVersion.created_at)
+    )
+
+
+def to_dataset_summaries(
+    dataset_rows: list[Row], version_rows: list[Row]
+) -> list[DatasetModel]:
+    """
+    Maps the rows of `build_listing_query` and `build_version_summary_query`
+    into datasets, keeping the order of the dataset rows. The current version is
+    the one the dataset row points to.
+    """
+    versions: dict[UUID, list[DatasetVersionModel]] = {}
+    for row in version_rows:
+        versions.setdefault(row.dataset_id, []).append(
+            DatasetVersionModel(
+                id=row.id,
+                name=row.name,
+                description=row.description,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+                created_by=row.created_by,
+                is_enabled=row.is_enabled,
+                design_state=row.design_state,
+                files_count=row.files_count,
+                files_size_in_bytes=row.files_size_in_bytes,
+                doi=DOIModel(
+                    identifier=row.doi_identifier,
+                    mode=DOIMode[row.doi_mode],
+                    state=DOIState[row.doi_state],
+                )
+                if row.doi_identifier is not None
+                else None,
+            )
+        )
+
+    return [
+        DatasetModel(
+            id=row.id,
+            name=row.name,
+            data=row.data,
+            is_enabled=row.is_enabled,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            tenancy=row.tenancy,
+            design_state=row.design_state,
+            visibility=row.visibility,
+            versions=versions.get(row.id, []),
+            current_version=next(
+                (
+                    version
+                    for version in versions.get(row.id, [])
+                    if version.id == row.current_version_id
+                ),
+                None,
+            ),
+        )
+        for row in dataset_rows
+    ]
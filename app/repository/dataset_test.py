@@ -0,0 +1,218 @@
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy import and_
+from sqlalchemy.dialects import postgresql
+
+from app.exception.bad_request import BadRequestException, ErrorDetails
+from app.model.dataset import DatasetQuery, DesignState
+from app.repository.dataset import (
+    DatasetRepository,
+    build_cursor_criteria,
+    build_search_criteria,
+    build_suggestion_query,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+    paginate,
+    to_dataset_summaries,
+    to_facet_counts,
+)
+
+
+class TestDatasetSearchCursor(unittest.TestCase):
+    def test_encode_decode_round_trip(self):
+        created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+        id = uuid4()
+
+        self.assertEqual(
+            decode_cursor(encode_cursor(0.0607927, created_at, id)),
+            (0.0607927, created_at, id),
+        )
+        self.assertEqual(
+            decode_cursor(encode_cursor(None, created_at, id)), (None, created_at, id)
+        )
+
+    def test_decode_invalid_cursor(self):
+        for cursor in ["not-base64!", encode_cursor(None, datetime.now(), uuid4())[5:]]:
+            with self.assertRaises(BadRequestException) as cm:
+                decode_cursor(cursor)
+            self.assertEqual(
+                cm.exception.errors, [ErrorDetails(code="invalid", field="cursor")]
+            )
+
+    def test_cursor_must_match_search_mode(self):
+        ranked = encode_cursor(0.5, datetime.now(), uuid4())
+        unranked = encode_cursor(None, datetime.now(), uuid4())
+
+        with self.assertRaises(BadRequestException):
+            build_cursor_criteria(DatasetQuery(cursor=ranked))
+        with self.assertRaises(BadRequestException):
+            build_cursor_criteria(DatasetQuery(full_text="ocean", cursor=unranked))
+
+        self.assertEqual(len(build_cursor_criteria(DatasetQuery(cursor=unranked))), 1)
+        self.assertEqual(build_cursor_criteria(DatasetQuery()), [])
+
+    def test_paginate_ignores_offset_with_cursor(self):
+        self.assertEqual(paginate(DatasetQuery(page=3, page_size=10)), (3, 10, 20))
+        self.assertEqual(
+            paginate(DatasetQuery(page=3, page_size=50, cursor="c")), (3, 20, 0)
+        )
+
+    def test_next_cursor_points_to_last_row_of_page(self):
+        keys = [(None, datetime.now(), uuid4()) for _ in range(3)]
+
+        self.assertIsNone(next_cursor(keys, page_size=3))
+        self.assertEqual(decode_cursor(next_cursor(keys, page_size=2)), keys[1])
+
+
+class TestDatasetSearchCriteria(unittest.TestCase):
+    def _compile(self, query: DatasetQuery) -> tuple[str, dict]:
+        criteria, _ = build_search_criteria(query, tenancies=["tenancy1"])
+        compiled = and_(*criteria).compile(dialect=postgresql.dialect())
+        return str(compiled), compiled.params
+
+    def test_structured_filters_use_containment(self):
+        sql, params = self._compile(
+            DatasetQuery(categories=["AEROSOLS"], data_types=["ROUTINE"], level="L1")
+        )
+
+        self.assertEqual(sql.count("datasets.data @>"), 3)
+        self.assertNotIn("ILIKE", sql)
+        self.assertIn({"category": "AEROSOLS"}, params.values())
+        self.assertIn({"data_type": "ROUTINE"}, params.values())
+        self.assertIn({"level": "L1"}, params.values())
+
+    def test_structured_filters_match_stored_value_exactly(self):
+        sql, params = self._compile(DatasetQuery(categories=["ocean"]))
+
+        self.assertNotIn("ILIKE", sql)
+        self.assertIn({"category": "ocean"}, params.values())
+
+
+class TestDatasetSuggestionQuery(unittest.TestCase):
+    def test_escapes_like_wildcards(self):
+        compiled = build_suggestion_query("50%_a/b", ["tenancy1"], 5).compile(
+            dialect=postgresql.dialect()
+        )
+
+        self.assertIn("%50/%/_a//b%", compiled.params.values())
+        self.assertIn("50/%/_a//b%", compiled.params.values())
+        self.assertIn("ESCAPE '/'", str(compiled))
+        self.assertIn(["tenancy1"], compiled.params.values())
+
+
+class FacetRow:
+    def __init__(self, grouped_by: str, value, count: int) -> None:
+        facets = ["categories", "data_type", "level", "design_state"]
+        self._mapping = {
+            **{facet: None for facet in facets},
+            **{f"grouping_{facet}": 1 for facet in facets},
+            grouped_by: value,
+            f"grouping_{grouped_by}": 0,
+            "count": count,
+        }
+
+
+class TestDatasetFacetCounts(unittest.TestCase):
+    def test_to_facet_counts(self):
+        rows = [
+            FacetRow("categories", "AEROSOLS", 2),
+            FacetRow("categories", "ocean", 1),
+            FacetRow("categories", None, 4),
+            FacetRow("level", "L1", 3),
+            FacetRow("design_state", DesignState.PUBLISHED, 5),
+        ]
+
+        # Stored values are counted as is, like the search filters match them
+        self.assertEqual(
+            to_facet_counts(rows),
+            {
+                "categories": {"AEROSOLS": 2, "ocean": 1},
+                "data_type": {},
+                "level": {"L1": 3},
+                "design_state": {"PUBLISHED": 5},
+            },
+        )
+
+
+class TestDatasetSummaries(unittest.TestCase):
+    def version_row(self, dataset_id, name):
+        return SimpleNamespace(
+            id=uuid4(),
+            dataset_id=dataset_id,
+            name=name,
+            description=None,
+            created_at=datetime(2024, 1, int(name)),
+            updated_at=None,
+            created_by=None,
+            is_enabled=True,
+            design_state=DesignState.DRAFT,
+            files_count=0,
+            files_size_in_bytes=0,
+            doi_identifier=None,
+        )
+
+    def dataset_row(self, current_version_id):
+        return SimpleNamespace(
+            id=uuid4(),
+            name="dataset",
+            data={},
+            is_enabled=True,
+            created_at=None,
+            updated_at=None,
+            tenancy="tenancy1",
+            design_state=DesignState.DRAFT,
+            visibility=None,
+            current_version_id=current_version_id,
+        )
+
+    def test_current_version_is_the_pointed_version(self):
+        dataset = self.dataset_row(current_version_id=None)
+        first = self.version_row(dataset.id, "1")
+        second = self.version_row(dataset.id, "2")
+        dataset.current_version_id = first.id
+        empty = self.dataset_row(current_version_id=None)
+
+        summaries = to_dataset_summaries([dataset, empty], [first, second])
+
+        self.assertEqual([v.name for v in summaries[0].versions], ["1", "2"])
+        self.assertEqual(summaries[0].current_version.id, first.id)
+        self.assertEqual(summaries[1].versions, [])
+        self.assertIsNone(summaries[1].current_version)
+
+
+class TestDatasetRepositorySessions(unittest.TestCase):
+    def setUp(self):
+        self.session_factory = MagicMock()
+        self.read_session_factory = MagicMock()
+        self.repository = DatasetRepository(
+            session_factory=self.session_factory,
+            read_session_factory=self.read_session_factory,
+        )
+
+    def test_counts_use_read_session(self):
+        self.repository.count(DatasetQuery(), tenancies=["tenancy1"])
+
+        self.read_session_factory.assert_called_once()
+        self.session_factory.assert_not_called()
+
+    def test_fetch_uses_primary_session(self):
+        self.repository.fetch(uuid4(), tenancies=["tenancy1"])
+
+        self.session_factory.assert_called_once()
+        self.read_session_factory.assert_not_called()
+
+    def test_reads_default_to_primary_session(self):
+        repository = DatasetRepository(session_factory=self.session_factory)
+
+        repository.count(DatasetQuery(), tenancies=["tenancy1"])
+
+        self.session_factory.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from contextlib import AbstractContextManager
 from sqlalchemy.orm import Session
 from typing import Callable
 from app.exception.conflict import ConflictException
+from app.repository.load_plan import VERSION_FULL, LoadPlan
 from sqlalchemy.exc import IntegrityError
 
 
@@ -15,39 +16,55 @@ class DatasetVersionRepository:
     ) -> None:
         self._session_factory = session_factory
 
-    def fetch_draft_version(self, dataset_id) -> DatasetVersion:
+    def fetch_draft_version(
+        self, dataset_id, load_plan: LoadPlan = VERSION_FULL
+    ) -> DatasetVersion:
         with self._session_factory() as session:
             return (
                 session.query(DatasetVersion)
+                .options(*load_plan)
                 .filter_by(dataset_id=dataset_id, design_state=DesignState.DRAFT)
                 .order_by(desc(DatasetVersion.created_at))
                 .first()
             )
 
-    def upsert(self, dataset_version: DatasetVersion) -> DatasetVersion:
+    def upsert(
+        self, dataset_version: DatasetVersion, refresh: bool = True
+    ) -> DatasetVersion:
+        """
+        Persists the version. Without `refresh` the returned version is expired
+        and detached, callers that only write skip reloading its files.
+        """
         try:
             with self._session_factory() as session:
                 session.add(dataset_version)
                 session.commit()
-                session.refresh(dataset_version)
+                if refresh:
+                    session.refresh(dataset_version)
                 return dataset_version
         except IntegrityError as e:
             raise ConflictException(
                 f"dataset_version_already_exists: {dataset_version.id}"
             ) from e
 
-    def fetch_version_by_name(self, dataset_id, version_name) -> DatasetVersion:
+    def fetch_version_by_name(
+        self, dataset_id, version_name, load_plan: LoadPlan = VERSION_FULL
+    ) -> DatasetVersion:
         with self._session_factory() as session:
             return (
                 session.query(DatasetVersion)
+                .options(*load_plan)
                 .filter_by(dataset_id=dataset_id, name=version_name)
                 .first()
             )
 
-    def fetch_by_id(self, id: UUID) -> DatasetVersion:
+    def fetch_by_id(
+        self, id: UUID, load_plan: LoadPlan = VERSION_FULL
+    ) -> DatasetVersion:
         with self._session_factory() as session:
             return (
                 session.query(DatasetVersion)
+                .options(*load_plan)
                 .filter(DatasetVersion.id == id)
                 .one_or_none()
             )
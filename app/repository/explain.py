@@ -0,0 +1,31 @@
+import json
+from typing import Any
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON)` of a statement. The statement keeps its bound
+    parameters, so it is planned exactly as it would be executed.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement, analyze: bool = False) -> None:
+        self.statement = statement
+        self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    options = "ANALYZE, FORMAT JSON" if element.analyze else "FORMAT JSON"
+    return f"EXPLAIN ({options}) " + compiler.process(element.statement, **kw)
+
+
+def root_plan(result: Any) -> dict:
+    """Top node of an `Explain` result, drivers return it as text or decoded."""
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
@@ -0,0 +1,55 @@
+"""
+Load plans: loader options choosing which relationships of `Dataset` and
+`DatasetVersion` a repository call loads.
+
+The mappings eagerly load the whole version, file and DOI tree, which is what
+the full dataset adapters read. Call sites that only need a few columns pass a
+narrower plan, so a dataset with thousands of files is not loaded to flip a
+flag. Relationships left out by a plan are `noload`: they read as empty or
+None, and appending to them still persists the new rows.
+"""
+
+from sqlalchemy.orm import Load, noload, selectinload
+
+from app.model.db.dataset import Dataset, DatasetVersion
+
+LoadPlan = tuple[Load, ...]
+
+# Whatever the mappings load eagerly
+DATASET_FULL: LoadPlan = ()
+
+# Dataset columns only
+DATASET_ONLY: LoadPlan = (noload(Dataset.versions),)
+
+# Versions and their DOI, without files
+DATASET_WITH_VERSIONS: LoadPlan = (
+    selectinload(Dataset.versions).options(
+        noload(DatasetVersion.files),
+        noload(DatasetVersion.files_in),
+        selectinload(DatasetVersion.doi),
+    ),
+)
+
+# Whatever the mappings load eagerly
+VERSION_FULL: LoadPlan = ()
+
+# Version columns only
+VERSION_ONLY: LoadPlan = (
+    noload(DatasetVersion.files),
+    noload(DatasetVersion.files_in),
+    noload(DatasetVersion.doi),
+)
+
+# Version and its DOI, without files
+VERSION_WITH_DOI: LoadPlan = (
+    noload(DatasetVersion.files),
+    noload(DatasetVersion.files_in),
+    selectinload(DatasetVersion.doi),
+)
+
+# Version and the files attached to it
+VERSION_WITH_FILES: LoadPlan = (
+    noload(DatasetVersion.files),
+    selectinload(DatasetVersion.files_in),
+    noload(DatasetVersion.doi),
+)
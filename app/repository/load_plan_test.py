@@ -0,0 +1,34 @@
+import unittest
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.model.db.dataset import DatasetVersion
+from app.model.db.doi import DOI  # noqa: F401, configures DatasetVersion.doi
+from app.repository.load_plan import (
+    VERSION_FULL,
+    VERSION_ONLY,
+    VERSION_WITH_FILES,
+)
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestLoadPlan(unittest.TestCase):
+    def test_version_only_does_not_join_files(self):
+        full = _compile(select(DatasetVersion).options(*VERSION_FULL))
+        only = _compile(select(DatasetVersion).options(*VERSION_ONLY))
+
+        self.assertIn("JOIN data_files", full)
+        self.assertNotIn("data_files", only)
+
+    def test_version_with_files_loads_them_separately(self):
+        sql = _compile(select(DatasetVersion).options(*VERSION_WITH_FILES))
+
+        self.assertNotIn("data_files", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,13 @@
 from typing import List
 from uuid import UUID
 from app.model.user import UserQuery
-from app.model.db.user import Provider, User, user_provider_association
+from app.model.db.tenancy import Tenancy
+from app.model.db.user import (
+    Provider,
+    User,
+    user_provider_association,
+    user_tenancy_association,
+)
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import true
 from typing import Callable
@@ -51,6 +57,27 @@ class UserRepository:
 
         return user
 
+    def fetch_tenancy_memberships(self, id: UUID) -> list[tuple[str, bool]]:
+        """
+        Fetch the tenancies of an enabled user with their enabled status, in a
+        single query that does not load the user relationships.
+
+        Returns an empty list when the user does not exist or is disabled, and a
+        single `(None, None)` row when the user has no tenancies.
+        """
+        with self._session_factory() as session:
+            return (
+                session.query(Tenancy.name, Tenancy.is_enabled)
+                .select_from(User)
+                .outerjoin(
+                    user_tenancy_association,
+                    user_tenancy_association.c.user_id == User.id,
+                )
+                .outerjoin(Tenancy, Tenancy.name == user_tenancy_association.c.tenancy)
+                .filter(User.id == id, User.is_enabled == true())
+                .all()
+            )
+
     def upsert(self, user: User) -> User:
         try:
             with self._session_factory() as session:
@@ -1,28 +1,48 @@
 import logging
 from uuid import UUID
 import jwt
+from app.cache import TTLCache
 from app.exception.unauthorized import UnauthorizedException
+from app.service.authorization_engine import AuthorizationEngine
 from app.service.client import ClientService
-from app.service.secret import check_password
-from casbin import SyncedEnforcer
+from app.service.secret import check_password, digests_match, keyed_digest
 
 
 class AuthService:
     def __init__(
         self,
         client_service: ClientService,
-        casbin_enforcer: SyncedEnforcer,
+        authorization_engine: AuthorizationEngine,
         file_upload_token_secret: str,
+        credential_cache: TTLCache,
     ) -> None:
         self._client_service = client_service
-        self._casbin_enforcer = casbin_enforcer
+        self._authorization_engine = authorization_engine
         self._file_upload_token_secret = file_upload_token_secret
+        self._credential_cache = credential_cache
 
     def authorize_client(self, api_key: str, salted_api_secret: str) -> None:
         if api_key is None or salted_api_secret is None:
             raise UnauthorizedException("missing_information")
 
-        client = self._client_service.fetch(api_key)
+        try:
+            # Keyed like the change notifications, by the canonical client key
+            key = str(UUID(str(api_key)))
+        except ValueError:
+            logging.info(f"api_key {api_key} is not a valid key")
+            raise UnauthorizedException("wrong_credentials")
+
+        # bcrypt is deliberately slow, so a credential verified recently is
+        # accepted by comparing keyed digests. Entries are dropped in every
+        # process whenever the client changes (see CLIENTS_CHANGED_CHANNEL).
+        secret_digest = keyed_digest(salted_api_secret)
+        verified_digest = self._credential_cache.get(key)
+        if verified_digest is not None and digests_match(
+            verified_digest, secret_digest
+        ):
+            return
+
+        client = self._client_service.fetch(key)
 
         if client is None:
             logging.info(f"api_key {api_key} not found")
@@ -34,6 +54,8 @@ class AuthService:
             logging.warn(f"incorrect api_secret {salted_api_secret}")
             raise UnauthorizedException("wrong_credentials")
 
+        self._credential_cache.set(key, secret_digest)
+
     def validate_jwt_and_decode(self, user_token: str) -> dict:
         """Validate JWT signature and return the token payload"""
         if user_token is None:
@@ -60,7 +82,7 @@ class AuthService:
         if user_id is None or resource is None or action is None:
             raise UnauthorizedException("missing_information")
 
-        if not self._casbin_enforcer.enforce(str(user_id), resource, action):
+        if not self._authorization_engine.enforce(str(user_id), resource, action):
             logging.info(
                 "User %s is not authorized to %s %s", user_id, action, resource
             )
@@ -0,0 +1,74 @@
+import logging
+from typing import Optional
+from uuid import UUID
+
+from app.cache import TTLCache
+from app.exception.not_found import NotFoundException
+from app.model.auth_context import AuthContext
+from app.repository.aio.user import AsyncUserRepository
+from app.repository.user import UserRepository
+
+
+class AuthContextService:
+    """
+    Resolves the tenancies a user may act on with a single query.
+
+    Resolved contexts are memoized on the instance, which the container creates
+    per request, and kept briefly in a process-wide cache across requests.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        cache: TTLCache,
+        async_user_repository: Optional[AsyncUserRepository] = None,
+    ) -> None:
+        self._logger = logging.getLogger("service:AuthContextService")
+        self._user_repository = user_repository
+        self._async_user_repository = async_user_repository
+        self._cache = cache
+        self._resolved: dict[str, AuthContext] = {}
+
+    def resolve(self, user_id: UUID) -> AuthContext:
+        context = self._cached(user_id)
+        if context is None:
+            context = self._remember(
+                user_id,
+                self._user_repository.fetch_tenancy_memberships(id=user_id),
+            )
+        return context
+
+    async def resolve_async(self, user_id: UUID) -> AuthContext:
+        """`resolve` for the async data path, see `DATABASE_ASYNC_ENABLED`."""
+        context = self._cached(user_id)
+        if context is None:
+            context = self._remember(
+                user_id,
+                await self._async_user_repository.fetch_tenancy_memberships(id=user_id),
+            )
+        return context
+
+    def _cached(self, user_id: UUID) -> Optional[AuthContext]:
+        key = str(user_id)
+        context = self._resolved.get(key)
+        if context is None:
+            context = self._cache.get(key)
+            if context is not None:
+                self._resolved[key] = context
+        return context
+
+    def _remember(
+        self, user_id: UUID, memberships: list[tuple[str, bool]]
+    ) -> AuthContext:
+        if not memberships:
+            raise NotFoundException(f"not_found: {user_id}")
+
+        context = AuthContext(
+            user_id=user_id,
+            tenancies={
+                name: is_enabled for name, is_enabled in memberships if name is not None
+            },
+        )
+        self._cache.set(str(user_id), context)
+        self._resolved[str(user_id)] = context
+        return context
@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from app.cache import TTLCache
+from app.exception.not_found import NotFoundException
+from app.repository.aio.user import AsyncUserRepository
+from app.repository.user import UserRepository
+from app.service.auth_context import AuthContextService
+
+
+class TestAuthContextService(unittest.TestCase):
+    def setUp(self):
+        self.user_repository = Mock(spec=UserRepository)
+        self.cache = TTLCache(max_size=10, ttl_seconds=60)
+        self.service = AuthContextService(self.user_repository, self.cache)
+
+    def test_resolve_builds_context_from_memberships(self):
+        user_id = uuid4()
+        self.user_repository.fetch_tenancy_memberships.return_value = [
+            ("a", True),
+            ("b", False),
+        ]
+
+        context = self.service.resolve(user_id)
+
+        self.assertEqual(context.user_id, user_id)
+        self.assertEqual(context.tenancies, {"a": True, "b": False})
+        self.assertEqual(context.enabled_tenancies(), ["a"])
+        self.user_repository.fetch_tenancy_memberships.assert_called_once_with(
+            id=user_id
+        )
+
+    def test_resolve_user_without_tenancies(self):
+        self.user_repository.fetch_tenancy_memberships.return_value = [(None, None)]
+
+        context = self.service.resolve(uuid4())
+
+        self.assertEqual(context.tenancies, {})
+
+    def test_resolve_raises_when_user_not_found(self):
+        self.user_repository.fetch_tenancy_memberships.return_value = []
+
+        with self.assertRaises(NotFoundException):
+            self.service.resolve(uuid4())
+
+    def test_resolve_is_memoized_for_the_request(self):
+        user_id = uuid4()
+        self.user_repository.fetch_tenancy_memberships.return_value = [("a", True)]
+
+        first = self.service.resolve(user_id)
+        self.cache.clear()
+        second = self.service.resolve(user_id)
+
+        self.assertIs(first, second)
+        self.user_repository.fetch_tenancy_memberships.assert_called_once()
+
+    def test_resolve_is_cached_across_requests(self):
+        user_id = uuid4()
+        self.user_repository.fetch_tenancy_memberships.return_value = [("a", True)]
+
+        self.service.resolve(user_id)
+        AuthContextService(self.user_repository, self.cache).resolve(user_id)
+
+        self.user_repository.fetch_tenancy_memberships.assert_called_once()
+
+
+class TestAuthContextServiceAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.user_repository = Mock(spec=UserRepository)
+        self.async_user_repository = AsyncMock(spec=AsyncUserRepository)
+        self.cache = TTLCache(max_size=10, ttl_seconds=60)
+        self.service = AuthContextService(
+            self.user_repository, self.cache, self.async_user_repository
+        )
+
+    async def test_resolve_async_builds_context_from_memberships(self):
+        user_id = uuid4()
+        self.async_user_repository.fetch_tenancy_memberships.return_value = [
+            ("a", True),
+            ("b", False),
+        ]
+
+        context = await self.service.resolve_async(user_id)
+
+        self.assertEqual(context.tenancies, {"a": True, "b": False})
+        self.user_repository.fetch_tenancy_memberships.assert_not_called()
+
+    async def test_resolve_async_shares_the_cache(self):
+        user_id = uuid4()
+        self.user_repository.fetch_tenancy_memberships.return_value = [("a", True)]
+        AuthContextService(self.user_repository, self.cache).resolve(user_id)
+
+        context = await self.service.resolve_async(user_id)
+
+        self.assertEqual(context.enabled_tenancies(), ["a"])
+        self.async_user_repository.fetch_tenancy_memberships.assert_not_called()
+
+    async def test_resolve_async_raises_when_user_not_found(self):
+        self.async_user_repository.fetch_tenancy_memberships.return_value = []
+
+        with self.assertRaises(NotFoundException):
+            await self.service.resolve_async(uuid4())
+
+
+if __name__ == "__main__":
+    unittest.main()
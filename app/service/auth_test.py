@@ -1,8 +1,9 @@
 import unittest
 from unittest.mock import Mock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import jwt
+from app.cache import TTLCache
 from app.exception.unauthorized import UnauthorizedException
 from app.service.auth import AuthService
 
@@ -10,17 +11,21 @@ from app.service.auth import AuthService
 class TestAuthService(unittest.TestCase):
     def setUp(self):
         self.client_service = Mock()
-        self.casbin_enforcer = Mock()
+        self.authorization_engine = Mock()
         self.file_upload_token_secret = "fake_secret_for_jwt_token"
+        self.credential_cache = TTLCache(max_size=10, ttl_seconds=60)
         self.auth_service = AuthService(
-            self.client_service, self.casbin_enforcer, self.file_upload_token_secret
+            self.client_service,
+            self.authorization_engine,
+            self.file_upload_token_secret,
+            self.credential_cache,
         )
 
     def test_authorize_client_success(self):
-        api_key = "test_api_key"
+        api_key = str(uuid4())
         salted_api_secret = "test_salted_secret"
         client_secret = "hashed_secret"
-        client_mock = Mock(secret=client_secret)
+        client_mock = Mock(secret=client_secret, key=UUID(api_key))
         self.client_service.fetch.return_value = client_mock
 
         with patch("app.service.auth.check_password") as mock_check_password:
@@ -33,12 +38,79 @@ class TestAuthService(unittest.TestCase):
                 password=salted_api_secret, hashed_password=client_secret
             )
 
+    def test_authorize_client_uses_verified_credential_cache(self):
+        api_key = str(uuid4())
+        salted_api_secret = "test_salted_secret"
+        self.client_service.fetch.return_value = Mock(
+            secret="hashed_secret", key=UUID(api_key)
+        )
+
+        with patch("app.service.auth.check_password") as mock_check_password:
+            mock_check_password.return_value = True
+            self.auth_service.authorize_client(api_key, salted_api_secret)
+            self.auth_service.authorize_client(api_key, salted_api_secret)
+
+            self.client_service.fetch.assert_called_once_with(api_key)
+            mock_check_password.assert_called_once()
+            self.assertEqual(self.credential_cache.stats().hits, 1)
+
+    def test_authorize_client_cache_does_not_accept_other_secret(self):
+        api_key = str(uuid4())
+        self.client_service.fetch.return_value = Mock(
+            secret="hashed_secret", key=UUID(api_key)
+        )
+
+        with patch("app.service.auth.check_password") as mock_check_password:
+            mock_check_password.return_value = True
+            self.auth_service.authorize_client(api_key, "right_secret")
+
+            mock_check_password.return_value = False
+            with self.assertRaises(UnauthorizedException):
+                self.auth_service.authorize_client(api_key, "wrong_secret")
+
+            self.assertEqual(mock_check_password.call_count, 2)
+
+    def test_authorize_client_verifies_again_after_invalidation(self):
+        api_key = str(uuid4())
+        salted_api_secret = "test_salted_secret"
+        self.client_service.fetch.return_value = Mock(
+            secret="hashed_secret", key=UUID(api_key)
+        )
+
+        with patch("app.service.auth.check_password") as mock_check_password:
+            mock_check_password.return_value = True
+            self.auth_service.authorize_client(api_key, salted_api_secret)
+            self.credential_cache.invalidate(api_key)
+            self.auth_service.authorize_client(api_key, salted_api_secret)
+
+            self.assertEqual(mock_check_password.call_count, 2)
+
+    def test_authorize_client_caches_by_canonical_key(self):
+        key = uuid4()
+        self.client_service.fetch.return_value = Mock(secret="hashed_secret", key=key)
+
+        with patch("app.service.auth.check_password") as mock_check_password:
+            mock_check_password.return_value = True
+            self.auth_service.authorize_client(str(key).upper(), "secret")
+
+            # Change notifications carry the key as Postgres renders it
+            self.assertIsNotNone(self.credential_cache.get(str(key)))
+
+            self.auth_service.authorize_client(str(key).upper(), "secret")
+            mock_check_password.assert_called_once()
+
+    def test_authorize_client_invalid_key(self):
+        with self.assertRaises(UnauthorizedException):
+            self.auth_service.authorize_client("not-a-key", "secret")
+
+        self.client_service.fetch.assert_not_called()
+
     def test_authorize_client_missing_information(self):
         with self.assertRaises(UnauthorizedException):
             self.auth_service.authorize_client(None, None)
 
     def test_authorize_client_wrong_credentials(self):
-        api_key = "test_api_key"
+        api_key = str(uuid4())
         salted_api_secret = "test_salted_secret"
         self.client_service.fetch.return_value = None
 
@@ -115,10 +187,10 @@ class TestAuthService(unittest.TestCase):
         user_id = uuid4()
         resource = "test_resource"
         action = "test_action"
-        self.casbin_enforcer.enforce.return_value = True
+        self.authorization_engine.enforce.return_value = True
 
         self.assertIsNone(self.auth_service.authorize_user(user_id, resource, action))
-        self.casbin_enforcer.enforce.assert_called_once_with(
+        self.authorization_engine.enforce.assert_called_once_with(
             str(user_id), resource, action
         )
 
@@ -132,7 +204,7 @@ class TestAuthService(unittest.TestCase):
         user_id = uuid4()
         resource = "test_resource"
         action = "test_action"
-        self.casbin_enforcer.enforce.return_value = False
+        self.authorization_engine.enforce.return_value = False
 
         with self.assertRaises(UnauthorizedException) as context:
             self.auth_service.authorize_user(user_id, resource, action)
@@ -0,0 +1,127 @@
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import Pattern
+
+from casbin import SyncedEnforcer
+
+from app.cache import TTLCache
+from app.policy_watcher import CasbinPolicyWatcher
+
+ALLOW = "allow"
+DENY = "deny"
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    obj: Pattern
+    act: Pattern
+    eft: str
+
+
+class _PolicyIndex:
+    """Policies grouped by subject, then by action, with compiled regexes."""
+
+    def __init__(self, policies: list[list[str]]) -> None:
+        self._logger = logging.getLogger("service:AuthorizationEngine")
+        self._by_subject: dict[str, list[CompiledPolicy]] = {}
+        self._by_subject_and_action: dict[tuple[str, str], list[CompiledPolicy]] = {}
+        self._lock = threading.Lock()
+
+        for policy in policies:
+            if len(policy) < 4 or policy[3] not in (ALLOW, DENY):
+                # Casbin treats any other effect as indeterminate
+                continue
+            sub, obj, act, eft = policy[:4]
+            try:
+                compiled = CompiledPolicy(re.compile(obj), re.compile(act), eft)
+            except re.error:
+                self._logger.warning(f"Ignoring policy with invalid regex: {policy}")
+                continue
+            self._by_subject.setdefault(sub, []).append(compiled)
+
+    def policies_for(self, subject: str, act: str) -> list[CompiledPolicy]:
+        key = (subject, act)
+        policies = self._by_subject_and_action.get(key)
+        if policies is None:
+            # regexMatch is re.match: anchored at the start only
+            policies = [
+                policy
+                for policy in self._by_subject.get(subject, [])
+                if policy.act.match(act)
+            ]
+            with self._lock:
+                self._by_subject_and_action[key] = policies
+        return policies
+
+
+class AuthorizationEngine:
+    """
+    Decides requests for the `regexMatch` casbin model in
+    `app/resources/casbin_model.conf` without scanning every policy.
+
+    Policy regexes are compiled once and indexed by subject and action, and
+    decisions are memoized per (role set, resource, action). The index and the
+    decisions are dropped whenever `CasbinPolicyWatcher` reports a change, so
+    results always match `SyncedEnforcer.enforce`.
+    """
+
+    def __init__(
+        self,
+        enforcer: SyncedEnforcer,
+        policy_watcher: CasbinPolicyWatcher,
+        decision_cache: TTLCache,
+    ) -> None:
+        self._enforcer = enforcer
+        self._decision_cache = decision_cache
+        self._lock = threading.Lock()
+        self._index: _PolicyIndex | None = None
+        self._generation = 0
+        policy_watcher.add_change_listener(self.invalidate)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._index = None
+            self._decision_cache.clear()
+
+    def enforce(self, subject: str, resource: str, action: str) -> bool:
+        # g(r.sub, p.sub): the subject itself or any of its (inherited) roles
+        subjects = frozenset(
+            [subject, *self._enforcer.get_implicit_roles_for_user(subject)]
+        )
+
+        key = (subjects, resource, action)
+        decision = self._decision_cache.get(key)
+        if decision is None:
+            generation = self._generation
+            decision = self._decide(subjects, resource, action)
+            with self._lock:
+                # Do not cache a decision computed from an outdated policy
+                if generation == self._generation:
+                    self._decision_cache.set(key, decision)
+        return decision
+
+    def _decide(self, subjects: frozenset[str], resource: str, action: str) -> bool:
+        index = self._current_index()
+
+        # some(where (p.eft == allow)) && !some(where (p.eft == deny))
+        allowed = False
+        for subject in subjects:
+            for policy in index.policies_for(subject, action):
+                if not policy.obj.match(resource):
+                    continue
+                if policy.eft == DENY:
+                    return False
+                allowed = True
+        return allowed
+
+    def _current_index(self) -> _PolicyIndex:
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = _PolicyIndex(self._enforcer.get_policy())
+                index = self._index
+        return index
@@ -0,0 +1,87 @@
+import itertools
+import unittest
+from unittest.mock import MagicMock
+
+from casbin import SyncedEnforcer
+from casbin.persist.adapters import FileAdapter
+
+from app.cache import TTLCache
+from app.policy_watcher import CasbinPolicyWatcher
+from app.service.authorization_engine import AuthorizationEngine
+
+MODEL_FILE = "app/resources/casbin_model.conf"
+POLICY_FILE = "app/resources/casbin_seed_policies_example.txt"
+ADMIN_USER = "9e88b14b-8874-481e-beb5-4f398af58cbc"
+
+
+class ReadOnlyFileAdapter(FileAdapter):
+    """Loads the example policies and accepts changes without saving them."""
+
+    def add_policy(self, sec, ptype, rule):
+        return True
+
+    def remove_policy(self, sec, ptype, rule):
+        return True
+
+
+class TestAuthorizationEngine(unittest.TestCase):
+    def setUp(self):
+        self.enforcer = SyncedEnforcer(MODEL_FILE, ReadOnlyFileAdapter(POLICY_FILE))
+        self.enforcer.enable_auto_build_role_links(True)
+        self.watcher = CasbinPolicyWatcher(MagicMock(), self.enforcer)
+        self.enforcer.set_watcher(self.watcher)
+        self.decision_cache = TTLCache(max_size=100, ttl_seconds=60)
+        self.engine = AuthorizationEngine(
+            self.enforcer, self.watcher, self.decision_cache
+        )
+
+    def test_decisions_match_casbin(self):
+        self.enforcer.add_grouping_policy("reader", "datasets_read")
+        self.enforcer.add_grouping_policy("root", "admin")
+        subjects = [ADMIN_USER, "reader", "root", "unknown", "datasets_search"]
+        resources = [
+            "/api/v1/datasets",
+            "/api/v1/datasets/:id",
+            "/api/v1/datasets/:id/enable",
+            "/api/v1/datasets/filters",
+            "/api/v1/users/123",
+            "/api/v1/users/:id",
+            "/api/v1/tenancies",
+        ]
+        actions = ["GET", "POST", "PUT", "DELETE"]
+
+        for subject, resource, action in itertools.product(
+            subjects, resources, actions
+        ):
+            with self.subTest(subject=subject, resource=resource, action=action):
+                self.assertEqual(
+                    self.engine.enforce(subject, resource, action),
+                    self.enforcer.enforce(subject, resource, action),
+                )
+
+    def test_deny_overrides_allow(self):
+        self.assertTrue(self.engine.enforce(ADMIN_USER, "/api/v1/users/456", "GET"))
+        self.assertFalse(self.engine.enforce(ADMIN_USER, "/api/v1/users/123", "GET"))
+
+    def test_decisions_are_memoized(self):
+        self.engine.enforce("datasets_read", "/api/v1/datasets/:id", "GET")
+        self.engine.enforce("datasets_read", "/api/v1/datasets/:id", "GET")
+
+        stats = self.decision_cache.stats()
+        self.assertEqual(stats.hits, 1)
+        self.assertEqual(stats.misses, 1)
+
+    def test_policy_changes_invalidate_decisions(self):
+        self.assertFalse(self.engine.enforce("user-1", "/api/v1/datasets", "GET"))
+
+        self.enforcer.add_grouping_policy("user-1", "datasets_search")
+
+        self.assertTrue(self.engine.enforce("user-1", "/api/v1/datasets", "GET"))
+
+        self.enforcer.add_policy("datasets_search", "/api/v1/datasets", "GET", "deny")
+
+        self.assertFalse(self.engine.enforce("user-1", "/api/v1/datasets", "GET"))
+
+
+if __name__ == "__main__":
+    unittest.main()
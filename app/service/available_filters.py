@@ -0,0 +1,102 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+from app.repository.dataset import DATA_FILTER_KEYS
+
+AVAILABLE_FILTERS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "resources", "available_filters.json"
+)
+
+
+@dataclass(frozen=True)
+class FiltersDocument:
+    filters: list[dict]
+    # Serialized `filters`, sent as is by GET /datasets/filters
+    body: bytes
+    # Strong ETag of `body`
+    etag: str
+    # Option values of the structured filters, by Dataset.data key and then by
+    # the lowercase value, id or label of an option
+    data_filter_values: dict[str, dict[str, str]]
+
+
+class AvailableFilters:
+    """
+    Process-local copy of `app/resources/available_filters.json`, parsed and
+    serialized once so serving the filters costs no disk I/O nor JSON work.
+
+    The document is loaded at startup, `load()` reloads it after the file
+    changed.
+    """
+
+    def __init__(self, path: str = AVAILABLE_FILTERS_PATH) -> None:
+        self._logger = logging.getLogger("service:AvailableFilters")
+        self._path = path
+        self._lock = threading.Lock()
+        self._document: FiltersDocument | None = None
+
+    def load(self) -> None:
+        with open(self._path, "rb") as file:
+            filters = json.loads(file.read())
+
+        body = json.dumps(filters, separators=(",", ":")).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        # Readers never lock: swapping the document reference is atomic
+        self._document = FiltersDocument(
+            filters=filters,
+            body=body,
+            etag=etag,
+            data_filter_values=_data_filter_values(filters),
+        )
+        self._logger.info(f"Loaded {len(filters)} available filters, etag {etag}")
+
+    def document(self) -> FiltersDocument:
+        document = self._document
+        if document is None:
+            with self._lock:
+                if self._document is None:
+                    self.load()
+                document = self._document
+        return document
+
+    def filters(self) -> list[dict]:
+        return self.document().filters
+
+    def normalize_data(self, data: dict | None) -> dict | None:
+        """
+        Dataset data whose structured filter values (category, data_type and
+        level) are the option value they alias, if any. Datasets store these
+        canonical values, which the search filters and facets match exactly.
+        """
+        if not data:
+            return data
+
+        normalized = dict(data)
+        for key in self.document().data_filter_values:
+            if isinstance(normalized.get(key), str):
+                normalized[key] = self.normalize_value(key, normalized[key])
+        return normalized
+
+    def normalize_value(self, key: str, value: str) -> str:
+        """Option value of a structured filter aliased by `value`, if any."""
+        options = self.document().data_filter_values.get(key, {})
+        return options.get(value.strip().lower(), value)
+
+
+def _data_filter_values(filters: list[dict]) -> dict[str, dict[str, str]]:
+    values: dict[str, dict[str, str]] = {}
+    for available_filter in filters:
+        key = DATA_FILTER_KEYS.get(available_filter["id"])
+        if key is None:
+            continue
+
+        options = values.setdefault(key, {})
+        for option in available_filter.get("options", []):
+            for alias in (option.get("value"), option.get("id"), option.get("label")):
+                if alias:
+                    options[alias.strip().lower()] = option["value"]
+    return values
@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+from app.service.available_filters import AvailableFilters
+
+
+class TestAvailableFilters(unittest.TestCase):
+    def setUp(self):
+        file = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        json.dump([{"id": "level", "options": [{"value": "L1"}]}], file, indent=2)
+        file.close()
+        self.path = file.name
+        self.available_filters = AvailableFilters(path=self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_document_is_loaded_once(self):
+        document = self.available_filters.document()
+        os.remove(self.path)
+
+        self.assertIs(self.available_filters.document(), document)
+        self.assertEqual(
+            self.available_filters.filters(),
+            [{"id": "level", "options": [{"value": "L1"}]}],
+        )
+        self.assertEqual(json.loads(document.body), document.filters)
+
+        # recreated for tearDown
+        open(self.path, "w").close()
+
+    def test_etag_changes_with_content(self):
+        etag = self.available_filters.document().etag
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+
+        with open(self.path, "w") as file:
+            json.dump([{"id": "data_type", "options": []}], file)
+        self.available_filters.load()
+
+        self.assertNotEqual(self.available_filters.document().etag, etag)
+
+    def test_etag_ignores_formatting(self):
+        etag = self.available_filters.document().etag
+
+        with open(self.path, "w") as file:
+            json.dump([{"id": "level", "options": [{"value": "L1"}]}], file)
+        self.available_filters.load()
+
+        self.assertEqual(self.available_filters.document().etag, etag)
+
+    def test_normalize_data_to_option_values(self):
+        available_filters = AvailableFilters()
+
+        self.assertEqual(
+            available_filters.normalize_data(
+                {
+                    "category": "aerosols ",
+                    "data_type": "Routine",
+                    "level": "l2",
+                    "description": "aerosols",
+                }
+            ),
+            {
+                "category": "AEROSOLS",
+                "data_type": "ROUTINE",
+                "level": "L2",
+                "description": "aerosols",
+            },
+        )
+        self.assertEqual(
+            available_filters.normalize_value("category", "category_aerosols"),
+            "AEROSOLS",
+        )
+        self.assertIsNone(available_filters.normalize_data(None))
+
+    def test_normalize_keeps_unknown_values(self):
+        self.assertEqual(
+            self.available_filters.normalize_data({"level": "l1", "category": "x"}),
+            {"level": "L1", "category": "x"},
+        )
+        self.assertEqual(self.available_filters.normalize_value("level", "L9"), "L9")
+
+    def test_normalize_follows_reloads(self):
+        self.assertEqual(self.available_filters.normalize_value("level", "l3"), "l3")
+
+        with open(self.path, "w") as file:
+            json.dump([{"id": "level", "options": [{"value": "L3"}]}], file)
+        self.available_filters.load()
+
+        self.assertEqual(self.available_filters.normalize_value("level", "l3"), "L3")
+
+
+if __name__ == "__main__":
+    unittest.main()
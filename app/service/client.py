@@ -1,16 +1,26 @@
-from functools import lru_cache
 from typing import List
 from uuid import UUID
+from app.cache import TTLCache
 from app.exception.not_found import NotFoundException
 from app.model.db.client import Client as DBModel
 from app.model.client import Client
 from app.repository.client import ClientRepository
 from app.service.secret import hash_password
 
+# Published by a trigger on clients with the changed key, see app.notification
+CLIENTS_CHANGED_CHANNEL = "clients_changed"
+
 
 class ClientService:
-    def __init__(self, repository: ClientRepository) -> None:
+    def __init__(
+        self,
+        repository: ClientRepository,
+        client_cache: TTLCache,
+        credential_cache: TTLCache,
+    ) -> None:
         self._repository: ClientRepository = repository
+        self._client_cache: TTLCache = client_cache
+        self._credential_cache: TTLCache = credential_cache
 
     def __adapt_client(self, client: DBModel) -> Client:
         return Client(
@@ -20,12 +30,27 @@ class ClientService:
             secret=client.secret,
         )
 
-    @lru_cache
-    def fetch(self, api_key: UUID) -> Client | None:
+    def _invalidate(self, key: UUID) -> None:
+        # Other processes drop their entries on the clients_changed notification
+        self._client_cache.invalidate(str(key))
+        self._credential_cache.invalidate(str(key))
+
+    def fetch(self, api_key: UUID | str) -> Client | None:
+        try:
+            # Keyed like the change notifications, by the canonical client key
+            key = str(UUID(str(api_key)))
+        except ValueError:
+            return None
+
+        cached: Client = self._client_cache.get(key)
+        if cached is not None:
+            return cached
+
         res: DBModel = self._repository.fetch(api_key=api_key)
         if res is None:
             return None
         client: Client = self.__adapt_client(client=res)
+        self._client_cache.set(key, client)
         return client
 
     def fetch_all(self) -> List[Client]:
@@ -43,7 +68,7 @@ class ClientService:
         )
 
         created_key = self._repository.upsert(client=model).key
-        self.fetch.cache_clear()
+        self._invalidate(created_key)
         return created_key
 
     def update(
@@ -59,7 +84,7 @@ class ClientService:
             client.secret = hash_password(password=secret)
 
         self._repository.upsert(client=client)
-        self.fetch.cache_clear()
+        self._invalidate(key)
 
     def disable(self, key: UUID) -> None:
         client: DBModel = self._repository.fetch(api_key=key)
@@ -67,7 +92,7 @@ class ClientService:
             raise NotFoundException(f"not_found: {key}")
         client.is_enabled = False
         self._repository.upsert(client=client)
-        self.fetch.cache_clear()
+        self._invalidate(key)
 
     def enable(self, key: UUID) -> None:
         client: DBModel = self._repository.fetch(api_key=key, is_enabled=False)
@@ -75,4 +100,4 @@ class ClientService:
             raise NotFoundException(f"not_found: {key}")
         client.is_enabled = True
         self._repository.upsert(client=client)
-        self.fetch.cache_clear()
+        self._invalidate(key)
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock, patch
 from uuid import uuid4
+from app.cache import TTLCache
 from app.model.db.client import Client as DBModel
 from app.repository.client import ClientRepository
 from app.exception.not_found import NotFoundException
@@ -10,7 +11,11 @@ from app.service.client import ClientService
 class TestClientService(unittest.TestCase):
     def setUp(self):
         self.repository = Mock(spec=ClientRepository)
-        self.client_service = ClientService(self.repository)
+        self.client_cache = TTLCache(max_size=10, ttl_seconds=60)
+        self.credential_cache = TTLCache(max_size=10, ttl_seconds=60)
+        self.client_service = ClientService(
+            self.repository, self.client_cache, self.credential_cache
+        )
 
     def test_fetch_success(self):
         api_key = uuid4()
@@ -82,6 +87,18 @@ class TestClientService(unittest.TestCase):
         self.assertEqual(db_client.name, "updated_client")
         self.assertEqual(db_client.secret, "hashed_secret")
 
+    def test_update_invalidates_verified_credentials(self):
+        key = uuid4()
+        self.credential_cache.set(str(key), "digest")
+        self.repository.fetch.return_value = DBModel(
+            key=key, name="client1", is_enabled=True, secret="secret"
+        )
+
+        with patch("app.service.client.hash_password"):
+            self.client_service.update(key, secret="new_secret")
+
+        self.assertIsNone(self.credential_cache.get(str(key)))
+
     def test_update_not_found(self):
         self.repository.fetch.return_value = None
         with self.assertRaises(NotFoundException):
@@ -94,9 +111,12 @@ class TestClientService(unittest.TestCase):
         db_client = DBModel(key=key, name="client1", is_enabled=True, secret="secret")
         self.repository.fetch.return_value = db_client
 
+        self.credential_cache.set(str(key), "digest")
+
         self.client_service.disable(key)
         self.repository.upsert.assert_called_once()
         self.assertFalse(db_client.is_enabled)
+        self.assertIsNone(self.credential_cache.get(str(key)))
 
     def test_disable_not_found(self):
         self.repository.fetch.return_value = None
@@ -128,17 +148,15 @@ class TestClientService(unittest.TestCase):
         client1 = self.client_service.fetch(api_key)
         self.assertEqual(client1.name, "client1")
         self.repository.fetch.assert_called_once_with(api_key=api_key)
-
-        # Directly check if the result is cached
-        cached_client = self.client_service.fetch.cache_info().hits
-        self.assertEqual(cached_client, 0, "Cache should not have any hits yet")
+        self.assertEqual(
+            self.client_cache.stats().hits, 0, "Cache should not have any hits yet"
+        )
 
         # Second fetch, should use the cache
         client2 = self.client_service.fetch(api_key)
         self.assertEqual(client2.name, "client1")
-        self.assertEqual(
-            self.client_service.fetch.cache_info().hits, 1, "Cache should have 1 hit"
-        )
+        self.repository.fetch.assert_called_once()
+        self.assertEqual(self.client_cache.stats().hits, 1, "Cache should have 1 hit")
 
         # Invalidate cache by updating the client
         updated_name = "updated_client"
@@ -150,20 +168,66 @@ class TestClientService(unittest.TestCase):
         client3 = self.client_service.fetch(api_key)
         self.assertEqual(client3.name, updated_name)
         self.assertEqual(
-            self.client_service.fetch.cache_info().misses,
-            1,
-            "Cache should have 1 miss after invalidation",
+            self.client_cache.stats().misses,
+            2,
+            "Cache should have 1 more miss after invalidation",
         )
 
         # Fetch again, should use the cache
         client4 = self.client_service.fetch(api_key)
         self.assertEqual(client4.name, updated_name)
         self.assertEqual(
-            self.client_service.fetch.cache_info().hits,
-            1,
-            "Cache should have 1 hit after invalidation",
+            self.client_cache.stats().hits,
+            2,
+            "Cache should have 1 more hit after invalidation",
+        )
+
+    def test_cache_is_shared_across_instances(self):
+        api_key = uuid4()
+        self.repository.fetch.return_value = DBModel(
+            key=api_key, name="client1", is_enabled=True, secret="secret"
+        )
+        other_service = ClientService(
+            self.repository, self.client_cache, self.credential_cache
+        )
+
+        self.client_service.fetch(api_key)
+        client = other_service.fetch(api_key)
+
+        self.assertEqual(client.name, "client1")
+        self.repository.fetch.assert_called_once()
+
+    def test_disable_invalidates_cached_client(self):
+        api_key = uuid4()
+        db_client = DBModel(
+            key=api_key, name="client1", is_enabled=True, secret="secret"
+        )
+        self.repository.fetch.return_value = db_client
+        self.client_service.fetch(api_key)
+
+        self.client_service.disable(api_key)
+        self.repository.fetch.return_value = None
+
+        self.assertIsNone(self.client_service.fetch(api_key))
+
+    def test_fetch_caches_by_canonical_key(self):
+        api_key = uuid4()
+        self.repository.fetch.return_value = DBModel(
+            key=api_key, name="client1", is_enabled=True, secret="secret"
         )
 
+        self.client_service.fetch(str(api_key).upper())
+
+        # Change notifications carry the key as Postgres renders it
+        self.assertIsNotNone(self.client_cache.get(str(api_key)))
+
+        self.client_service.fetch(str(api_key).upper())
+        self.repository.fetch.assert_called_once()
+
+    def test_fetch_invalid_key(self):
+        self.assertIsNone(self.client_service.fetch("not-a-key"))
+        self.repository.fetch.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,9 @@
 import logging
+from dataclasses import dataclass, replace
 from uuid import UUID
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Generator, Hashable, Optional
+from sqlalchemy.orm import Session
 import json
 from app.exception.bad_request import BadRequestException, ErrorDetails
 from app.exception.illegal_state import IllegalStateException
@@ -14,12 +18,23 @@ from app.model.doi import (
     Title as DOITitle,
     Creator as DOICreator,
 )
+from app.repository.aio.dataset import AsyncDatasetRepository
+from app.repository.aio.dataset_version import AsyncDatasetVersionRepository
 from app.repository.datafile import DataFileRepository
 from app.repository.dataset import DatasetRepository
 from app.repository.dataset_version import DatasetVersionRepository
+from app.repository.load_plan import (
+    DATASET_ONLY,
+    DATASET_WITH_VERSIONS,
+    VERSION_ONLY,
+    VERSION_WITH_DOI,
+    VERSION_WITH_FILES,
+)
 from app.service.doi import DOIService
-from app.service.tenancy import TenancyService
-from app.service.user import UserService
+from app.service.tenancy_registry import TenancyRegistry
+from app.service.auth_context import AuthContextService
+from app.service.available_filters import AvailableFilters
+from app.service.dataset_cache import DatasetCache
 from app.model.dataset import (
     Dataset,
     DatasetQuery,
@@ -29,13 +44,48 @@ from app.model.dataset import (
     VisibilityStatus,
     FileCollocationStatus,
     PaginatedResult,
+    CountStrategy,
+    DatasetSuggestion,
 )
+from app.model.auth_context import AuthContext
 from app.model.db.dataset import (
     Dataset as DatasetDBModel,
     DatasetVersion as DatasetVersionDBModel,
     DataFile as DataFileDBModel,
 )
 from app.adapter import doi as DOIAdapter
+from app.cache import TTLCache
+
+
+# Reads are written once as generators of steps, run on the sync repositories
+# by `DatasetService._run` and on the async ones by `DatasetService._run_async`
+@dataclass(frozen=True)
+class _Tenancies:
+    """Step of a read: the tenancies of the user among the requested ones."""
+
+    user_id: UUID
+    tenancies: list[str]
+
+
+@dataclass(frozen=True)
+class _Query:
+    """Step of a read: a call to the dataset or the version repository."""
+
+    repository: str
+    method: str
+    kwargs: dict
+
+
+@dataclass(frozen=True)
+class _Cached:
+    """Step of a read: the cached result of the `load` steps."""
+
+    dataset_id: UUID
+    options: tuple[Hashable, ...]
+    load: Generator
+
+
+ReadSteps = Generator[Any, Any, Any]
 
 
 class DatasetService:
@@ -44,21 +94,49 @@ class DatasetService:
         repository: DatasetRepository,
         version_repository: DatasetVersionRepository,
         data_file_repository: DataFileRepository,
-        user_service: UserService,
+        auth_context_service: AuthContextService,
         doi_service: DOIService,
         minio_gateway: ObjectStorageGateway,
-        tenancy_service: TenancyService,
+        tenancy_registry: TenancyRegistry,
         dataset_bucket: str,
+        count_cache: TTLCache,
+        default_count_strategy: str,
+        count_estimate_threshold: int,
+        facet_cache: TTLCache,
+        available_filters: AvailableFilters,
+        unit_of_work: Callable[..., AbstractContextManager[Session]],
+        dataset_cache: DatasetCache,
+        async_enabled: bool = False,
+        async_repository: Optional[AsyncDatasetRepository] = None,
+        async_version_repository: Optional[AsyncDatasetVersionRepository] = None,
     ):
         self._logger = logging.getLogger("service:DatasetService")
         self._repository = repository
         self._version_repository = version_repository
-        self._user_service = user_service
+        self._auth_context_service = auth_context_service
         self._doi_service = doi_service
         self._minio_gateway = minio_gateway
         self._dataset_bucket = dataset_bucket
         self._data_file_repository = data_file_repository
-        self._tenancy_service = tenancy_service
+        self._tenancy_registry = tenancy_registry
+        self._count_cache = count_cache
+        self._default_count_strategy = CountStrategy(default_count_strategy)
+        self._count_estimate_threshold = count_estimate_threshold
+        self._facet_cache = facet_cache
+        self._available_filters = available_filters
+        # Mutations spanning several repository calls run in one transaction
+        self._unit_of_work = unit_of_work
+        # Adapted datasets served by the detail reads, every mutation below
+        # invalidates the dataset it changed
+        self._dataset_cache = dataset_cache
+        # Reads served on the event loop by the `*_async` methods, when enabled
+        self._async_enabled = async_enabled
+        self._async_repository = async_repository
+        self._async_version_repository = async_version_repository
+
+    @property
+    def async_enabled(self) -> bool:
+        return self._async_enabled
 
     def _adapt_file(self, file: DataFileDBModel) -> DataFile:
         return DataFile(
@@ -74,12 +152,6 @@ class DatasetService:
             created_by=file.created_by,
         )
 
-    def _calculate_files_size_in_bytes(self, files: list[DataFileDBModel]) -> int:
-        return sum([file.size_bytes or 0 for file in files])
-
-    def _calculate_files_count(self, files: list[DataFileDBModel]) -> int:
-        return len(files)
-
     def _adapt_version(self, version: DatasetVersionDBModel) -> DatasetVersion:
         return DatasetVersion(
             id=version.id,
@@ -92,28 +164,13 @@ class DatasetService:
             design_state=version.design_state,
             files=[self._adapt_file(file=file) for file in version.files],
             files_in=[self._adapt_file(file=file) for file in version.files_in],
-            files_size_in_bytes=self._calculate_files_size_in_bytes(version.files_in),
-            files_count=self._calculate_files_count(version.files_in),
-            doi=DOIAdapter.database_to_model(doi=version.doi) if version.doi else None,
-        )
-
-    def _adapt_minimal_version(self, version: DatasetVersionDBModel) -> DatasetVersion:
-        return DatasetVersion(
-            id=version.id,
-            name=version.name,
-            description=version.description,
-            created_at=version.created_at,
-            updated_at=version.updated_at,
-            created_by=version.created_by,
-            is_enabled=version.is_enabled,
-            design_state=version.design_state,
-            files_size_in_bytes=self._calculate_files_size_in_bytes(version.files_in),
-            files_count=self._calculate_files_count(version.files_in),
+            files_size_in_bytes=version.files_size_in_bytes,
+            files_count=version.files_count,
             doi=DOIAdapter.database_to_model(doi=version.doi) if version.doi else None,
         )
 
     def _adapt_dataset(self, dataset: DatasetDBModel) -> Dataset:
-        current_version = self._get_current_dataset_version(versions=dataset.versions)
+        current_version = self._get_current_dataset_version(dataset=dataset)
         return Dataset(
             id=dataset.id,
             name=dataset.name,
@@ -132,27 +189,6 @@ class DatasetService:
             else None,
         )
 
-    def _adapt_minimal_dataset(self, dataset: DatasetDBModel) -> Dataset:
-        current_version = self._get_current_dataset_version(versions=dataset.versions)
-        return Dataset(
-            id=dataset.id,
-            name=dataset.name,
-            data=dataset.data,
-            is_enabled=dataset.is_enabled,
-            created_at=dataset.created_at,
-            updated_at=dataset.updated_at,
-            tenancy=dataset.tenancy,
-            design_state=dataset.design_state,
-            visibility=dataset.visibility,
-            versions=[
-                self._adapt_minimal_version(version=version)
-                for version in dataset.versions
-            ],
-            current_version=self._adapt_minimal_version(version=current_version)
-            if current_version is not None
-            else None,
-        )
-
     def _adapt_dataset_version(
         self, dataset: DatasetDBModel, dataset_version: DatasetVersionDBModel
     ) -> Dataset:
@@ -170,46 +206,76 @@ class DatasetService:
         )
 
     def _get_current_dataset_version(
-        self, versions: list[DatasetVersionDBModel]
+        self, dataset: DatasetDBModel
+    ) -> DatasetVersionDBModel:
+        """Get current version, the most recent by created_at, pointed by the dataset"""
+        return self._find_version(dataset, dataset.current_version_id)
+
+    def _find_version(
+        self, dataset: DatasetDBModel, version_id: UUID
     ) -> DatasetVersionDBModel:
-        """Get current version from the most recent by created_at and if the design_state is PUBLISHED or DRAFT"""
-        versions = sorted(
-            versions, key=lambda version: version.created_at, reverse=True
+        if version_id is None:
+            return None
+        return next(
+            (version for version in dataset.versions if version.id == version_id),
+            None,
         )
-        for version in versions:
-            if (
-                version.design_state == DesignState.PUBLISHED
-                or version.design_state == DesignState.DRAFT
-            ):
-                return version
 
     def _determine_tenancies(
         self, user_id: UUID, tenancies: list[str] = []
     ) -> list[str]:
         try:
-            user = self._user_service.fetch_by_id(id=user_id)
+            context = self._auth_context_service.resolve(user_id=user_id)
         except NotFoundException:
             raise UnauthorizedException(
                 f"unauthorized_tenancy '{tenancies}' for user '{user_id}'"
             )
 
-        if not tenancies:
-            tenancies = user.tenancies
+        return self._allowed_tenancies(
+            context=context, user_id=user_id, tenancies=tenancies
+        )
 
-        # Check if tenancy is enabled
-        for tenancy in tenancies:
-            database_tenancy = self._tenancy_service.fetch(name=tenancy)
+    async def _determine_tenancies_async(
+        self, user_id: UUID, tenancies: list[str] = []
+    ) -> list[str]:
+        try:
+            context = await self._auth_context_service.resolve_async(user_id=user_id)
+        except NotFoundException:
+            raise UnauthorizedException(
+                f"unauthorized_tenancy '{tenancies}' for user '{user_id}'"
+            )
 
-            if not database_tenancy or not database_tenancy.is_enabled:
-                tenancies.remove(tenancy)
+        return self._allowed_tenancies(
+            context=context, user_id=user_id, tenancies=tenancies
+        )
 
-        if not set(tenancies).issubset(set(user.tenancies)):
+    def _allowed_tenancies(
+        self, context: AuthContext, user_id: UUID, tenancies: list[str]
+    ) -> list[str]:
+        if not tenancies:
+            return context.enabled_tenancies()
+
+        unauthorized = []
+        allowed = []
+        for tenancy in tenancies:
+            if context.is_member(tenancy):
+                # Disabled tenancies are silently ignored
+                if context.tenancies[tenancy]:
+                    allowed.append(tenancy)
+                continue
+
+            # Requested tenancies outside of the membership are only rejected
+            # when they are enabled, like disabled member tenancies are ignored
+            if self._tenancy_registry.is_enabled(tenancy):
+                unauthorized.append(tenancy)
+
+        if unauthorized:
             logging.warning(
-                f"user {user_id} trying to query with unauthorized tenancy: {tenancies}"
+                f"user {user_id} trying to query with unauthorized tenancy: {unauthorized}"
             )
             raise UnauthorizedException(f"unauthorized_tenancy: {tenancies}")
 
-        return tenancies
+        return allowed
 
     def fetch_dataset(
         self,
@@ -221,19 +287,85 @@ class DatasetService:
         version_design_state: DesignState = None,
         version_is_enabled: bool = True,
     ) -> Dataset | None:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id,
-            is_enabled=is_enabled,
-            tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
-            latest_version=latest_version,
-            version_design_state=version_design_state,
-            version_is_enabled=version_is_enabled,
+        return self._run(
+            self._fetch_dataset(
+                dataset_id=dataset_id,
+                is_enabled=is_enabled,
+                user_id=user_id,
+                tenancies=tenancies,
+                latest_version=latest_version,
+                version_design_state=version_design_state,
+                version_is_enabled=version_is_enabled,
+            )
         )
 
-        if dataset is None:
+    async def fetch_dataset_async(
+        self,
+        dataset_id: UUID,
+        is_enabled: bool = True,
+        user_id: UUID = None,
+        tenancies: list[str] = [],
+        latest_version: bool = False,
+        version_design_state: DesignState = None,
+        version_is_enabled: bool = True,
+    ) -> Dataset | None:
+        """`fetch_dataset` on the async repositories."""
+        return await self._run_async(
+            self._fetch_dataset(
+                dataset_id=dataset_id,
+                is_enabled=is_enabled,
+                user_id=user_id,
+                tenancies=tenancies,
+                latest_version=latest_version,
+                version_design_state=version_design_state,
+                version_is_enabled=version_is_enabled,
+            )
+        )
+
+    def _fetch_dataset(
+        self,
+        dataset_id: UUID,
+        is_enabled: bool,
+        user_id: UUID,
+        tenancies: list[str],
+        latest_version: bool,
+        version_design_state: DesignState,
+        version_is_enabled: bool,
+    ) -> ReadSteps:
+        tenancies = yield _Tenancies(user_id=user_id, tenancies=tenancies)
+
+        def load() -> ReadSteps:
+            dataset: DatasetDBModel = yield _Query(
+                "dataset",
+                "fetch",
+                dict(
+                    dataset_id=dataset_id,
+                    is_enabled=is_enabled,
+                    tenancies=tenancies,
+                    latest_version=latest_version,
+                    version_design_state=version_design_state,
+                    version_is_enabled=version_is_enabled,
+                ),
+            )
+            return self._adapt_dataset(dataset=dataset) if dataset else None
+
+        dataset = yield _Cached(
+            dataset_id,
+            options=(
+                "dataset",
+                is_enabled,
+                latest_version,
+                version_design_state,
+                version_is_enabled,
+            ),
+            load=load(),
+        )
+
+        # Cached datasets are shared by every tenancy, the check runs per request
+        if dataset is None or dataset.tenancy not in tenancies:
             return None
 
-        return self._adapt_dataset(dataset=dataset)
+        return dataset
 
     def update_dataset(
         self,
@@ -245,13 +377,14 @@ class DatasetService:
         dataset_db: DatasetDBModel = self._repository.fetch(
             dataset_id=dataset_id,
             tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
+            load_plan=DATASET_WITH_VERSIONS,
         )
 
         if dataset_db is None:
             raise NotFoundException(f"not_found: {dataset_id}")
 
         dataset_db.name = dataset_request.name
-        dataset_db.data = dataset_request.data
+        dataset_db.data = self._available_filters.normalize_data(dataset_request.data)
         dataset_db.tenancy = dataset_request.tenancy
         dataset_db.owner_id = user_id
 
@@ -260,7 +393,7 @@ class DatasetService:
             dataset_db.versions.append(new_version)
         else:
             # TODO Should we get the specific version for doi, updated the last doi or update all dois for each version?
-            current_version = self._get_current_dataset_version(dataset_db.versions)
+            current_version = self._get_current_dataset_version(dataset_db)
             if current_version and current_version.doi is not None:
                 doi = self._create_doi_model(
                     doi=DOIAdapter.database_to_model(current_version.doi),
@@ -270,7 +403,8 @@ class DatasetService:
                 )
                 self._doi_service.update_metadata(doi=doi)
 
-        self._repository.upsert(dataset=dataset_db)
+        self._repository.upsert(dataset=dataset_db, refresh=False)
+        self._dataset_cache.invalidate(dataset_id)
 
     def _should_create_new_version(
         self, dataset_db: DatasetDBModel, dataset_request: Dataset
@@ -317,7 +451,7 @@ class DatasetService:
     def create_dataset(self, dataset: Dataset, user_id: UUID) -> Dataset:
         dataset = DatasetDBModel(
             name=dataset.name,
-            data=dataset.data,
+            data=self._available_filters.normalize_data(dataset.data),
             tenancy=dataset.tenancy,
             design_state=DesignState.DRAFT,
             owner_id=user_id,
@@ -335,28 +469,37 @@ class DatasetService:
         return self._adapt_dataset(dataset=created)
 
     def disable_dataset(self, dataset_id: UUID, tenancies: list[str] = []) -> None:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id, tenancies=tenancies
-        )
+        with self._unit_of_work():
+            dataset: DatasetDBModel = self._repository.fetch(
+                dataset_id=dataset_id, tenancies=tenancies, load_plan=DATASET_ONLY
+            )
 
-        if dataset is None:
-            raise NotFoundException(f"not_found: {dataset_id}")
+            if dataset is None:
+                raise NotFoundException(f"not_found: {dataset_id}")
+
+            dataset.is_enabled = False
 
-        dataset.is_enabled = False
+            self._repository.upsert(dataset=dataset, refresh=False)
 
-        self._repository.upsert(dataset=dataset)
+        self._dataset_cache.invalidate(dataset_id)
 
     def enable_dataset(self, dataset_id: UUID, tenancies: list[str] = []) -> None:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id, is_enabled=False, tenancies=tenancies
-        )
+        with self._unit_of_work():
+            dataset: DatasetDBModel = self._repository.fetch(
+                dataset_id=dataset_id,
+                is_enabled=False,
+                tenancies=tenancies,
+                load_plan=DATASET_ONLY,
+            )
 
-        if dataset is None:
-            raise NotFoundException(f"not_found: {dataset_id}")
+            if dataset is None:
+                raise NotFoundException(f"not_found: {dataset_id}")
+
+            dataset.is_enabled = True
 
-        dataset.is_enabled = True
+            self._repository.upsert(dataset=dataset, refresh=False)
 
-        self._repository.upsert(dataset=dataset)
+        self._dataset_cache.invalidate(dataset_id)
 
     def enable_dataset_version(
         self,
@@ -365,27 +508,37 @@ class DatasetService:
         version_name: str,
         tenancies: list[str] = [],
     ) -> None:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id,
-            tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
-            version_is_enabled=False,
-        )
-
-        if dataset is None:
-            raise NotFoundException(f"not_found: {dataset_id}")
+        with self._unit_of_work():
+            dataset: DatasetDBModel = self._repository.fetch(
+                dataset_id=dataset_id,
+                tenancies=self._determine_tenancies(
+                    user_id=user_id, tenancies=tenancies
+                ),
+                version_is_enabled=False,
+                load_plan=DATASET_ONLY,
+            )
 
-        version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
-        )
+            if dataset is None:
+                raise NotFoundException(f"not_found: {dataset_id}")
 
-        if version is None:
-            raise NotFoundException(
-                f"not_found: {version_name} for dataset {dataset_id}"
+            version: DatasetVersionDBModel = (
+                self._version_repository.fetch_version_by_name(
+                    dataset_id=dataset_id,
+                    version_name=version_name,
+                    load_plan=VERSION_ONLY,
+                )
             )
 
-        version.is_enabled = True
+            if version is None:
+                raise NotFoundException(
+                    f"not_found: {version_name} for dataset {dataset_id}"
+                )
+
+            version.is_enabled = True
+
+            self._version_repository.upsert(dataset_version=version, refresh=False)
 
-        self._version_repository.upsert(dataset_version=version)
+        self._dataset_cache.invalidate(dataset_id)
 
     def disable_dataset_version(
         self,
@@ -394,33 +547,76 @@ class DatasetService:
         version_name: str,
         tenancies: list[str] = [],
     ) -> None:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id,
-            tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
-        )
-
-        if dataset is None:
-            raise NotFoundException(f"not_found: {dataset_id}")
+        with self._unit_of_work():
+            dataset: DatasetDBModel = self._repository.fetch(
+                dataset_id=dataset_id,
+                tenancies=self._determine_tenancies(
+                    user_id=user_id, tenancies=tenancies
+                ),
+                load_plan=DATASET_WITH_VERSIONS,
+            )
 
-        if len(dataset.versions) <= 1:
-            raise IllegalStateException("dataset_has_only_one_version")
+            if dataset is None:
+                raise NotFoundException(f"not_found: {dataset_id}")
 
-        version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
-        )
+            if len(dataset.versions) <= 1:
+                raise IllegalStateException("dataset_has_only_one_version")
 
-        if version is None:
-            raise NotFoundException(
-                f"not_found: {version_name} for dataset {dataset_id}"
+            version: DatasetVersionDBModel = (
+                self._version_repository.fetch_version_by_name(
+                    dataset_id=dataset_id,
+                    version_name=version_name,
+                    load_plan=VERSION_ONLY,
+                )
             )
 
-        version.is_enabled = False
+            if version is None:
+                raise NotFoundException(
+                    f"not_found: {version_name} for dataset {dataset_id}"
+                )
+
+            version.is_enabled = False
+
+            self._version_repository.upsert(dataset_version=version, refresh=False)
 
-        self._version_repository.upsert(dataset_version=version)
+        self._dataset_cache.invalidate(dataset_id)
 
-    def fetch_available_filters(self) -> dict:
-        with open("app/resources/available_filters.json") as categories:
-            return json.load(categories)
+    def fetch_available_filters(self) -> list[dict]:
+        return self._available_filters.filters()
+
+    def fetch_filter_facets(
+        self, query: DatasetQuery, user_id: UUID, tenancies: list[str] = []
+    ) -> list[dict]:
+        """
+        Available filters whose options carry the number of datasets matching
+        the query, among the tenancies of the user, if the option was selected.
+        """
+        tenancies = self._determine_tenancies(user_id=user_id, tenancies=tenancies)
+        query = self._normalize_query(query)
+
+        key = self._count_cache_key(query=query, tenancies=tenancies)
+        counts = self._facet_cache.get(key)
+        if counts is None:
+            counts = self._repository.count_facets(
+                query_params=query, tenancies=tenancies
+            )
+            self._facet_cache.set(key, counts)
+
+        return [
+            {
+                **available_filter,
+                "options": [
+                    {
+                        **option,
+                        "count": counts[available_filter["id"]].get(option["value"], 0),
+                    }
+                    for option in available_filter["options"]
+                ],
+            }
+            if available_filter["id"] in counts
+            else available_filter
+            for available_filter in self.fetch_available_filters()
+        ]
 
     def search_datasets(
         self, query: DatasetQuery, user_id: UUID, tenancies: list[str] = []
@@ -430,23 +626,76 @@ class DatasetService:
 
         Returns a PaginatedResult containing adapted Dataset domain objects.
         """
-        result: PaginatedResult = self._repository.search(
-            query_params=query,
-            tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
+        return self._run(
+            self._search_datasets(query=query, user_id=user_id, tenancies=tenancies)
+        )
+
+    async def search_datasets_async(
+        self, query: DatasetQuery, user_id: UUID, tenancies: list[str] = []
+    ) -> PaginatedResult:
+        """`search_datasets` on the async repositories."""
+        return await self._run_async(
+            self._search_datasets(query=query, user_id=user_id, tenancies=tenancies)
+        )
+
+    def _search_datasets(
+        self, query: DatasetQuery, user_id: UUID, tenancies: list[str]
+    ) -> ReadSteps:
+        tenancies = yield _Tenancies(user_id=user_id, tenancies=tenancies)
+        query = self._normalize_query(query)
+
+        # Listings are projected by the repository, files are only counted
+        result: PaginatedResult = yield _Query(
+            "dataset",
+            "search_minimal" if query.minimal else "search",
+            dict(query_params=query, tenancies=tenancies, include_count=False),
         )
 
         if result is None or result.items is None:
-            return PaginatedResult(
-                items=[],
-                total_count=0,
-                page=query.page,
-                page_size=query.page_size,
-            )
+            return self._empty_search_result(query=query)
+
+        total_count, count_strategy = yield from self._count_datasets(
+            query=query, tenancies=tenancies
+        )
+
+        return self._search_result(
+            query=query,
+            result=result,
+            total_count=total_count,
+            count_strategy=count_strategy,
+        )
+
+    def _normalize_query(self, query: DatasetQuery) -> DatasetQuery:
+        """
+        Query whose structured filter values are the option values they alias,
+        the values datasets store and the search filters match exactly.
+        """
+        normalize = self._available_filters.normalize_value
+        return replace(
+            query,
+            categories=[normalize("category", value) for value in query.categories],
+            data_types=[normalize("data_type", value) for value in query.data_types],
+            level=normalize("level", query.level) if query.level is not None else None,
+        )
 
+    def _empty_search_result(self, query: DatasetQuery) -> PaginatedResult:
+        return PaginatedResult(
+            items=[],
+            total_count=0,
+            page=query.page,
+            page_size=query.page_size,
+            cursor=query.cursor,
+        )
+
+    def _search_result(
+        self,
+        query: DatasetQuery,
+        result: PaginatedResult,
+        total_count: int,
+        count_strategy: CountStrategy,
+    ) -> PaginatedResult:
         if query.minimal:
-            adapted_items = [
-                self._adapt_minimal_dataset(dataset=dataset) for dataset in result.items
-            ]
+            adapted_items = result.items
         else:
             adapted_items = [
                 self._adapt_dataset(dataset=dataset) for dataset in result.items
@@ -454,36 +703,110 @@ class DatasetService:
 
         return PaginatedResult(
             items=adapted_items,
-            total_count=result.total_count,
+            total_count=total_count,
             page=result.page,
             page_size=result.page_size,
+            cursor=result.cursor,
+            next_cursor=result.next_cursor,
+            count_strategy=count_strategy,
         )
 
-    def create_data_file(self, file: DataFile, dataset_id: UUID, user_id: UUID) -> None:
-        dataset_db: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id, is_enabled=True
-        )
-
-        if dataset_db is None:
-            raise NotFoundException(f"Dataset not found: {dataset_id}")
+    def suggest_datasets(
+        self, text: str, user_id: UUID, tenancies: list[str] = [], limit: int = 10
+    ) -> list[DatasetSuggestion]:
+        """
+        Typeahead over dataset names: the top `limit` datasets, among the
+        tenancies of the user, whose name matches the partial `text`.
+        """
+        text = (text or "").strip()
+        if not text:
+            return []
 
-        version: DatasetVersionDBModel = self._version_repository.fetch_draft_version(
-            dataset_id=dataset_db.id
+        return self._repository.suggest(
+            term=text,
+            tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
+            limit=max(1, min(20, limit)),
         )
 
-        version.files_in.append(
-            DataFileDBModel(
-                name=file.name,
-                size_bytes=file.size_bytes,
-                extension=file.extension,
-                format=file.format,
-                storage_file_name=file.storage_file_name,
-                storage_path=file.storage_path,
-                created_by=user_id,
+    def _count_datasets(
+        self, query: DatasetQuery, tenancies: list[str]
+    ) -> ReadSteps:
+        """
+        Steps counting the datasets of a search with the requested strategy,
+        returning the count and the strategy that actually produced it.
+        """
+        strategy = query.count_strategy or self._default_count_strategy
+        count = _Query("dataset", "count", dict(query_params=query, tenancies=tenancies))
+
+        if strategy == CountStrategy.ESTIMATED:
+            estimate = yield _Query(
+                "dataset",
+                "estimate_count",
+                dict(query_params=query, tenancies=tenancies),
             )
+            if estimate >= self._count_estimate_threshold:
+                return estimate, CountStrategy.ESTIMATED
+
+        if strategy == CountStrategy.CACHED:
+            key = self._count_cache_key(query=query, tenancies=tenancies)
+            total_count = self._count_cache.get(key)
+            if total_count is not None:
+                return total_count, CountStrategy.CACHED
+
+            total_count = yield count
+            self._count_cache.set(key, total_count)
+            return total_count, CountStrategy.EXACT
+
+        total_count = yield count
+        return total_count, CountStrategy.EXACT
+
+    def _count_cache_key(self, query: DatasetQuery, tenancies: list[str]) -> tuple:
+        """Filters of a search, leaving out paging so every page shares a count."""
+        return (
+            tuple(sorted(category.strip() for category in query.categories)),
+            tuple(sorted(data_type.strip() for data_type in query.data_types)),
+            query.level,
+            query.date_from,
+            query.date_to,
+            query.full_text.strip() if query.full_text else None,
+            query.include_disabled,
+            query.version,
+            query.design_state,
+            query.visibility,
+            tuple(sorted(tenancies)),
         )
 
-        self._version_repository.upsert(version)
+    def create_data_file(self, file: DataFile, dataset_id: UUID, user_id: UUID) -> None:
+        with self._unit_of_work():
+            dataset_db: DatasetDBModel = self._repository.fetch(
+                dataset_id=dataset_id, is_enabled=True, load_plan=DATASET_ONLY
+            )
+
+            if dataset_db is None:
+                raise NotFoundException(f"Dataset not found: {dataset_id}")
+
+            version: DatasetVersionDBModel = (
+                self._version_repository.fetch_draft_version(
+                    dataset_id=dataset_db.id, load_plan=VERSION_ONLY
+                )
+            )
+
+            version.files_in.append(
+                DataFileDBModel(
+                    name=file.name,
+                    size_bytes=file.size_bytes,
+                    extension=file.extension,
+                    format=file.format,
+                    storage_file_name=file.storage_file_name,
+                    storage_path=file.storage_path,
+                    created_by=user_id,
+                )
+            )
+
+            # Attaching a file does not load the files already in the version
+            self._version_repository.upsert(version, refresh=False)
+
+        self._dataset_cache.invalidate(dataset_id)
 
     def publish_dataset_version(
         self,
@@ -492,34 +815,42 @@ class DatasetService:
         version_name: str,
         tenancies: list[str] = [],
     ) -> None:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id,
-            tenancies=self._determine_tenancies(user_id, tenancies),
-        )
-
-        if dataset is None:
-            raise NotFoundException(f"not_found: {dataset_id}")
+        with self._unit_of_work():
+            dataset: DatasetDBModel = self._repository.fetch(
+                dataset_id=dataset_id,
+                tenancies=self._determine_tenancies(user_id, tenancies),
+                load_plan=DATASET_ONLY,
+            )
 
-        version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
-        )
+            if dataset is None:
+                raise NotFoundException(f"not_found: {dataset_id}")
 
-        if version is None:
-            raise NotFoundException(
-                f"not_found: {version_name} for dataset {dataset_id}"
+            version: DatasetVersionDBModel = (
+                self._version_repository.fetch_version_by_name(
+                    dataset_id=dataset_id,
+                    version_name=version_name,
+                    load_plan=VERSION_ONLY,
+                )
             )
 
-        version.design_state = DesignState.PUBLISHED
-        self._version_repository.upsert(dataset_version=version)
+            if version is None:
+                raise NotFoundException(
+                    f"not_found: {version_name} for dataset {dataset_id}"
+                )
+
+            version.design_state = DesignState.PUBLISHED
+            self._version_repository.upsert(dataset_version=version, refresh=False)
 
-        if dataset.design_state == DesignState.DRAFT:
-            dataset.design_state = DesignState.PUBLISHED
-            # Set file_collocation_status to PENDING when dataset is published
-            # This triggers the archivist service to organize files from /staged/
-            # Only set if not already COMPLETED (avoid re-organizing already processed files)
-            if dataset.file_collocation_status != FileCollocationStatus.COMPLETED:
-                dataset.file_collocation_status = FileCollocationStatus.PENDING
-            self._repository.upsert(dataset=dataset)
+            if dataset.design_state == DesignState.DRAFT:
+                dataset.design_state = DesignState.PUBLISHED
+                # Set file_collocation_status to PENDING when dataset is published
+                # This triggers the archivist service to organize files from /staged/
+                # Only set if not already COMPLETED (avoid re-organizing already processed files)
+                if dataset.file_collocation_status != FileCollocationStatus.COMPLETED:
+                    dataset.file_collocation_status = FileCollocationStatus.PENDING
+                self._repository.upsert(dataset=dataset, refresh=False)
+
+        self._dataset_cache.invalidate(dataset_id)
 
     def _create_doi_model(
         self,
@@ -560,13 +891,16 @@ class DatasetService:
         dataset: DatasetDBModel = self._repository.fetch(
             dataset_id=dataset_id,
             tenancies=self._determine_tenancies(user_id, tenancies),
+            load_plan=DATASET_ONLY,
         )
 
         if dataset is None:
             raise NotFoundException(f"not_found: {dataset_id}")
 
         version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
         if version is None:
@@ -598,6 +932,7 @@ class DatasetService:
                     f"DOI created successfully but dataset snapshot publication failed for {dataset_id}-{version_name}: {str(e)}"
                 )
 
+        self._dataset_cache.invalidate(dataset_id)
         return created_doi
 
     def change_doi_state(
@@ -611,13 +946,16 @@ class DatasetService:
         dataset: DatasetDBModel = self._repository.fetch(
             dataset_id=dataset_id,
             tenancies=self._determine_tenancies(user_id, tenancies),
+            load_plan=DATASET_ONLY,
         )
 
         if dataset is None:
             raise NotFoundException(f"not_found: {dataset_id}")
 
         version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
         if version is None:
@@ -649,6 +987,8 @@ class DatasetService:
                     f"DOI state changed successfully but dataset publication failed for {dataset_id}-{version_name}: {str(e)}"
                 )
 
+        self._dataset_cache.invalidate(dataset_id)
+
     def get_doi(
         self,
         dataset_id: UUID,
@@ -659,13 +999,16 @@ class DatasetService:
         dataset: DatasetDBModel = self._repository.fetch(
             dataset_id=dataset_id,
             tenancies=self._determine_tenancies(user_id, tenancies),
+            load_plan=DATASET_ONLY,
         )
 
         if dataset is None:
             raise NotFoundException(f"not_found: {dataset_id}")
 
         version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
         if version is None:
@@ -688,13 +1031,16 @@ class DatasetService:
         dataset: DatasetDBModel = self._repository.fetch(
             dataset_id=dataset_id,
             tenancies=self._determine_tenancies(user_id, tenancies),
+            load_plan=DATASET_ONLY,
         )
 
         if dataset is None:
             raise NotFoundException(f"not_found: {dataset_id}")
 
         version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
         if version is None:
@@ -706,6 +1052,7 @@ class DatasetService:
             raise NotFoundException(f"not_found: DOI for version {version_name}")
 
         self._doi_service.delete(identifier=version.doi.identifier)
+        self._dataset_cache.invalidate(dataset_id)
 
     def get_file_download_url(
         self,
@@ -715,17 +1062,19 @@ class DatasetService:
         user_id: UUID,
         tenancies: list[str] = [],
     ) -> str:
-        dataset: DatasetDBModel = self.fetch_dataset(
+        dataset: DatasetDBModel = self._repository.fetch(
             dataset_id=dataset_id,
-            user_id=user_id,
             tenancies=self._determine_tenancies(user_id, tenancies),
+            load_plan=DATASET_ONLY,
         )
 
         if dataset is None:
             raise NotFoundException(f"not_found: {dataset_id}")
 
         version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_FILES,
         )
 
         if version is None:
@@ -755,30 +1104,39 @@ class DatasetService:
         tenancies: list[str] = [],
         datafilesPreviouslyUploaded: list[str] = [],
     ) -> DatasetVersion:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id,
-            tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
-            version_is_enabled=False,
-        )
+        with self._unit_of_work():
+            dataset: DatasetDBModel = self._repository.fetch(
+                dataset_id=dataset_id,
+                tenancies=self._determine_tenancies(
+                    user_id=user_id, tenancies=tenancies
+                ),
+                version_is_enabled=False,
+                load_plan=DATASET_WITH_VERSIONS,
+            )
 
-        if dataset is None:
-            raise NotFoundException(f"not_found: {dataset_id}")
+            if dataset is None:
+                raise NotFoundException(f"not_found: {dataset_id}")
 
-        current_version = self._get_current_dataset_version(dataset.versions)
-        if current_version.design_state == DesignState.DRAFT:
-            current_version.is_enabled = False
-            self._version_repository.upsert(current_version)
+            current_version = self._get_current_dataset_version(dataset)
+            if current_version is None:
+                raise IllegalStateException("dataset_has_no_current_version")
 
-        new_version = self._create_new_version(dataset_db=dataset, user_id=user_id)
-        new_version.dataset_id = dataset_id
-        for file_id in datafilesPreviouslyUploaded:
-            new_version.files_in.append(
-                self._data_file_repository.fetch_by_id(id=file_id)
-            )
+            if current_version.design_state == DesignState.DRAFT:
+                current_version.is_enabled = False
+                self._version_repository.upsert(current_version, refresh=False)
+
+            new_version = self._create_new_version(dataset_db=dataset, user_id=user_id)
+            new_version.dataset_id = dataset_id
+            for file_id in datafilesPreviouslyUploaded:
+                new_version.files_in.append(
+                    self._data_file_repository.fetch_by_id(id=file_id)
+                )
 
-        self._version_repository.upsert(dataset_version=new_version)
+            self._version_repository.upsert(dataset_version=new_version)
+            created = self._adapt_version(version=new_version)
 
-        return self._adapt_version(version=new_version)
+        self._dataset_cache.invalidate(dataset_id)
+        return created
 
     def fetch_dataset_version(
         self,
@@ -787,43 +1145,135 @@ class DatasetService:
         user_id: UUID,
         tenancies: list[str] = [],
     ) -> Dataset:
-        dataset: DatasetDBModel = self._repository.fetch(
-            dataset_id=dataset_id,
-            tenancies=self._determine_tenancies(user_id=user_id, tenancies=tenancies),
+        return self._run(
+            self._fetch_dataset_version(
+                dataset_id=dataset_id,
+                version_name=version_name,
+                user_id=user_id,
+                tenancies=tenancies,
+            )
         )
 
-        if dataset is None:
-            raise NotFoundException(f"not_found: {dataset_id}")
-
-        version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
+    async def fetch_dataset_version_async(
+        self,
+        dataset_id: UUID,
+        version_name: str,
+        user_id: UUID,
+        tenancies: list[str] = [],
+    ) -> Dataset:
+        """`fetch_dataset_version` on the async repositories."""
+        return await self._run_async(
+            self._fetch_dataset_version(
+                dataset_id=dataset_id,
+                version_name=version_name,
+                user_id=user_id,
+                tenancies=tenancies,
+            )
         )
 
-        if version is None:
-            raise NotFoundException(
-                f"not_found: {version_name} for dataset {dataset_id}"
+    def _fetch_dataset_version(
+        self,
+        dataset_id: UUID,
+        version_name: str,
+        user_id: UUID,
+        tenancies: list[str],
+    ) -> ReadSteps:
+        tenancies = yield _Tenancies(user_id=user_id, tenancies=tenancies)
+
+        def load() -> ReadSteps:
+            dataset: DatasetDBModel = yield _Query(
+                "dataset",
+                "fetch",
+                dict(dataset_id=dataset_id, tenancies=tenancies, load_plan=DATASET_ONLY),
             )
 
-        return self._adapt_dataset_version(dataset=dataset, dataset_version=version)
+            if dataset is None:
+                raise NotFoundException(f"not_found: {dataset_id}")
+
+            version: DatasetVersionDBModel = yield _Query(
+                "version",
+                "fetch_version_by_name",
+                dict(dataset_id=dataset_id, version_name=version_name),
+            )
+
+            if version is None:
+                raise NotFoundException(
+                    f"not_found: {version_name} for dataset {dataset_id}"
+                )
+
+            return self._adapt_dataset_version(dataset=dataset, dataset_version=version)
+
+        dataset = yield _Cached(
+            dataset_id, options=("version", version_name), load=load()
+        )
+
+        if dataset.tenancy not in tenancies:
+            raise NotFoundException(f"not_found: {dataset_id}")
+
+        return dataset
+
+    def _run(self, steps: ReadSteps) -> Any:
+        """Runs the steps of a read on the sync repositories."""
+        result = None
+        while True:
+            try:
+                step = steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+
+            if isinstance(step, _Tenancies):
+                result = self._determine_tenancies(
+                    user_id=step.user_id, tenancies=step.tenancies
+                )
+            elif isinstance(step, _Cached):
+                result = self._dataset_cache.get_or_load(
+                    step.dataset_id,
+                    options=step.options,
+                    load=lambda: self._run(step.load),
+                )
+            else:
+                repository = (
+                    self._repository
+                    if step.repository == "dataset"
+                    else self._version_repository
+                )
+                result = getattr(repository, step.method)(**step.kwargs)
+
+    async def _run_async(self, steps: ReadSteps) -> Any:
+        """Runs the steps of a read on the async repositories."""
+        result = None
+        while True:
+            try:
+                step = steps.send(result)
+            except StopIteration as stop:
+                return stop.value
+
+            if isinstance(step, _Tenancies):
+                result = await self._determine_tenancies_async(
+                    user_id=step.user_id, tenancies=step.tenancies
+                )
+            elif isinstance(step, _Cached):
+                result = await self._dataset_cache.get_or_load_async(
+                    step.dataset_id,
+                    options=step.options,
+                    load=lambda: self._run_async(step.load),
+                )
+            else:
+                repository = (
+                    self._async_repository
+                    if step.repository == "dataset"
+                    else self._async_version_repository
+                )
+                result = await getattr(repository, step.method)(**step.kwargs)
 
     def _get_latest_published_version(
         self, dataset: DatasetDBModel
     ) -> DatasetVersionDBModel:
         """
         Get the latest published version of a dataset based on max(created_at).
-        Returns the version with the most recent created_at that has a published DOI.
+        The dataset points to the most recent enabled version that has a DOI.
         """
-        published_versions = [
-            version
-            for version in dataset.versions
-            if version.is_enabled and version.doi is not None
-        ]
-
-        if not published_versions:
-            return None
-
-        # Sort by created_at descending and return the first (latest)
-        return max(published_versions, key=lambda v: v.created_at)
+        return self._find_version(dataset, dataset.latest_published_version_id)
 
     def _update_dataset_visibility(self, dataset: DatasetDBModel) -> None:
         """
@@ -861,47 +1311,22 @@ class DatasetService:
             }
         )
 
-        # Add datafiles summary
-        files = version.files_in or []
-
-        # Calculate extension breakdown
-        extension_stats = {}
-        total_files = len(files)
-        total_size = 0
-
-        for file in files:
-            # Extract file extension (including dot)
-            if "." in file.name and len(file.name.split(".")) > 1:
-                file_extension = "." + file.name.split(".")[-1]
-            else:
-                file_extension = "(no extension)"
-
-            # Initialize stats for this extension if not exists
-            if file_extension not in extension_stats:
-                extension_stats[file_extension] = {"count": 0, "total_size_bytes": 0}
-
-            # Update stats
-            extension_stats[file_extension]["count"] += 1
-            file_size = file.size_bytes or 0
-            extension_stats[file_extension]["total_size_bytes"] += file_size
-            total_size += file_size
-
-        # Convert to list format
+        # Add datafiles summary, aggregated per version by the database
         extensions_breakdown = [
             {
                 "extension": ext,
                 "count": stats["count"],
                 "total_size_bytes": stats["total_size_bytes"],
             }
-            for ext, stats in extension_stats.items()
+            for ext, stats in (version.files_extensions or {}).items()
         ]
 
         # Sort by count descending, then by extension name
         extensions_breakdown.sort(key=lambda x: (-x["count"], x["extension"]))
 
         snapshot["files_summary"] = {
-            "total_files": total_files,
-            "total_size_bytes": total_size,
+            "total_files": version.files_count or 0,
+            "total_size_bytes": version.files_size_in_bytes or 0,
             "extensions_breakdown": extensions_breakdown,
         }
 
@@ -944,6 +1369,7 @@ class DatasetService:
         dataset: DatasetDBModel = self._repository.fetch(
             dataset_id=dataset_id,
             tenancies=self._determine_tenancies(user_id, tenancies),
+            load_plan=DATASET_WITH_VERSIONS,
         )
 
         if dataset is None:
@@ -951,7 +1377,9 @@ class DatasetService:
 
         # Find the specific version
         version: DatasetVersionDBModel = self._version_repository.fetch_version_by_name(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
         if version is None:
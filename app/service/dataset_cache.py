@@ -0,0 +1,285 @@
+import dataclasses
+import enum
+import itertools
+import json
+import logging
+import typing
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Hashable, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.cache import TTLCache
+from app.model.dataset import Dataset
+
+DATASET_CHANGED_CHANNEL = "dataset_changed"
+
+try:
+    import redis
+except ImportError:  # Only needed when DATASET_CACHE_REDIS_URL is set
+    redis = None
+
+
+def connect_redis(url: Optional[str]) -> Optional[Any]:
+    """Client of the shared dataset cache, None when it is not configured."""
+    if not url:
+        return None
+    if redis is None:
+        raise RuntimeError(
+            "DATASET_CACHE_REDIS_URL is set but the redis package is not installed"
+        )
+    return redis.Redis.from_url(url)
+
+
+class DatasetCache:
+    """
+    Versioned cache of adapted `Dataset` objects, keyed by the dataset id, its
+    generation and the options of the read (e.g. the version filters).
+
+    Every mutation of a dataset bumps its generation with `invalidate`, which
+    leaves the entries of older generations unreachable until they expire.
+    The generation is read before loading, so a load racing with a mutation
+    is stored under the old generation and never served.
+
+    Entries live in a process-local LRU. With a Redis client the generations
+    and the entries, serialized as JSON, are also shared between processes,
+    the local LRU then only saves the deserialization of entries. Without one,
+    invalidations are published on the `dataset_changed` channel and applied
+    by the other processes through `on_notification`.
+    """
+
+    def __init__(
+        self,
+        local: TTLCache,
+        generations: TTLCache,
+        ttl_seconds: int,
+        redis_client: Optional[Any] = None,
+        engine: Optional[Engine] = None,
+        key_prefix: str = "gatekeeper:dataset",
+    ) -> None:
+        self._logger = logging.getLogger("service:DatasetCache")
+        self._local = local
+        self._generations = generations
+        self._ttl_seconds = ttl_seconds
+        self._redis = redis_client
+        self._engine = engine
+        self._key_prefix = key_prefix
+        self._origin = uuid4().hex
+        # Process-wide, a generation forgotten by the LRU is never reused
+        self._next_generation = itertools.count(1)
+
+    def get_or_load(
+        self,
+        dataset_id: UUID | str,
+        options: tuple[Hashable, ...],
+        load: Callable[[], Optional[Dataset]],
+    ) -> Optional[Dataset]:
+        """
+        Cached result of `load` for the dataset and options. Results of None,
+        and exceptions, are not cached.
+        """
+        key = _dataset_key(dataset_id)
+        generation = self._generation(key) if key is not None else None
+        if generation is None:
+            return load()
+
+        dataset = self._get(key, generation, options)
+        if dataset is None:
+            dataset = load()
+            if dataset is not None:
+                self._set(key, generation, options, dataset)
+        return dataset
+
+    async def get_or_load_async(
+        self,
+        dataset_id: UUID | str,
+        options: tuple[Hashable, ...],
+        load: Callable[[], Awaitable[Optional[Dataset]]],
+    ) -> Optional[Dataset]:
+        """`get_or_load` with a coroutine function loading the dataset."""
+        key = _dataset_key(dataset_id)
+        generation = self._generation(key) if key is not None else None
+        if generation is None:
+            return await load()
+
+        dataset = self._get(key, generation, options)
+        if dataset is None:
+            dataset = await load()
+            if dataset is not None:
+                self._set(key, generation, options, dataset)
+        return dataset
+
+    def invalidate(self, dataset_id: UUID | str) -> None:
+        key = _dataset_key(dataset_id)
+        if key is None:
+            return
+
+        if self._redis is None:
+            self._generations.set(key, next(self._next_generation))
+            self._publish(key)
+            return
+
+        try:
+            self._redis.incr(self._generation_key(key))
+        except Exception:
+            self._logger.exception(
+                f"Failed to invalidate shared cache of dataset {key}, "
+                f"stale reads until its entries expire"
+            )
+
+    def on_notification(self, payload: str) -> None:
+        # An empty payload means notifications may have been missed
+        if not payload:
+            self._generations.clear()
+            return
+
+        message = json.loads(payload)
+        if message.get("origin") == self._origin:
+            return
+
+        key = _dataset_key(message["dataset_id"])
+        if key is not None:
+            self._generations.set(key, next(self._next_generation))
+
+    def _publish(self, key: str) -> None:
+        if self._engine is None:
+            return
+
+        try:
+            with self._engine.begin() as connection:
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {
+                        "channel": DATASET_CHANGED_CHANNEL,
+                        "payload": json.dumps(
+                            {"dataset_id": key, "origin": self._origin}
+                        ),
+                    },
+                )
+        except Exception:
+            self._logger.exception(
+                f"Failed to publish invalidation of dataset {key}, "
+                f"other processes serve it until their entries expire"
+            )
+
+    def _generation(self, key: str) -> Optional[int]:
+        if self._redis is not None:
+            try:
+                return int(self._redis.get(self._generation_key(key)) or 0)
+            except Exception:
+                self._logger.exception("Failed to read shared dataset generation")
+                return None
+
+        generation = self._generations.get(key)
+        if generation is None:
+            generation = next(self._next_generation)
+            self._generations.set(key, generation)
+        return generation
+
+    def _get(
+        self, key: str, generation: int, options: tuple[Hashable, ...]
+    ) -> Optional[Dataset]:
+        dataset = self._local.get((key, generation, options))
+        if dataset is not None or self._redis is None:
+            return dataset
+
+        try:
+            payload = self._redis.get(self._entry_key(key, generation, options))
+        except Exception:
+            self._logger.exception("Failed to read shared dataset cache")
+            return None
+        if payload is None:
+            return None
+
+        try:
+            dataset = _decode(Dataset, json.loads(payload))
+        except (ValueError, TypeError, KeyError):
+            self._logger.exception("Ignoring unreadable shared dataset cache entry")
+            return None
+        self._local.set((key, generation, options), dataset)
+        return dataset
+
+    def _set(
+        self,
+        key: str,
+        generation: int,
+        options: tuple[Hashable, ...],
+        dataset: Dataset,
+    ) -> None:
+        self._local.set((key, generation, options), dataset)
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.set(
+                self._entry_key(key, generation, options),
+                json.dumps(_encode(dataset)),
+                ex=self._ttl_seconds,
+            )
+        except Exception:
+            self._logger.exception("Failed to write shared dataset cache")
+
+    def _generation_key(self, key: str) -> str:
+        return f"{self._key_prefix}:{key}:generation"
+
+    def _entry_key(
+        self, key: str, generation: int, options: tuple[Hashable, ...]
+    ) -> str:
+        return f"{self._key_prefix}:{key}:{generation}:" + ":".join(
+            str(option) for option in options
+        )
+
+
+def _dataset_key(dataset_id: UUID | str) -> Optional[str]:
+    """Canonical form of a dataset id, None when it is not a UUID."""
+    try:
+        return str(UUID(str(dataset_id)))
+    except ValueError:
+        return None
+
+
+def _encode(value: Any) -> Any:
+    """JSON-compatible form of a domain dataclass, see `_decode`."""
+    if dataclasses.is_dataclass(value):
+        return {
+            field.name: _encode(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    return value
+
+
+def _decode(hint: Any, value: Any) -> Any:
+    """Rebuilds a value of the annotated type from the output of `_encode`."""
+    if value is None:
+        return None
+    if typing.get_origin(hint) is list:
+        (item_hint,) = typing.get_args(hint)
+        return [_decode(item_hint, item) for item in value]
+    if dataclasses.is_dataclass(hint):
+        hints = typing.get_type_hints(hint)
+        return hint(
+            **{
+                field.name: _decode(hints[field.name], value[field.name])
+                for field in dataclasses.fields(hint)
+                if field.name in value
+            }
+        )
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        return hint[value]
+    if hint is UUID:
+        return UUID(value)
+    if hint is datetime:
+        return datetime.fromisoformat(value)
+    return value
@@ -0,0 +1,273 @@
+import json
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+from app.cache import TTLCache
+from app.model.dataset import (
+    DataFile,
+    Dataset,
+    DatasetVersion,
+    DesignState,
+    VisibilityStatus,
+)
+from app.model.doi import DOI, Mode, State, Title
+from app.service.dataset_cache import DATASET_CHANGED_CHANNEL, DatasetCache
+
+
+class FakeRedis:
+    """Subset of the redis client used by the cache, kept in a dict."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+def _cache(redis_client=None, engine=None) -> DatasetCache:
+    return DatasetCache(
+        local=TTLCache(max_size=10, ttl_seconds=60),
+        generations=TTLCache(max_size=10, ttl_seconds=60),
+        ttl_seconds=60,
+        redis_client=redis_client,
+        engine=engine,
+    )
+
+
+class TestDatasetCache(unittest.TestCase):
+    def setUp(self):
+        self.dataset_id = uuid4()
+        self.dataset = Dataset(name="dataset", data={}, id=self.dataset_id)
+        self.load = Mock(return_value=self.dataset)
+
+    def test_loads_once(self):
+        cache = _cache()
+
+        first = cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+        second = cache.get_or_load(str(self.dataset_id), ("dataset",), self.load)
+
+        self.assertIs(first, self.dataset)
+        self.assertIs(second, self.dataset)
+        self.load.assert_called_once()
+
+    def test_options_are_cached_separately(self):
+        cache = _cache()
+
+        cache.get_or_load(self.dataset_id, ("dataset", True), self.load)
+        cache.get_or_load(self.dataset_id, ("dataset", False), self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_invalidate_reloads(self):
+        cache = _cache()
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        cache.invalidate(self.dataset_id)
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_load_racing_with_invalidate_is_not_served(self):
+        cache = _cache()
+
+        def load_then_mutate():
+            # A mutation commits while the read is loading the old state
+            cache.invalidate(self.dataset_id)
+            return self.dataset
+
+        cache.get_or_load(self.dataset_id, ("dataset",), load_then_mutate)
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.load.assert_called_once()
+
+    def test_does_not_cache_none(self):
+        cache = _cache()
+        load = Mock(return_value=None)
+
+        cache.get_or_load(self.dataset_id, ("dataset",), load)
+        cache.get_or_load(self.dataset_id, ("dataset",), load)
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_bypasses_ids_that_are_not_uuids(self):
+        cache = _cache()
+
+        cache.get_or_load("not-a-uuid", ("dataset",), self.load)
+        cache.get_or_load("not-a-uuid", ("dataset",), self.load)
+        cache.invalidate("not-a-uuid")
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_invalidate_publishes_without_redis(self):
+        engine = MagicMock()
+        connection = engine.begin.return_value.__enter__.return_value
+        cache = _cache(engine=engine)
+
+        cache.invalidate(self.dataset_id)
+
+        params = connection.execute.call_args.args[1]
+        self.assertEqual(params["channel"], DATASET_CHANGED_CHANNEL)
+        self.assertEqual(
+            json.loads(params["payload"])["dataset_id"], str(self.dataset_id)
+        )
+
+    def test_notified_invalidation_reloads_in_other_processes(self):
+        engine = MagicMock()
+        connection = engine.begin.return_value.__enter__.return_value
+        first, second = _cache(engine=engine), _cache(engine=engine)
+        second.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        first.invalidate(self.dataset_id)
+        payload = connection.execute.call_args.args[1]["payload"]
+        first.on_notification(payload)
+        second.on_notification(payload)
+        second.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_own_notifications_are_ignored(self):
+        engine = MagicMock()
+        connection = engine.begin.return_value.__enter__.return_value
+        cache = _cache(engine=engine)
+
+        cache.invalidate(self.dataset_id)
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+        cache.on_notification(connection.execute.call_args.args[1]["payload"])
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.load.assert_called_once()
+
+    def test_missed_notifications_reload_every_dataset(self):
+        cache = _cache()
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        cache.on_notification("")
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_publish_failures_keep_local_invalidation(self):
+        engine = MagicMock()
+        engine.begin.side_effect = ConnectionError()
+        cache = _cache(engine=engine)
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        cache.invalidate(self.dataset_id)
+        cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_shares_entries_and_invalidations_through_redis(self):
+        redis_client = FakeRedis()
+        first, second = _cache(redis_client), _cache(redis_client)
+
+        first.get_or_load(self.dataset_id, ("dataset",), self.load)
+        shared = second.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.load.assert_called_once()
+        self.assertEqual(shared, self.dataset)
+
+        second.invalidate(self.dataset_id)
+        first.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_shared_entries_are_json(self):
+        redis_client = FakeRedis()
+        version = DatasetVersion(
+            name="1",
+            is_enabled=True,
+            created_at=datetime(2026, 10, 18, tzinfo=timezone.utc),
+            updated_at=None,
+            id=uuid4(),
+            design_state=DesignState.PUBLISHED,
+            files_in=[DataFile(name="file.csv", size_bytes=10, id=uuid4())],
+            doi=DOI(mode=Mode.AUTO, state=State.FINDABLE, title=Title(title="t")),
+        )
+        dataset = Dataset(
+            name="dataset",
+            data={"category": "AEROSOLS", "tags": [None]},
+            id=self.dataset_id,
+            visibility=VisibilityStatus.PUBLIC,
+            versions=[version],
+            current_version=version,
+        )
+
+        _cache(redis_client).get_or_load(
+            self.dataset_id, ("dataset",), Mock(return_value=dataset)
+        )
+        shared = _cache(redis_client).get_or_load(
+            self.dataset_id, ("dataset",), self.load
+        )
+
+        entry = next(
+            value
+            for key, value in redis_client.values.items()
+            if not key.endswith(":generation")
+        )
+        self.assertEqual(json.loads(entry)["visibility"], "PUBLIC")
+        self.assertEqual(shared, dataset)
+        self.load.assert_not_called()
+
+    def test_unreadable_shared_entries_are_loaded(self):
+        redis_client = FakeRedis()
+        _cache(redis_client).get_or_load(self.dataset_id, ("dataset",), self.load)
+        for key in redis_client.values:
+            if not key.endswith(":generation"):
+                redis_client.values[key] = b"not json"
+
+        result = _cache(redis_client).get_or_load(
+            self.dataset_id, ("dataset",), self.load
+        )
+
+        self.assertIs(result, self.dataset)
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_redis_failures_fall_back_to_load(self):
+        redis_client = Mock()
+        redis_client.get.side_effect = ConnectionError()
+        cache = _cache(redis_client)
+
+        result = cache.get_or_load(self.dataset_id, ("dataset",), self.load)
+
+        self.assertIs(result, self.dataset)
+        redis_client.set.assert_not_called()
+
+
+class TestDatasetCacheAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_async_loads_share_entries_with_sync_loads(self):
+        dataset_id = uuid4()
+        dataset = Dataset(name="dataset", data={}, id=dataset_id)
+        load = AsyncMock(return_value=dataset)
+        cache = _cache()
+
+        first = await cache.get_or_load_async(dataset_id, ("dataset",), load)
+        second = cache.get_or_load(dataset_id, ("dataset",), Mock())
+
+        self.assertIs(first, dataset)
+        self.assertIs(second, dataset)
+        load.assert_awaited_once()
+
+    async def test_async_load_after_invalidate(self):
+        dataset_id = uuid4()
+        load = AsyncMock(return_value=Dataset(name="dataset", data={}, id=dataset_id))
+        cache = _cache()
+
+        await cache.get_or_load_async(dataset_id, ("dataset",), load)
+        cache.invalidate(dataset_id)
+        await cache.get_or_load_async(dataset_id, ("dataset",), load)
+
+        self.assertEqual(load.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,8 +6,10 @@ from app.exception.not_found import NotFoundException
 from app.exception.bad_request import BadRequestException
 from app.repository.dataset import DatasetRepository
 from app.repository.datafile import DataFileRepository
+from app.repository.load_plan import DATASET_ONLY, DATASET_WITH_VERSIONS
 from app.model.dataset import FileCollocationStatus
 from app.model.db.dataset import Dataset as DatasetDBModel, DataFile as DataFileDBModel
+from app.service.dataset_cache import DatasetCache
 
 
 class DatasetCollocationService:
@@ -17,10 +19,12 @@ class DatasetCollocationService:
         self,
         dataset_repository: DatasetRepository,
         datafile_repository: DataFileRepository,
+        dataset_cache: DatasetCache,
     ):
         self._logger = logging.getLogger("service:DatasetCollocationService")
         self._dataset_repository = dataset_repository
         self._datafile_repository = datafile_repository
+        self._dataset_cache = dataset_cache
 
     def get_pending_datasets(self) -> List[DatasetDBModel]:
         """
@@ -29,7 +33,8 @@ class DatasetCollocationService:
         """
         self._logger.info("Fetching datasets pending file collocation")
         datasets = self._dataset_repository.fetch_by_collocation_status(
-            statuses=[None, FileCollocationStatus.PENDING]
+            statuses=[None, FileCollocationStatus.PENDING],
+            load_plan=DATASET_WITH_VERSIONS,
         )
         self._logger.info(f"Found {len(datasets)} datasets pending collocation")
         return datasets
@@ -40,10 +45,12 @@ class DatasetCollocationService:
         """
         self._logger.info(f"Fetching files for dataset {dataset_id}")
 
-        dataset = self._dataset_repository.fetch(dataset_id=dataset_id)
+        dataset = self._dataset_repository.fetch(
+            dataset_id=dataset_id, load_plan=DATASET_ONLY
+        )
         if not dataset:
             dataset = self._dataset_repository.fetch(
-                dataset_id=dataset_id, is_enabled=False
+                dataset_id=dataset_id, is_enabled=False, load_plan=DATASET_ONLY
             )
             if not dataset:
                 raise NotFoundException(f"Dataset not found: {dataset_id}")
@@ -83,16 +90,20 @@ class DatasetCollocationService:
                 f"Invalid status: {status}. Must be one of: {[s.value for s in FileCollocationStatus]}"
             )
 
-        dataset = self._dataset_repository.fetch(dataset_id=dataset_id)
+        dataset = self._dataset_repository.fetch(
+            dataset_id=dataset_id, load_plan=DATASET_ONLY
+        )
         if not dataset:
             dataset = self._dataset_repository.fetch(
-                dataset_id=dataset_id, is_enabled=False
+                dataset_id=dataset_id, is_enabled=False, load_plan=DATASET_ONLY
             )
             if not dataset:
                 raise NotFoundException(f"Dataset not found: {dataset_id}")
 
         dataset.file_collocation_status = status_enum
-        self._dataset_repository.upsert(dataset=dataset)
+        self._dataset_repository.upsert(dataset=dataset, refresh=False)
+        # The archivist moved the files, cached reads hold their old paths
+        self._dataset_cache.invalidate(dataset_id)
         self._logger.info(
             f"Successfully updated file collocation status for dataset {dataset_id}"
         )
@@ -2,20 +2,29 @@ from dataclasses import dataclass
 import datetime
 import json
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 from app.exception.bad_request import BadRequestException
 from app.exception.illegal_state import IllegalStateException
 from app.exception.not_found import NotFoundException
 from app.exception.unauthorized import UnauthorizedException
 from app.gateway.object_storage.object_storage import ObjectStorageGateway
-from app.model.tenancy import Tenancy
+from app.repository.aio.dataset import AsyncDatasetRepository
+from app.repository.aio.dataset_version import AsyncDatasetVersionRepository
 from app.repository.datafile import DataFileRepository
 from app.repository.dataset import DatasetRepository
 from app.repository.dataset_version import DatasetVersionRepository
+from app.repository.load_plan import (
+    DATASET_ONLY,
+    DATASET_WITH_VERSIONS,
+    VERSION_WITH_DOI,
+    VERSION_WITH_FILES,
+)
 from app.service.doi import DOIService
-from app.service.tenancy import TenancyService
-from app.service.user import UserService
+from app.service.tenancy_registry import TenancyRegistry
+from app.service.auth_context import AuthContextService
+from app.service.available_filters import AvailableFilters
+from app.service.dataset_cache import DatasetCache
 from app.model.dataset import (
     Dataset,
     DatasetQuery,
@@ -24,6 +33,8 @@ from app.model.dataset import (
     DesignState,
     VisibilityStatus,
     PaginatedResult,
+    CountStrategy,
+    DatasetSuggestion,
 )
 from app.model.db.dataset import (
     Dataset as DatasetDBModel,
@@ -32,7 +43,7 @@ from app.model.db.dataset import (
 )
 from app.model.db.doi import DOI as DOIDBModel
 from app.service.dataset import DatasetService
-from app.model.user import User
+from app.model.auth_context import AuthContext
 from app.model.doi import (
     DOI,
     State as DOIState,
@@ -42,6 +53,7 @@ from app.model.doi import (
     Mode as DOIMode,
 )
 from app.adapter import doi as DOIAdapter
+from app.cache import TTLCache
 
 
 class TestDatasetService(unittest.TestCase):
@@ -49,30 +61,54 @@ class TestDatasetService(unittest.TestCase):
         self.dataset_repository = Mock(spec=DatasetRepository)
         self.dataset_version_repository = Mock(spec=DatasetVersionRepository)
         self.data_file_repository = Mock(spec=DataFileRepository)
-        self.user_service = Mock(spec=UserService)
+        self.auth_context_service = Mock(spec=AuthContextService)
         self.doi_service = Mock(spec=DOIService)
         self.minio_gateway = Mock(spec=ObjectStorageGateway)
-        self.tenancy_service = Mock(spec=TenancyService)
+        self.tenancy_registry = Mock(spec=TenancyRegistry)
+        self.count_cache = TTLCache(max_size=10, ttl_seconds=60)
+        self.facet_cache = TTLCache(max_size=10, ttl_seconds=60)
+        self.available_filters = Mock(spec=AvailableFilters)
+        self.available_filters.normalize_data.side_effect = lambda data: data
+        self.available_filters.normalize_value.side_effect = lambda key, value: value
+        self.unit_of_work = MagicMock()
+        self.dataset_cache = DatasetCache(
+            local=TTLCache(max_size=10, ttl_seconds=60),
+            generations=TTLCache(max_size=10, ttl_seconds=60),
+            ttl_seconds=60,
+        )
         self.dataset_service = DatasetService(
             repository=self.dataset_repository,
             version_repository=self.dataset_version_repository,
             data_file_repository=self.data_file_repository,
-            user_service=self.user_service,
+            auth_context_service=self.auth_context_service,
             doi_service=self.doi_service,
             minio_gateway=self.minio_gateway,
-            tenancy_service=self.tenancy_service,
+            tenancy_registry=self.tenancy_registry,
             dataset_bucket="dataset_bucket",
+            count_cache=self.count_cache,
+            default_count_strategy="cached",
+            count_estimate_threshold=1000,
+            facet_cache=self.facet_cache,
+            available_filters=self.available_filters,
+            unit_of_work=self.unit_of_work,
+            dataset_cache=self.dataset_cache,
+        )
+
+    def mock_auth_context(self, tenancies, disabled_tenancies=[]):
+        return AuthContext(
+            user_id=uuid4(),
+            tenancies={
+                **{tenancy: True for tenancy in tenancies},
+                **{tenancy: False for tenancy in disabled_tenancies},
+            },
         )
 
-    def mock_user(self, tenancies):
-        user = Mock(spec=User)
-        user.tenancies = tenancies
-        return user
-
     def test_fetch_dataset_not_found(self):
         dataset_id = uuid4()
         user_id = uuid4()
-        self.user_service.fetch_by_id.return_value = self.mock_user(["tenancy1"])
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
         self.dataset_repository.fetch.return_value = None
 
         result = self.dataset_service.fetch_dataset(
@@ -98,7 +134,10 @@ class TestDatasetService(unittest.TestCase):
         mocked_version.visibility = VisibilityStatus.PUBLIC
 
         dataset_db.versions = [mocked_version]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        dataset_db.tenancy = "tenancy1"
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = dataset_db
 
         result = self.dataset_service.fetch_dataset(
@@ -107,6 +146,69 @@ class TestDatasetService(unittest.TestCase):
         self.assertIsNotNone(result)
         self.dataset_repository.fetch.assert_called_once()
 
+    def _cached_dataset_fixture(self, tenancy: str) -> Mock:
+        dataset_db = Mock(spec=DatasetDBModel)
+        dataset_db.id = uuid4()
+        dataset_db.tenancy = tenancy
+        dataset_db.versions = []
+        dataset_db.current_version_id = None
+        self.dataset_repository.fetch.return_value = dataset_db
+        return dataset_db
+
+    def test_fetch_dataset_is_served_from_cache(self):
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        dataset_db = self._cached_dataset_fixture("tenancy1")
+
+        first = self.dataset_service.fetch_dataset(
+            dataset_id=dataset_db.id, user_id=uuid4(), tenancies=["tenancy1"]
+        )
+        second = self.dataset_service.fetch_dataset(
+            dataset_id=dataset_db.id, user_id=uuid4(), tenancies=["tenancy1"]
+        )
+
+        self.assertEqual(first, second)
+        self.dataset_repository.fetch.assert_called_once()
+
+    def test_fetch_dataset_cached_checks_tenancy(self):
+        dataset_db = self._cached_dataset_fixture("tenancy1")
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        self.dataset_service.fetch_dataset(
+            dataset_id=dataset_db.id, user_id=uuid4(), tenancies=["tenancy1"]
+        )
+
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy2"]
+        )
+        result = self.dataset_service.fetch_dataset(
+            dataset_id=dataset_db.id, user_id=uuid4(), tenancies=["tenancy2"]
+        )
+
+        self.assertIsNone(result)
+        self.dataset_repository.fetch.assert_called_once()
+
+    def test_fetch_dataset_reloads_after_mutation(self):
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        dataset_db = self._cached_dataset_fixture("tenancy1")
+        self.dataset_service.fetch_dataset(
+            dataset_id=dataset_db.id, user_id=uuid4(), tenancies=["tenancy1"]
+        )
+
+        self.dataset_service.disable_dataset(
+            dataset_id=dataset_db.id, tenancies=["tenancy1"]
+        )
+        self.dataset_service.fetch_dataset(
+            dataset_id=dataset_db.id, user_id=uuid4(), tenancies=["tenancy1"]
+        )
+
+        # fetch of the first read, of the mutation and of the reload
+        self.assertEqual(self.dataset_repository.fetch.call_count, 3)
+
     def test_fetch_dataset_by_user_not_found(self):
         dataset_id = uuid4()
         user_id = uuid4()
@@ -116,7 +218,9 @@ class TestDatasetService(unittest.TestCase):
         mocked_version.files = [Mock(spec=DataFileDBModel)]
         mocked_version.files_in = [Mock(spec=DataFileDBModel)]
         dataset_db.versions = [mocked_version]
-        self.user_service.fetch_by_id.side_effect = NotFoundException("user not found")
+        self.auth_context_service.resolve.side_effect = NotFoundException(
+            "user not found"
+        )
 
         # when + then
         with self.assertRaises(UnauthorizedException):
@@ -128,7 +232,9 @@ class TestDatasetService(unittest.TestCase):
         dataset_id = uuid4()
         user_id = uuid4()
         tenancies = ["tenancy1"]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = None
         dataset = Mock(spec=Dataset)
 
@@ -145,7 +251,9 @@ class TestDatasetService(unittest.TestCase):
         dataset_id = uuid4()
         user_id = uuid4()
         tenancies = ["tenancy1"]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         dataset_db = Mock(spec=DatasetDBModel)
         dataset_db.name = "dataset.name"
@@ -184,6 +292,28 @@ class TestDatasetService(unittest.TestCase):
         self.assertEqual(dataset_db.versions, [mocked_version])
         self.dataset_repository.upsert.assert_called_once()
 
+    def test_update_dataset_normalizes_filter_values(self):
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        self.available_filters.normalize_data.side_effect = None
+        self.available_filters.normalize_data.return_value = {"category": "AEROSOLS"}
+        dataset_db = Mock(spec=DatasetDBModel)
+        dataset_db.versions = []
+        self.dataset_repository.fetch.return_value = dataset_db
+
+        self.dataset_service.update_dataset(
+            dataset_id=uuid4(),
+            dataset_request=Dataset(name="name", data={"category": "aerosols"}),
+            user_id=uuid4(),
+            tenancies=["tenancy1"],
+        )
+
+        self.available_filters.normalize_data.assert_called_once_with(
+            {"category": "aerosols"}
+        )
+        self.assertEqual(dataset_db.data, {"category": "AEROSOLS"})
+
     def test_create_dataset_success(self):
         dataset = Mock(spec=Dataset)
         dataset.name = "test"
@@ -208,9 +338,23 @@ class TestDatasetService(unittest.TestCase):
         self.assertIsNotNone(result)
         self.dataset_repository.upsert.assert_called_once()
 
+    def test_create_dataset_normalizes_filter_values(self):
+        self.available_filters.normalize_data.side_effect = None
+        self.available_filters.normalize_data.return_value = {"level": "L1"}
+        self.dataset_repository.upsert.side_effect = lambda dataset: dataset
+
+        result = self.dataset_service.create_dataset(
+            dataset=Dataset(name="test", data={"level": "l1"}), user_id=uuid4()
+        )
+
+        self.available_filters.normalize_data.assert_called_once_with({"level": "l1"})
+        self.assertEqual(result.data, {"level": "L1"})
+
     def test_disable_dataset_not_found(self):
         dataset_id = uuid4()
-        self.user_service.fetch_by_id.return_value = self.mock_user(["tenancy1"])
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
         self.dataset_repository.fetch.return_value = None
 
         with self.assertRaises(NotFoundException):
@@ -218,7 +362,9 @@ class TestDatasetService(unittest.TestCase):
 
     def test_enable_dataset_not_found(self):
         dataset_id = uuid4()
-        self.user_service.fetch_by_id.return_value = self.mock_user(["tenancy1"])
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
         self.dataset_repository.fetch.return_value = None
 
         with self.assertRaises(NotFoundException):
@@ -229,7 +375,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         version_name = "1"
         tenancies = ["tenancy1"]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = Mock(spec=DatasetDBModel)
         self.dataset_version_repository.fetch_version_by_name.return_value = None
 
@@ -246,7 +394,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         version_name = "1"
         tenancies = ["tenancy1"]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         dataset = Mock(spec=DatasetDBModel)
         dataset.versions = [Mock(spec=DatasetVersionDBModel)]
         self.dataset_repository.fetch.return_value = dataset
@@ -259,24 +409,130 @@ class TestDatasetService(unittest.TestCase):
                 tenancies=tenancies,
             )
 
+    def test_create_new_version_dataset_not_found(self):
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        self.dataset_repository.fetch.return_value = None
+
+        with self.assertRaises(NotFoundException):
+            self.dataset_service.create_new_version(
+                dataset_id=uuid4(), user_id=uuid4(), tenancies=["tenancy1"]
+            )
+
+    def test_create_new_version_without_current_version(self):
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        dataset = Mock(spec=DatasetDBModel)
+        dataset.current_version_id = None
+        dataset.versions = [Mock(spec=DatasetVersionDBModel)]
+        self.dataset_repository.fetch.return_value = dataset
+
+        with self.assertRaises(IllegalStateException):
+            self.dataset_service.create_new_version(
+                dataset_id=uuid4(), user_id=uuid4(), tenancies=["tenancy1"]
+            )
+
+        self.dataset_version_repository.upsert.assert_not_called()
+
     def test_fetch_available_filters(self):
-        with patch(
-            "builtins.open", unittest.mock.mock_open(read_data='{"filters": "data"}')
-        ):
-            filters = self.dataset_service.fetch_available_filters()
-            self.assertEqual(filters, {"filters": "data"})
+        self.available_filters.filters.return_value = [{"id": "level"}]
+
+        filters = self.dataset_service.fetch_available_filters()
+
+        self.assertEqual(filters, [{"id": "level"}])
+
+    def test_fetch_filter_facets(self):
+        tenancies = ["tenancy1"]
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
+        self.dataset_repository.count_facets.return_value = {
+            "level": {"L1": 3},
+            "design_state": {"DRAFT": 2, "PUBLISHED": 1},
+        }
+        available_filters = [
+            {"id": "date_range", "options": [{"id": "date_from"}]},
+            {
+                "id": "level",
+                "options": [
+                    {"id": "level_l1", "value": "L1"},
+                    {"id": "level_l2", "value": "L2"},
+                ],
+            },
+            {
+                "id": "design_state",
+                "options": [
+                    {"id": "design_state_draft", "value": "DRAFT"},
+                    {"id": "design_state_published", "value": "PUBLISHED"},
+                ],
+            },
+        ]
+        self.dataset_service.fetch_available_filters = Mock(
+            return_value=available_filters
+        )
+        query = DatasetQuery(full_text="ocean")
+
+        facets = self.dataset_service.fetch_filter_facets(
+            query=query, user_id=uuid4(), tenancies=tenancies
+        )
+        cached = self.dataset_service.fetch_filter_facets(
+            query=DatasetQuery(full_text="ocean "), user_id=uuid4(), tenancies=tenancies
+        )
+
+        self.assertEqual(facets, cached)
+        self.assertEqual(facets[0], available_filters[0])
+        self.assertEqual([o["count"] for o in facets[1]["options"]], [3, 0])
+        self.assertEqual([o["count"] for o in facets[2]["options"]], [2, 1])
+        self.assertNotIn("count", available_filters[1]["options"][0])
+        self.dataset_repository.count_facets.assert_called_once_with(
+            query_params=query, tenancies=tenancies
+        )
+
+    def test_search_datasets_normalizes_filter_values(self):
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        self.available_filters.normalize_value.side_effect = (
+            lambda key, value: value.upper()
+        )
+        self.dataset_repository.search.return_value = PaginatedResult(
+            items=[], total_count=None, page=1, page_size=10
+        )
+        self.dataset_repository.count.return_value = 0
+
+        self.dataset_service.search_datasets(
+            query=DatasetQuery(
+                categories=["aerosols"],
+                data_types=["routine"],
+                level="l1",
+                count_strategy=CountStrategy.EXACT,
+            ),
+            user_id=uuid4(),
+            tenancies=["tenancy1"],
+        )
+
+        query = self.dataset_repository.search.call_args.kwargs["query_params"]
+        self.assertEqual(query.categories, ["AEROSOLS"])
+        self.assertEqual(query.data_types, ["ROUTINE"])
+        self.assertEqual(query.level, "L1")
+        self.available_filters.normalize_value.assert_any_call("category", "aerosols")
+        self.available_filters.normalize_value.assert_any_call("level", "l1")
 
     def test_search_datasets(self):
-        query = Mock(spec=DatasetQuery)
-        query.page = 1
-        query.page_size = 20
-        query.minimal = False
+        query = DatasetQuery(
+            page=1, page_size=20, minimal=False, count_strategy=CountStrategy.EXACT
+        )
         user_id = uuid4()
         tenancies = ["tenancy1"]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.search.return_value = PaginatedResult(
-            items=[], total_count=0, page=1, page_size=10
+            items=[], total_count=None, page=1, page_size=10
         )
+        self.dataset_repository.count.return_value = 0
 
         result = self.dataset_service.search_datasets(
             query=query, user_id=user_id, tenancies=tenancies
@@ -284,8 +540,133 @@ class TestDatasetService(unittest.TestCase):
         self.assertIsInstance(result, PaginatedResult)
         self.assertEqual(result.total_count, 0)
         self.assertEqual(result.page, 1)
+        self.assertEqual(result.count_strategy, CountStrategy.EXACT)
         self.dataset_repository.search.assert_called_once()
 
+    def test_search_datasets_minimal_uses_projection(self):
+        query = DatasetQuery(minimal=True, page=1, page_size=10)
+        user_id = uuid4()
+        tenancies = ["tenancy1"]
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
+        published = DatasetVersion(
+            name="1",
+            is_enabled=True,
+            created_at=datetime.datetime(2024, 1, 1),
+            updated_at=datetime.datetime(2024, 1, 1),
+            design_state=DesignState.PUBLISHED,
+            files_count=2,
+            files_size_in_bytes=300,
+        )
+        draft = DatasetVersion(
+            name="2",
+            is_enabled=True,
+            created_at=datetime.datetime(2024, 2, 1),
+            updated_at=datetime.datetime(2024, 2, 1),
+            design_state=DesignState.DRAFT,
+            files_count=0,
+            files_size_in_bytes=0,
+        )
+        dataset = Dataset(name="dataset", data={}, versions=[published, draft])
+        self.dataset_repository.search_minimal.return_value = PaginatedResult(
+            items=[dataset], total_count=None, page=1, page_size=10, next_cursor="next"
+        )
+        self.dataset_repository.count.return_value = 1
+
+        result = self.dataset_service.search_datasets(
+            query=query, user_id=user_id, tenancies=tenancies
+        )
+
+        self.dataset_repository.search_minimal.assert_called_once_with(
+            query_params=query, tenancies=tenancies, include_count=False
+        )
+        self.dataset_repository.search.assert_not_called()
+        self.assertEqual(result.items, [dataset])
+        self.assertEqual(result.total_count, 1)
+        self.assertEqual(result.next_cursor, "next")
+
+    def test_search_datasets_cached_count_is_shared_by_pages(self):
+        tenancies = ["tenancy1"]
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
+        self.dataset_repository.search.return_value = PaginatedResult(
+            items=[], total_count=None, page=1, page_size=10
+        )
+        self.dataset_repository.count.return_value = 42
+
+        first = self.dataset_service.search_datasets(
+            query=DatasetQuery(categories=["b", "a"], page=1),
+            user_id=uuid4(),
+            tenancies=tenancies,
+        )
+        second = self.dataset_service.search_datasets(
+            query=DatasetQuery(categories=["a", "b"], page=2),
+            user_id=uuid4(),
+            tenancies=tenancies,
+        )
+
+        self.assertEqual(first.total_count, 42)
+        self.assertEqual(first.count_strategy, CountStrategy.EXACT)
+        self.assertEqual(second.total_count, 42)
+        self.assertEqual(second.count_strategy, CountStrategy.CACHED)
+        self.dataset_repository.count.assert_called_once()
+
+    def test_search_datasets_estimated_count(self):
+        tenancies = ["tenancy1"]
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
+        self.dataset_repository.search.return_value = PaginatedResult(
+            items=[], total_count=None, page=1, page_size=10
+        )
+        self.dataset_repository.count.return_value = 12
+        query = DatasetQuery(count_strategy=CountStrategy.ESTIMATED)
+
+        # above the threshold the planner estimate is returned
+        self.dataset_repository.estimate_count.return_value = 5000
+        result = self.dataset_service.search_datasets(
+            query=query, user_id=uuid4(), tenancies=tenancies
+        )
+        self.assertEqual(result.total_count, 5000)
+        self.assertEqual(result.count_strategy, CountStrategy.ESTIMATED)
+        self.dataset_repository.count.assert_not_called()
+
+        # below the threshold small results are counted exactly
+        self.dataset_repository.estimate_count.return_value = 10
+        result = self.dataset_service.search_datasets(
+            query=query, user_id=uuid4(), tenancies=tenancies
+        )
+        self.assertEqual(result.total_count, 12)
+        self.assertEqual(result.count_strategy, CountStrategy.EXACT)
+
+    def test_suggest_datasets(self):
+        tenancies = ["tenancy1"]
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
+        suggestions = [DatasetSuggestion(id=uuid4(), name="Ocean Aerosols")]
+        self.dataset_repository.suggest.return_value = suggestions
+
+        result = self.dataset_service.suggest_datasets(
+            text=" oce ", user_id=uuid4(), tenancies=tenancies, limit=100
+        )
+
+        self.assertEqual(result, suggestions)
+        self.dataset_repository.suggest.assert_called_once_with(
+            term="oce", tenancies=tenancies, limit=20
+        )
+
+    def test_suggest_datasets_blank_text(self):
+        result = self.dataset_service.suggest_datasets(
+            text="  ", user_id=uuid4(), tenancies=["tenancy1"]
+        )
+
+        self.assertEqual(result, [])
+        self.dataset_repository.suggest.assert_not_called()
+        self.auth_context_service.resolve.assert_not_called()
+
     def test_create_data_file(self):
         file = Mock(spec=DataFile)
         file.name = "test"
@@ -296,7 +677,9 @@ class TestDatasetService(unittest.TestCase):
         version = Mock(spec=DatasetVersionDBModel)
         self.dataset_service.fetch_dataset = Mock(return_value=dataset)
         self.dataset_version_repository.fetch_draft_version.return_value = version
-        self.user_service.fetch_by_id.return_value = self.mock_user(["tenancy1"])
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
 
         self.dataset_service.create_data_file(
             file=file, dataset_id=dataset_id, user_id=user_id
@@ -308,7 +691,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         version_name = "1"
         tenancies = ["tenancy1"]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         dataset = Mock(spec=DatasetDBModel)
         dataset.design_state = DesignState.DRAFT
         version = Mock(spec=DatasetVersionDBModel)
@@ -323,6 +708,28 @@ class TestDatasetService(unittest.TestCase):
         )
         self.dataset_version_repository.upsert.assert_called_once()
         self.dataset_repository.upsert.assert_called_once()
+        self.unit_of_work.assert_called_once()
+        self.unit_of_work.return_value.__exit__.assert_called_once_with(
+            None, None, None
+        )
+
+    def test_publish_dataset_version_not_found_leaves_unit_of_work(self):
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenancy1"]
+        )
+        self.dataset_repository.fetch.return_value = None
+
+        with self.assertRaises(NotFoundException):
+            self.dataset_service.publish_dataset_version(
+                dataset_id=uuid4(),
+                user_id=uuid4(),
+                version_name="1",
+                tenancies=["tenancy1"],
+            )
+
+        exc_type = self.unit_of_work.return_value.__exit__.call_args.args[0]
+        self.assertIs(exc_type, NotFoundException)
+        self.dataset_version_repository.upsert.assert_not_called()
 
     def test__should_create_new_version(self):
         @dataclass
@@ -452,7 +859,9 @@ class TestDatasetService(unittest.TestCase):
         given_tenancies = ["a", "b"]
         expected_tenancies = ["a", "b"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(given_tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            given_tenancies
+        )
 
         # when
         actual = self.dataset_service._determine_tenancies(
@@ -462,24 +871,14 @@ class TestDatasetService(unittest.TestCase):
         # then
         self.assertEqual(actual, expected_tenancies)
 
-    def mock_tenancy(self, name, is_enabled):
-        # Mocking a tenancy object with the given name and enabled status
-        tenancy = Mock(Tenancy)
-        tenancy.name = name
-        tenancy.is_enabled = is_enabled
-        return tenancy
-
     def test__determine_tenancies_disabled_tenancy(self):
         # given
         given_user_id = "7DC7479E-9DCD-4519-BEC8-6CBA708A7B10"
         given_tenancies = ["a", "b"]
         expected_tenancies = ["a"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(given_tenancies)
-        self.tenancy_service.fetch.side_effect = lambda name: (
-            self.mock_tenancy(name, is_enabled=True)
-            if name == "a"
-            else self.mock_tenancy(name, is_enabled=False)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["a"], disabled_tenancies=["b"]
         )
 
         # when
@@ -497,7 +896,9 @@ class TestDatasetService(unittest.TestCase):
         expected_raise_fetch_user = UnauthorizedException(
             f"unauthorized_tenancy '{given_tenancies}' for user '{given_user_id}'"
         )
-        self.user_service.fetch_by_id.side_effect = NotFoundException("user not found")
+        self.auth_context_service.resolve.side_effect = NotFoundException(
+            "user not found"
+        )
 
         # when
         with self.assertRaises(type(expected_raise_fetch_user)) as cm:
@@ -516,7 +917,9 @@ class TestDatasetService(unittest.TestCase):
         expected_raise_fetch_user = UnauthorizedException(
             "unauthorized_tenancy: ['a', 'b', 'c']"
         )
-        self.user_service.fetch_by_id.return_value = self.mock_user(given_tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            given_tenancies
+        )
 
         # when
         with self.assertRaises(type(expected_raise_fetch_user)) as cm:
@@ -527,6 +930,33 @@ class TestDatasetService(unittest.TestCase):
         # then
         self.assertEqual(str(cm.exception), str(expected_raise_fetch_user))
 
+    def test__determine_tenancies_defaults_to_enabled_member_tenancies(self):
+        # given
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["a"], disabled_tenancies=["b"]
+        )
+
+        # when
+        actual = self.dataset_service._determine_tenancies(user_id=uuid4())
+
+        # then
+        self.assertEqual(actual, ["a"])
+        self.tenancy_registry.is_enabled.assert_not_called()
+
+    def test__determine_tenancies_ignores_disabled_non_member_tenancy(self):
+        # given
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(["a"])
+        self.tenancy_registry.is_enabled.return_value = False
+
+        # when
+        actual = self.dataset_service._determine_tenancies(
+            user_id=uuid4(), tenancies=["a", "b"]
+        )
+
+        # then
+        self.assertEqual(actual, ["a"])
+        self.tenancy_registry.is_enabled.assert_called_once_with("b")
+
     def test_update_dataset_update_doi_metadata_success(self):
         dataset_id = uuid4()
         user_id = uuid4()
@@ -595,13 +1025,16 @@ class TestDatasetService(unittest.TestCase):
             visibility=None,
             owner_id=user_id,
             versions=[existing_version],
+            current_version_id=existing_version.id,
         )
         self.dataset_repository.fetch.return_value = existing_dataset
 
         # Mock the update_metadata method to do nothing (assume success)
         self.doi_service.update_metadata.return_value = None
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(["tenant1"])
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenant1"]
+        )
 
         self.dataset_service.update_dataset(
             dataset_id=dataset_id,
@@ -613,6 +1046,7 @@ class TestDatasetService(unittest.TestCase):
         self.dataset_repository.fetch.assert_called_once_with(
             dataset_id=dataset_id,
             tenancies=["tenant1"],
+            load_plan=DATASET_WITH_VERSIONS,
         )
         # Verify that the dataset was updated
         self.assertEqual(existing_dataset.name, "Updated Dataset")
@@ -650,7 +1084,9 @@ class TestDatasetService(unittest.TestCase):
             },
         )
         self.doi_service.update_metadata.assert_called_once_with(doi=expected_doi)
-        self.dataset_repository.upsert.assert_called_once_with(dataset=existing_dataset)
+        self.dataset_repository.upsert.assert_called_once_with(
+            dataset=existing_dataset, refresh=False
+        )
 
     def test_updated_dataset_update_doi_metadata_failure(self):
         dataset_id = uuid4()
@@ -721,13 +1157,16 @@ class TestDatasetService(unittest.TestCase):
             visibility=None,
             owner_id=user_id,
             versions=[existing_version],
+            current_version_id=existing_version.id,
         )
         self.dataset_repository.fetch.return_value = existing_dataset
 
         # Mock the update_metadata method to simulate failure
         self.doi_service.update_metadata.side_effect = Exception("Update failed")
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(["tenant1"])
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            ["tenant1"]
+        )
 
         with self.assertRaises(Exception):
             self.dataset_service.update_dataset(
@@ -740,6 +1179,7 @@ class TestDatasetService(unittest.TestCase):
         self.dataset_repository.fetch.assert_called_once_with(
             dataset_id=dataset_id,
             tenancies=["tenant1"],
+            load_plan=DATASET_WITH_VERSIONS,
         )
 
         expected_doi = DOI(
@@ -774,7 +1214,9 @@ class TestDatasetService(unittest.TestCase):
         now = datetime.datetime.now()
         file_id = uuid4()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_file = DataFileDBModel(
             id=file_id,
@@ -833,14 +1275,13 @@ class TestDatasetService(unittest.TestCase):
         self.assertEqual(result, "https://example.com/download/file_name")
         self.dataset_repository.fetch.assert_called_once_with(
             dataset_id=dataset_id,
-            is_enabled=True,
             tenancies=tenancies,
-            latest_version=False,
-            version_design_state=None,
-            version_is_enabled=True,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_FILES,
         )
 
     def test_get_file_download_url_dataset_not_found(self):
@@ -849,7 +1290,9 @@ class TestDatasetService(unittest.TestCase):
         file_id = uuid4()
         user_id = uuid4()
         tenancies = ["tenant1"]
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = None
 
         with self.assertRaises(NotFoundException) as context:
@@ -866,7 +1309,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_dataset = DatasetDBModel(
             id=dataset_id,
@@ -882,7 +1327,9 @@ class TestDatasetService(unittest.TestCase):
             versions=[],
         )
         self.dataset_repository.fetch.return_value = existing_dataset
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_version_repository.fetch_version_by_name.return_value = None
 
         with self.assertRaises(NotFoundException) as context:
@@ -903,7 +1350,9 @@ class TestDatasetService(unittest.TestCase):
         now = datetime.datetime.now()
         file_id = uuid4()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_version = DatasetVersionDBModel(
             id=uuid4(),
@@ -953,7 +1402,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         # Existing dataset with a current version that has a DOI
         existing_version = DatasetVersionDBModel(
@@ -1021,10 +1472,14 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(result, expected_doi)
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
         self.doi_service.create.assert_called_once_with(doi=expected_doi)
 
@@ -1034,7 +1489,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         self.dataset_repository.fetch.return_value = None
 
@@ -1045,7 +1502,9 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(str(context.exception), f"not_found: {dataset_id}")
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
 
     def test_create_doi_version_not_found(self):
@@ -1055,7 +1514,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_dataset = DatasetDBModel(
             id=dataset_id,
@@ -1083,10 +1544,14 @@ class TestDatasetService(unittest.TestCase):
             f"not_found: {version_name} for dataset {dataset_id}",
         )
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_create_doi_already_exists(self):
@@ -1096,7 +1561,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_version = DatasetVersionDBModel(
             id=uuid4(),
@@ -1145,10 +1612,14 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(str(context.exception.errors[0].code), "already_exists")
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_create_doi_internal_service_failure(self):
@@ -1158,7 +1629,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_version = DatasetVersionDBModel(
             id=uuid4(),
@@ -1204,10 +1677,14 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "DOI service failure")
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_change_doi_state_success(self):
@@ -1217,7 +1694,9 @@ class TestDatasetService(unittest.TestCase):
         new_state = DOIState.FINDABLE
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         now = datetime.datetime.now()
 
@@ -1263,14 +1742,18 @@ class TestDatasetService(unittest.TestCase):
         # Verify dataset repository was called twice (DOI operation + publication)
         self.assertEqual(self.dataset_repository.fetch.call_count, 2)
         self.dataset_repository.fetch.assert_called_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_WITH_VERSIONS,
         )
         # Version repository is also called twice (DOI operation + publication)
         self.assertEqual(
             self.dataset_version_repository.fetch_version_by_name.call_count, 2
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
         self.doi_service.change_state.assert_called_once_with(
             identifier=existing_version.doi.identifier, new_state=new_state
@@ -1283,7 +1766,9 @@ class TestDatasetService(unittest.TestCase):
         new_state = DOIState.FINDABLE
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         self.dataset_repository.fetch.return_value = None
 
@@ -1294,7 +1779,9 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(str(context.exception), f"not_found: {dataset_id}")
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
 
     def test_change_doi_state_version_not_found(self):
@@ -1305,7 +1792,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_dataset = DatasetDBModel(
             id=dataset_id,
@@ -1334,10 +1823,14 @@ class TestDatasetService(unittest.TestCase):
             f"not_found: {version_name} for dataset {dataset_id}",
         )
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_change_doi_state_doi_not_found(self):
@@ -1348,7 +1841,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_version = DatasetVersionDBModel(
             id=uuid4(),
@@ -1394,10 +1889,14 @@ class TestDatasetService(unittest.TestCase):
             str(context.exception), f"not_found: DOI for version {version_name}"
         )
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_get_doi_success(self):
@@ -1406,7 +1905,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         now = datetime.datetime.now()
 
@@ -1464,10 +1965,14 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(result, DOIAdapter.database_to_model(doi=existing_doi))
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_get_doi_dataset_not_found(self):
@@ -1476,7 +1981,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         self.dataset_repository.fetch.return_value = None
 
@@ -1485,7 +1992,9 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(str(context.exception), f"not_found: {dataset_id}")
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
 
     def test_get_doi_version_not_found(self):
@@ -1495,7 +2004,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_dataset = DatasetDBModel(
             id=dataset_id,
@@ -1522,10 +2033,14 @@ class TestDatasetService(unittest.TestCase):
             f"not_found: {version_name} for dataset {dataset_id}",
         )
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_get_doi_doi_not_found(self):
@@ -1535,7 +2050,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_version = DatasetVersionDBModel(
             id=uuid4(),
@@ -1579,10 +2096,14 @@ class TestDatasetService(unittest.TestCase):
             str(context.exception), f"not_found: DOI for version {version_name}"
         )
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_delete_doi_success(self):
@@ -1591,7 +2112,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         now = datetime.datetime.now()
 
@@ -1640,10 +2163,14 @@ class TestDatasetService(unittest.TestCase):
         self.dataset_service.delete_doi(dataset_id, version_name, user_id, tenancies)
 
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
         self.doi_service.delete.assert_called_once_with(
             identifier=existing_doi.identifier
@@ -1655,7 +2182,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         self.dataset_repository.fetch.return_value = None
 
@@ -1666,7 +2195,9 @@ class TestDatasetService(unittest.TestCase):
 
         self.assertEqual(str(context.exception), f"not_found: {dataset_id}")
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
 
     def test_delete_doi_version_not_found(self):
@@ -1676,7 +2207,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_dataset = DatasetDBModel(
             id=dataset_id,
@@ -1705,10 +2238,14 @@ class TestDatasetService(unittest.TestCase):
             f"not_found: {version_name} for dataset {dataset_id}",
         )
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_delete_doi_doi_not_found(self):
@@ -1718,7 +2255,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         now = datetime.datetime.now()
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         existing_version = DatasetVersionDBModel(
             id=uuid4(),
@@ -1764,10 +2303,14 @@ class TestDatasetService(unittest.TestCase):
             str(context.exception), f"not_found: DOI for version {version_name}"
         )
         self.dataset_repository.fetch.assert_called_once_with(
-            dataset_id=dataset_id, tenancies=tenancies
+            dataset_id=dataset_id,
+            tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
-            dataset_id=dataset_id, version_name=version_name
+            dataset_id=dataset_id,
+            version_name=version_name,
+            load_plan=VERSION_WITH_DOI,
         )
 
     def test_fetch_dataset_version_success(self):
@@ -1775,7 +2318,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         now = datetime.datetime.now()
 
@@ -1816,6 +2361,8 @@ class TestDatasetService(unittest.TestCase):
             is_enabled=True,
             created_by=user_id,
             files=[],
+            files_count=0,
+            files_size_in_bytes=0,
             created_at=now,
             updated_at=now,
             dataset_id=dataset_id,
@@ -1831,7 +2378,7 @@ class TestDatasetService(unittest.TestCase):
             is_enabled=True,
             created_at=now,
             updated_at=now,
-            tenancy=["tenant1"],
+            tenancy="tenant1",
             design_state=DesignState.DRAFT,
             visibility=None,
             owner_id=user_id,
@@ -1853,6 +2400,7 @@ class TestDatasetService(unittest.TestCase):
         self.dataset_repository.fetch.assert_called_once_with(
             dataset_id=dataset_id,
             tenancies=tenancies,
+            load_plan=DATASET_ONLY,
         )
         self.dataset_version_repository.fetch_version_by_name.assert_called_once_with(
             dataset_id=dataset_id,
@@ -1863,7 +2411,7 @@ class TestDatasetService(unittest.TestCase):
             id=dataset_id,
             name="Original Dataset",
             data={"key": "original"},
-            tenancy=["tenant1"],
+            tenancy="tenant1",
             is_enabled=True,
             created_at=now,
             updated_at=now,
@@ -1894,7 +2442,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         version_name = "2"
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         self.dataset_repository.fetch.return_value = None
 
@@ -1914,7 +2464,9 @@ class TestDatasetService(unittest.TestCase):
         tenancies = ["tenant1"]
         version_name = "2"
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         self.dataset_repository.fetch.return_value = None
 
@@ -1952,17 +2504,20 @@ class TestDatasetService(unittest.TestCase):
         mock_dataset.visibility = VisibilityStatus.PUBLIC
         mock_dataset.versions = []
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.search.return_value = PaginatedResult(
-            items=[mock_dataset], total_count=1, page=1, page_size=10
+            items=[mock_dataset], total_count=None, page=1, page_size=10
         )
+        self.dataset_repository.count.return_value = 1
 
         result = self.dataset_service.search_datasets(
             query=query, user_id=user_id, tenancies=tenancies
         )
 
         self.dataset_repository.search.assert_called_once_with(
-            query_params=query, tenancies=tenancies
+            query_params=query, tenancies=tenancies, include_count=False
         )
         self.assertEqual(len(result.items), 1)
         self.assertEqual(result.items[0].visibility, VisibilityStatus.PUBLIC)
@@ -2003,6 +2558,7 @@ class TestDatasetService(unittest.TestCase):
         version3.doi = None  # No DOI - should be excluded
 
         dataset.versions = [version1, version2, version3]
+        dataset.latest_published_version_id = version2.id
 
         # Act
         result = self.dataset_service._get_latest_published_version(dataset)
@@ -2132,7 +2688,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         dataset = DatasetDBModel()
         dataset.id = dataset_id
@@ -2149,6 +2707,7 @@ class TestDatasetService(unittest.TestCase):
         version.files_in = []  # Add files_in to avoid None issues
 
         dataset.versions = [version]
+        dataset.latest_published_version_id = version.id
 
         self.dataset_repository.fetch.return_value = dataset
         self.dataset_version_repository.fetch_version_by_name.return_value = version
@@ -2197,7 +2756,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = None
 
         # Act & Assert
@@ -2215,7 +2776,9 @@ class TestDatasetService(unittest.TestCase):
         user_id = uuid4()
         tenancies = ["tenant1"]
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
 
         dataset = DatasetDBModel()
         dataset.id = dataset_id
@@ -2247,7 +2810,9 @@ class TestDatasetService(unittest.TestCase):
         version.doi = DOIDBModel()
         version.doi.identifier = "10.1234/test"
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = dataset
         self.dataset_version_repository.fetch_version_by_name.return_value = version
 
@@ -2287,7 +2852,9 @@ class TestDatasetService(unittest.TestCase):
         version.doi = DOIDBModel()
         version.doi.identifier = "10.1234/test"
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = dataset
         self.dataset_version_repository.fetch_version_by_name.return_value = version
 
@@ -2329,7 +2896,9 @@ class TestDatasetService(unittest.TestCase):
         version.name = version_name
         version.doi = None  # No existing DOI
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = dataset
         self.dataset_version_repository.fetch_version_by_name.return_value = version
         self.doi_service.create.return_value = doi
@@ -2376,7 +2945,9 @@ class TestDatasetService(unittest.TestCase):
         version.name = version_name
         version.doi = None  # No existing DOI
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = dataset
         self.dataset_version_repository.fetch_version_by_name.return_value = version
         self.doi_service.create.return_value = doi
@@ -2411,7 +2982,9 @@ class TestDatasetService(unittest.TestCase):
         version.doi = DOIDBModel()
         version.doi.identifier = "10.1234/test"
 
-        self.user_service.fetch_by_id.return_value = self.mock_user(tenancies)
+        self.auth_context_service.resolve.return_value = self.mock_auth_context(
+            tenancies
+        )
         self.dataset_repository.fetch.return_value = dataset
         self.dataset_version_repository.fetch_version_by_name.return_value = version
 
@@ -2576,32 +3149,16 @@ class TestDatasetService(unittest.TestCase):
         version.doi.identifier = "10.1234/test"
         version.doi.state = "FINDABLE"
 
-        # Mock files with different extensions and sizes
-        file1 = Mock()
-        file1.name = "data.csv"
-        file1.size_bytes = 1024
-
-        file2 = Mock()
-        file2.name = "metadata.json"
-        file2.size_bytes = 512
-
-        file3 = Mock()
-        file3.name = "report.csv"
-        file3.size_bytes = 2048
-
-        file4 = Mock()
-        file4.name = "readme"  # No extension
-        file4.size_bytes = 256
-
-        file5 = Mock()
-        file5.name = "data.backup.csv"  # Multiple dots
-        file5.size_bytes = 512
-
-        file6 = Mock()
-        file6.name = ".hidden"  # Starts with dot
-        file6.size_bytes = 128
-
-        version.files_in = [file1, file2, file3, file4, file5, file6]
+        # Aggregates stored on the version for data.csv, metadata.json,
+        # report.csv, readme, data.backup.csv and .hidden
+        version.files_count = 6
+        version.files_size_in_bytes = 4480
+        version.files_extensions = {
+            ".hidden": {"count": 1, "total_size_bytes": 128},
+            ".json": {"count": 1, "total_size_bytes": 512},
+            "(no extension)": {"count": 1, "total_size_bytes": 256},
+            ".csv": {"count": 3, "total_size_bytes": 3584},
+        }
 
         # Act
         result = self.dataset_service._create_dataset_json_snapshot(dataset, version)
@@ -2637,6 +3194,203 @@ class TestDatasetService(unittest.TestCase):
         self.assertEqual(no_ext["count"], 1)  # readme only
         self.assertEqual(no_ext["total_size_bytes"], 256)
 
+        self.assertEqual(
+            [e["extension"] for e in extensions],
+            [".csv", "(no extension)", ".hidden", ".json"],
+        )
+
+
+class TestDatasetServiceAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.dataset_repository = Mock(spec=DatasetRepository)
+        self.dataset_version_repository = Mock(spec=DatasetVersionRepository)
+        self.async_dataset_repository = AsyncMock(spec=AsyncDatasetRepository)
+        self.async_dataset_version_repository = AsyncMock(
+            spec=AsyncDatasetVersionRepository
+        )
+        self.auth_context_service = Mock(spec=AuthContextService)
+        self.auth_context_service.resolve_async = AsyncMock(
+            return_value=AuthContext(user_id=uuid4(), tenancies={"tenancy1": True})
+        )
+        self.count_cache = TTLCache(max_size=10, ttl_seconds=60)
+        self.dataset_service = DatasetService(
+            repository=self.dataset_repository,
+            version_repository=self.dataset_version_repository,
+            data_file_repository=Mock(spec=DataFileRepository),
+            auth_context_service=self.auth_context_service,
+            doi_service=Mock(spec=DOIService),
+            minio_gateway=Mock(spec=ObjectStorageGateway),
+            tenancy_registry=Mock(spec=TenancyRegistry),
+            dataset_bucket="dataset_bucket",
+            count_cache=self.count_cache,
+            default_count_strategy="cached",
+            count_estimate_threshold=1000,
+            facet_cache=TTLCache(max_size=10, ttl_seconds=60),
+            available_filters=Mock(spec=AvailableFilters),
+            unit_of_work=MagicMock(),
+            dataset_cache=DatasetCache(
+                local=TTLCache(max_size=10, ttl_seconds=60),
+                generations=TTLCache(max_size=10, ttl_seconds=60),
+                ttl_seconds=60,
+            ),
+            async_enabled=True,
+            async_repository=self.async_dataset_repository,
+            async_version_repository=self.async_dataset_version_repository,
+        )
+
+    def mock_dataset(self, dataset_id) -> DatasetDBModel:
+        version = DatasetVersionDBModel(
+            id=uuid4(),
+            name="1",
+            is_enabled=True,
+            design_state=DesignState.DRAFT,
+            created_at=datetime.datetime(2024, 1, 1),
+            updated_at=datetime.datetime(2024, 1, 1),
+        )
+        return DatasetDBModel(
+            id=dataset_id,
+            name="dataset",
+            data={},
+            tenancy="tenancy1",
+            versions=[version],
+            current_version_id=version.id,
+        )
+
+    async def test_search_datasets_async(self):
+        query = DatasetQuery(page=1, page_size=10)
+        self.async_dataset_repository.search.return_value = PaginatedResult(
+            items=[self.mock_dataset(uuid4())], total_count=None, page=1, page_size=10
+        )
+        self.async_dataset_repository.count.return_value = 1
+
+        result = await self.dataset_service.search_datasets_async(
+            query=query, user_id=uuid4(), tenancies=["tenancy1"]
+        )
+
+        self.assertEqual(result.total_count, 1)
+        self.assertEqual(result.items[0].name, "dataset")
+        self.async_dataset_repository.search.assert_awaited_once_with(
+            query_params=query, tenancies=["tenancy1"], include_count=False
+        )
+        self.dataset_repository.search.assert_not_called()
+
+    async def test_search_datasets_async_reuses_cached_count(self):
+        query = DatasetQuery(minimal=True, page=1, page_size=10)
+        self.async_dataset_repository.search_minimal.return_value = PaginatedResult(
+            items=[], total_count=None, page=1, page_size=10
+        )
+        self.async_dataset_repository.count.return_value = 3
+
+        await self.dataset_service.search_datasets_async(query=query, user_id=uuid4())
+        result = await self.dataset_service.search_datasets_async(
+            query=query, user_id=uuid4()
+        )
+
+        self.assertEqual(result.total_count, 3)
+        self.assertEqual(result.count_strategy, CountStrategy.CACHED)
+        self.async_dataset_repository.count.assert_awaited_once()
+
+    async def test_fetch_dataset_async_is_cached(self):
+        dataset_id = uuid4()
+        self.async_dataset_repository.fetch.return_value = self.mock_dataset(dataset_id)
+
+        first = await self.dataset_service.fetch_dataset_async(
+            dataset_id=dataset_id, user_id=uuid4()
+        )
+        second = await self.dataset_service.fetch_dataset_async(
+            dataset_id=dataset_id, user_id=uuid4()
+        )
+
+        self.assertEqual(first.id, dataset_id)
+        self.assertIs(first, second)
+        self.async_dataset_repository.fetch.assert_awaited_once()
+        self.dataset_repository.fetch.assert_not_called()
+
+    async def test_fetch_dataset_async_of_another_tenancy(self):
+        dataset_id = uuid4()
+        dataset = self.mock_dataset(dataset_id)
+        dataset.tenancy = "tenancy2"
+        self.async_dataset_repository.fetch.return_value = dataset
+
+        result = await self.dataset_service.fetch_dataset_async(
+            dataset_id=dataset_id, user_id=uuid4()
+        )
+
+        self.assertIsNone(result)
+
+    async def test_fetch_dataset_version_async(self):
+        dataset_id = uuid4()
+        dataset = self.mock_dataset(dataset_id)
+        self.async_dataset_repository.fetch.return_value = dataset
+        self.async_dataset_version_repository.fetch_version_by_name.return_value = (
+            dataset.versions[0]
+        )
+
+        result = await self.dataset_service.fetch_dataset_version_async(
+            dataset_id=dataset_id, version_name="1", user_id=uuid4()
+        )
+
+        self.assertEqual(result.version.name, "1")
+        self.async_dataset_repository.fetch.assert_awaited_once_with(
+            dataset_id=dataset_id, tenancies=["tenancy1"], load_plan=DATASET_ONLY
+        )
+
+    async def test_fetch_dataset_version_async_version_not_found(self):
+        dataset_id = uuid4()
+        self.async_dataset_repository.fetch.return_value = self.mock_dataset(dataset_id)
+        self.async_dataset_version_repository.fetch_version_by_name.return_value = None
+
+        with self.assertRaises(NotFoundException):
+            await self.dataset_service.fetch_dataset_version_async(
+                dataset_id=dataset_id, version_name="2", user_id=uuid4()
+            )
+
+    async def test_sync_and_async_reads_issue_the_same_calls(self):
+        self.auth_context_service.resolve.return_value = AuthContext(
+            user_id=uuid4(), tenancies={"tenancy1": True}
+        )
+        dataset_id = uuid4()
+        query = DatasetQuery(count_strategy=CountStrategy.ESTIMATED)
+        for repository in (self.dataset_repository, self.async_dataset_repository):
+            repository.search.return_value = PaginatedResult(
+                items=[], total_count=None, page=1, page_size=10
+            )
+            repository.estimate_count.return_value = 10
+            repository.count.return_value = 10
+            repository.fetch.return_value = self.mock_dataset(dataset_id)
+
+        sync = self.dataset_service.search_datasets(query=query, user_id=uuid4())
+        self.dataset_service.fetch_dataset(
+            dataset_id=dataset_id, user_id=uuid4(), latest_version=True
+        )
+        self.dataset_service._dataset_cache.invalidate(dataset_id)
+        result = await self.dataset_service.search_datasets_async(
+            query=query, user_id=uuid4()
+        )
+        await self.dataset_service.fetch_dataset_async(
+            dataset_id=dataset_id, user_id=uuid4(), latest_version=True
+        )
+
+        self.assertEqual(result, sync)
+        self.assertEqual(
+            [call[0] for call in self.dataset_repository.mock_calls],
+            ["search", "estimate_count", "count", "fetch"],
+        )
+        self.assertEqual(
+            self.async_dataset_repository.mock_calls,
+            self.dataset_repository.mock_calls,
+        )
+
+    async def test_unknown_user_is_unauthorized(self):
+        self.auth_context_service.resolve_async.side_effect = NotFoundException(
+            "not_found"
+        )
+
+        with self.assertRaises(UnauthorizedException):
+            await self.dataset_service.search_datasets_async(
+                query=DatasetQuery(), user_id=uuid4()
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+from dataclasses import asdict
+
+from app.cache import TTLCache
+from app.database import Database
+from app.executor import BlockingExecutor
+
+
+class MetricsService:
+    """Collects in-process runtime metrics exposed by the internal metrics endpoint."""
+
+    def __init__(
+        self,
+        client_cache: TTLCache,
+        credential_cache: TTLCache,
+        auth_context_cache: TTLCache,
+        authorization_decision_cache: TTLCache,
+        dataset_count_cache: TTLCache,
+        dataset_facet_cache: TTLCache,
+        dataset_detail_cache: TTLCache,
+        executor: BlockingExecutor,
+        db: Database,
+    ) -> None:
+        self._client_cache = client_cache
+        self._credential_cache = credential_cache
+        self._auth_context_cache = auth_context_cache
+        self._authorization_decision_cache = authorization_decision_cache
+        self._dataset_count_cache = dataset_count_cache
+        self._dataset_facet_cache = dataset_facet_cache
+        self._dataset_detail_cache = dataset_detail_cache
+        self._executor = executor
+        self._db = db
+
+    def collect(self) -> dict:
+        async_pool_stats = self._db.async_pool_stats()
+        read_pool_stats = self._db.read_pool_stats()
+        return {
+            "caches": {
+                "clients": asdict(self._client_cache.stats()),
+                "credentials": asdict(self._credential_cache.stats()),
+                "auth_contexts": asdict(self._auth_context_cache.stats()),
+                "authorization_decisions": asdict(
+                    self._authorization_decision_cache.stats()
+                ),
+                "dataset_counts": asdict(self._dataset_count_cache.stats()),
+                "dataset_facets": asdict(self._dataset_facet_cache.stats()),
+                "dataset_details": asdict(self._dataset_detail_cache.stats()),
+            },
+            "executor": asdict(self._executor.stats()),
+            "database": {
+                "pool": asdict(self._db.pool_stats()),
+                "async_pool": asdict(async_pool_stats) if async_pool_stats else None,
+                "read_pool": asdict(read_pool_stats) if read_pool_stats else None,
+            },
+        }
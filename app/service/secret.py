@@ -1,5 +1,14 @@
+import hashlib
+import hmac
+import secrets
+
 import bcrypt
 
+# Per-process key used to digest presented secrets before they are kept in
+# memory (e.g. the verified-credential cache), so plaintext secrets are never
+# stored and digests are useless outside of this process.
+_DIGEST_KEY = secrets.token_bytes(32)
+
 
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
@@ -12,3 +21,11 @@ def check_password(password: str, hashed_password: str) -> bool:
         password=password.encode("utf-8"),
         hashed_password=hashed_password.encode("utf-8"),
     )
+
+
+def keyed_digest(value: str) -> str:
+    return hmac.new(_DIGEST_KEY, value.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def digests_match(digest: str, other_digest: str) -> bool:
+    return hmac.compare_digest(digest, other_digest)
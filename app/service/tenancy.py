@@ -1,13 +1,28 @@
 from typing import List
+from app.cache import TTLCache
 from app.model.db.tenancy import Tenancy as DBModel
 from app.model.tenancy import Tenancy
 from app.repository.tenancy import TenancyRepository
+from app.service.tenancy_registry import TenancyRegistry
 from app.exception.not_found import NotFoundException
 
 
 class TenancyService:
-    def __init__(self, repository: TenancyRepository) -> None:
+    def __init__(
+        self,
+        repository: TenancyRepository,
+        registry: TenancyRegistry,
+        auth_context_cache: TTLCache,
+    ) -> None:
         self._repository: TenancyRepository = repository
+        self._registry: TenancyRegistry = registry
+        self._auth_context_cache: TTLCache = auth_context_cache
+
+    def _on_change(self) -> None:
+        # Other processes are notified by the tenancies trigger
+        self._registry.load()
+        # Cached auth contexts embed tenancy names and enabled status
+        self._auth_context_cache.clear()
 
     def __adapt_tenancy(self, tenancy: DBModel) -> Tenancy:
         return Tenancy(
@@ -36,6 +51,7 @@ class TenancyService:
     def create(self, tenancy: Tenancy) -> None:
         tenancy = DBModel(name=tenancy.name, is_enabled=tenancy.is_enabled)
         self._repository.upsert(tenancy)
+        self._on_change()
 
     def update(self, old_name: str, updated_tenancy: Tenancy) -> None:
         old_tenancy: DBModel = self._repository.fetch(tenancy=old_name)
@@ -45,6 +61,7 @@ class TenancyService:
         old_tenancy.name = updated_tenancy.name
         old_tenancy.is_enabled = updated_tenancy.is_enabled
         self._repository.upsert(tenancy=old_tenancy)
+        self._on_change()
 
     def disable(self, name: str) -> None:
         tenancy: DBModel = self._repository.fetch(tenancy=name)
@@ -52,6 +69,7 @@ class TenancyService:
             raise NotFoundException(f"not_found: {name}")
         tenancy.is_enabled = False
         self._repository.upsert(tenancy=tenancy)
+        self._on_change()
 
     def enable(self, name: str) -> None:
         tenancy: DBModel = self._repository.fetch(tenancy=name, is_enabled=False)
@@ -59,3 +77,4 @@ class TenancyService:
             raise NotFoundException(f"not_found: {name}")
         tenancy.is_enabled = True
         self._repository.upsert(tenancy=tenancy)
+        self._on_change()
@@ -0,0 +1,46 @@
+import logging
+import threading
+
+from app.repository.tenancy import TenancyRepository
+
+TENANCIES_CHANGED_CHANNEL = "tenancies_changed"
+
+
+class TenancyRegistry:
+    """
+    Process-local view of the tenancies table, answering enabled checks
+    without I/O.
+
+    The whole table is loaded at startup and reloaded by `TenancyService` after
+    each change and, for changes made by other processes, when Postgres
+    publishes on the `tenancies_changed` channel (see `app.notification`).
+    """
+
+    def __init__(self, repository: TenancyRepository) -> None:
+        self._logger = logging.getLogger("service:TenancyRegistry")
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._tenancies: dict[str, bool] | None = None
+
+    def load(self) -> None:
+        tenancies = {
+            tenancy.name: tenancy.is_enabled for tenancy in self._repository.fetch_all()
+        }
+        # Readers never lock: swapping the dictionary reference is atomic
+        self._tenancies = tenancies
+        self._logger.info(f"Loaded {len(tenancies)} tenancies")
+
+    def is_enabled(self, name: str) -> bool:
+        return self._snapshot().get(name, False)
+
+    def exists(self, name: str) -> bool:
+        return name in self._snapshot()
+
+    def _snapshot(self) -> dict[str, bool]:
+        tenancies = self._tenancies
+        if tenancies is None:
+            with self._lock:
+                if self._tenancies is None:
+                    self.load()
+                tenancies = self._tenancies
+        return tenancies
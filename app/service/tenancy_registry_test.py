@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import Mock
+
+from app.model.db.tenancy import Tenancy as DBModel
+from app.repository.tenancy import TenancyRepository
+from app.service.tenancy_registry import TenancyRegistry
+
+
+class TestTenancyRegistry(unittest.TestCase):
+    def setUp(self):
+        self.repository = Mock(spec=TenancyRepository)
+        self.repository.fetch_all.return_value = [
+            DBModel(name="a", is_enabled=True),
+            DBModel(name="b", is_enabled=False),
+        ]
+        self.registry = TenancyRegistry(self.repository)
+
+    def test_is_enabled(self):
+        self.registry.load()
+
+        self.assertTrue(self.registry.is_enabled("a"))
+        self.assertFalse(self.registry.is_enabled("b"))
+        self.assertFalse(self.registry.is_enabled("unknown"))
+        self.assertTrue(self.registry.exists("b"))
+        self.assertFalse(self.registry.exists("unknown"))
+        self.repository.fetch_all.assert_called_once_with()
+
+    def test_loads_lazily_on_first_use(self):
+        self.assertTrue(self.registry.is_enabled("a"))
+        self.assertTrue(self.registry.is_enabled("a"))
+
+        self.repository.fetch_all.assert_called_once()
+
+    def test_load_replaces_previous_state(self):
+        self.registry.load()
+        self.repository.fetch_all.return_value = [DBModel(name="b", is_enabled=True)]
+
+        self.registry.load()
+
+        self.assertFalse(self.registry.exists("a"))
+        self.assertTrue(self.registry.is_enabled("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,22 @@
 import unittest
 from unittest.mock import Mock
+from app.cache import TTLCache
 from app.model.db.tenancy import Tenancy as DBModel
 from app.model.tenancy import Tenancy
 from app.repository.tenancy import TenancyRepository
 from app.exception.not_found import NotFoundException
 from app.service.tenancy import TenancyService
+from app.service.tenancy_registry import TenancyRegistry
 
 
 class TestTenancyService(unittest.TestCase):
     def setUp(self):
         self.repository = Mock(spec=TenancyRepository)
-        self.tenancy_service = TenancyService(self.repository)
+        self.registry = Mock(spec=TenancyRegistry)
+        self.auth_context_cache = Mock(spec=TTLCache)
+        self.tenancy_service = TenancyService(
+            self.repository, self.registry, self.auth_context_cache
+        )
 
     def test_fetch_success(self):
         name = "tenancy1"
@@ -90,6 +96,8 @@ class TestTenancyService(unittest.TestCase):
         self.tenancy_service.disable(name)
         self.repository.upsert.assert_called_once()
         self.assertFalse(db_tenancy.is_enabled)
+        self.registry.load.assert_called_once()
+        self.auth_context_cache.clear.assert_called_once()
 
     def test_disable_not_found(self):
         self.repository.fetch.return_value = None
@@ -106,6 +114,8 @@ class TestTenancyService(unittest.TestCase):
         self.tenancy_service.enable(name)
         self.repository.upsert.assert_called_once()
         self.assertTrue(db_tenancy.is_enabled)
+        self.registry.load.assert_called_once()
+        self.auth_context_cache.clear.assert_called_once()
 
     def test_enable_not_found(self):
         self.repository.fetch.return_value = None
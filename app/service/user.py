@@ -1,8 +1,10 @@
 from uuid import UUID
+from app.cache import TTLCache
 from app.exception.not_found import NotFoundException
 from app.model.db.user import Provider as ProviderDBModel, User as UserDBModel
 from app.model.db.tenancy import Tenancy as TenancyDBModel
 from app.model.user import User, UserProvider, UserQuery
+from app.policy_watcher import CasbinPolicyWatcher
 from app.repository.tenancy import TenancyRepository
 from app.repository.user import UserRepository
 from casbin import SyncedEnforcer
@@ -14,10 +16,14 @@ class UserService:
         repository: UserRepository,
         tenancy_repository: TenancyRepository,
         casbin_enforcer: SyncedEnforcer,
+        policy_watcher: CasbinPolicyWatcher,
+        auth_context_cache: TTLCache,
     ) -> None:
         self._repository: UserRepository = repository
         self._tenancy_repository: TenancyRepository = tenancy_repository
         self._casbin_enforcer: SyncedEnforcer = casbin_enforcer
+        self._policy_watcher: CasbinPolicyWatcher = policy_watcher
+        self._auth_context_cache: TTLCache = auth_context_cache
 
     def __adapt_user(self, user: UserDBModel) -> User:
         return User(
@@ -134,6 +140,7 @@ class UserService:
             raise NotFoundException(f"not_found: {id}")
         user.is_enabled = False
         self._repository.upsert(user=user)
+        self._auth_context_cache.invalidate(str(id))
 
     def enable(self, id: UUID) -> None:
         user: UserDBModel = self._repository.fetch_by_id(id=id, is_enabled=False)
@@ -141,6 +148,7 @@ class UserService:
             raise NotFoundException(f"not_found: {id}")
         user.is_enabled = True
         self._repository.upsert(user=user)
+        self._auth_context_cache.invalidate(str(id))
 
     def search(self, query_params: UserQuery) -> list[User]:
         users: list[User] = []
@@ -157,7 +165,10 @@ class UserService:
         return self._casbin_enforcer.enforce(str(user_id), resource, action)
 
     def load_policy(self) -> bool:
-        return self._casbin_enforcer.load_policy()
+        loaded = self._casbin_enforcer.load_policy()
+        # Ask the other processes to reload as well
+        self._policy_watcher.update()
+        return loaded
 
     def add_tenancies(self, user_id: UUID, tenancies: list[str]) -> None:
         # TODO check editor has the access to the tenancy
@@ -170,6 +181,7 @@ class UserService:
             existing_tenancy = self._tenancy_repository.fetch(tenancy=tenancy)
             user.tenancies.append(existing_tenancy)
         self._repository.upsert(user=user)
+        self._auth_context_cache.invalidate(str(user_id))
 
     def remove_tenancies(self, user_id: UUID, tenancies: list[str]) -> None:
         # TODO check editor has the access to the tenancy
@@ -185,3 +197,4 @@ class UserService:
                     user.tenancies.remove(database_tenancy)
                     break
         self._repository.upsert(user=user)
+        self._auth_context_cache.invalidate(str(user_id))
@@ -1,10 +1,12 @@
 import unittest
 from unittest.mock import Mock
 from uuid import uuid4
+from app.cache import TTLCache
 from app.exception.not_found import NotFoundException
 from app.model.user import User, UserProvider
 from app.model.db.user import User as UserDBModel, Provider as ProviderDBModel
 from app.model.db.tenancy import Tenancy as TenancyDBModel
+from app.policy_watcher import CasbinPolicyWatcher
 from app.repository.tenancy import TenancyRepository
 from app.repository.user import UserRepository
 from app.service.user import UserService
@@ -16,8 +18,14 @@ class TestUserService(unittest.TestCase):
         self.user_repository = Mock(spec=UserRepository)
         self.tenancy_repository = Mock(spec=TenancyRepository)
         self.casbin_enforcer = Mock(spec=SyncedEnforcer)
+        self.policy_watcher = Mock(spec=CasbinPolicyWatcher)
+        self.auth_context_cache = Mock(spec=TTLCache)
         self.user_service = UserService(
-            self.user_repository, self.tenancy_repository, self.casbin_enforcer
+            self.user_repository,
+            self.tenancy_repository,
+            self.casbin_enforcer,
+            self.policy_watcher,
+            self.auth_context_cache,
         )
 
     def test_fetch_by_id_success(self):
@@ -221,6 +229,38 @@ class TestUserService(unittest.TestCase):
         self.assertEqual(str(context.exception), f"not_found: {user_id}")
         self.user_repository.fetch_by_id.assert_called_once_with(id=user_id)
 
+    def test_load_policy_notifies_other_processes(self):
+        self.casbin_enforcer.load_policy.return_value = True
+
+        self.assertTrue(self.user_service.load_policy())
+
+        self.casbin_enforcer.load_policy.assert_called_once()
+        self.policy_watcher.update.assert_called_once()
+
+    def test_disable_invalidates_auth_context(self):
+        user_id = uuid4()
+        db_user = Mock(spec=UserDBModel)
+        self.user_repository.fetch_by_id.return_value = db_user
+
+        self.user_service.disable(user_id)
+
+        self.assertFalse(db_user.is_enabled)
+        self.auth_context_cache.invalidate.assert_called_once_with(str(user_id))
+
+    def test_add_tenancies_invalidates_auth_context(self):
+        user_id = uuid4()
+        db_user = Mock(spec=UserDBModel)
+        db_user.tenancies = []
+        db_tenancy = Mock(spec=TenancyDBModel)
+        self.user_repository.fetch_by_id.return_value = db_user
+        self.tenancy_repository.fetch.return_value = db_tenancy
+
+        self.user_service.add_tenancies(user_id, ["tenancy1"])
+
+        self.assertEqual(db_user.tenancies, [db_tenancy])
+        self.user_repository.upsert.assert_called_once_with(user=db_user)
+        self.auth_context_cache.invalidate.assert_called_once_with(str(user_id))
+
     def test_add_provider_success(self):
         user_id = uuid4()
         db_user = Mock(spec=UserDBModel)
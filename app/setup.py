@@ -8,17 +8,22 @@ from app.controller.v1.infrastructure.infrastructure import (
 from app.controller.v1.tenancy.tenancy import router as tenancies_router
 from app.controller.v1.user.user import router as user_router
 from app.controller.v1.dataset.dataset_filter import router as dataset_filter_router
+from app.controller.v1.dataset.dataset_suggestion import (
+    router as dataset_suggestion_router,
+)
 from app.controller.v1.dataset.dataset import router as dataset_router
 from app.controller.v1.dataset.dataset_snapshot import router as dataset_snapshot_router
 from app.controller.v1.internal.dataset_collocation import (
     router as internal_dataset_collocation_router,
 )
+from app.controller.v1.internal.metrics import router as internal_metrics_router
 from app.controller.v1.tus.tus import router as tus_router
 from app.exception.bad_request import BadRequestException
 from app.exception.unauthorized import UnauthorizedException
 from app.exception.not_found import NotFoundException
 from app.exception.conflict import ConflictException
 from app.exception.illegal_state import IllegalStateException
+from app.controller.interceptor.read_your_writes import read_your_writes_middleware
 from app.controller.interceptor.exception_handler import (
     bad_request_exception_handler,
     conflict_exception_handler,
@@ -52,8 +57,20 @@ def setup_logging() -> None:
         logger.addHandler(console_handler)
 
 
+def setup_middlewares(fastAPIApp: FastAPI) -> None:
+    db = fastAPIApp.container.db()
+    # Without a replica every read already sees the writes
+    if db.replica_enabled:
+        fastAPIApp.middleware("http")(
+            read_your_writes_middleware(
+                db, window_seconds=settings.DATABASE_READ_YOUR_WRITES_SECONDS
+            )
+        )
+
+
 def setup_routes(fastAPIApp: FastAPI) -> None:
     fastAPIApp.include_router(dataset_filter_router, prefix="/v1")
+    fastAPIApp.include_router(dataset_suggestion_router, prefix="/v1")
     fastAPIApp.include_router(dataset_router, prefix="/v1")
     fastAPIApp.include_router(dataset_snapshot_router, prefix="/v1")
     fastAPIApp.include_router(tenancies_router, prefix="/v1")
@@ -61,6 +78,7 @@ def setup_routes(fastAPIApp: FastAPI) -> None:
     fastAPIApp.include_router(client_router, prefix="/v1")
     fastAPIApp.include_router(infrastructure_router, prefix="/v1")
     fastAPIApp.include_router(internal_dataset_collocation_router, prefix="/v1")
+    fastAPIApp.include_router(internal_metrics_router, prefix="/v1")
     fastAPIApp.include_router(tus_router, prefix="/v1")
 
 
@@ -0,0 +1,45 @@
+"""Notify listeners when tenancies change
+
+Revision ID: 5e1f0a9c3b72
+Revises: c3h4i5j6k7l8
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1f0a9c3b72"
+down_revision: Union[str, None] = "c3h4i5j6k7l8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Create trigger function publishing on the tenancies_changed channel
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION tenancies_notify_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('tenancies_changed', TG_OP);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # 2. Notify once per statement, the registry reloads the whole table anyway
+    op.execute(
+        """
+        CREATE TRIGGER tenancies_notify_change_trigger
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON tenancies
+        FOR EACH STATEMENT EXECUTE FUNCTION tenancies_notify_change();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tenancies_notify_change_trigger ON tenancies")
+    op.execute("DROP FUNCTION IF EXISTS tenancies_notify_change()")
@@ -0,0 +1,116 @@
+"""Store a weighted tsvector in datasets.search_vector
+
+Revision ID: 7a2d4c6e8f10
+Revises: 5e1f0a9c3b72
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2d4c6e8f10"
+down_revision: Union[str, None] = "5e1f0a9c3b72"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Drop the expression index, searches now use the column directly
+    op.execute("DROP INDEX IF EXISTS idx_datasets_search_vector")
+    op.execute("DROP TRIGGER IF EXISTS datasets_search_vector_trigger ON datasets")
+
+    # 2. Store the tsvector itself instead of the normalized text
+    op.execute(
+        """
+        ALTER TABLE datasets
+        ALTER COLUMN search_vector TYPE tsvector
+        USING to_tsvector('simple', coalesce(search_vector, ''))
+        """
+    )
+
+    # 3. Weight name (A), category (B), institution (C) and description (D)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION datasets_search_vector_update()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple',
+                    unaccent(coalesce(NEW.name, ''))), 'A') ||
+                setweight(to_tsvector('simple',
+                    unaccent(coalesce(NEW.data->>'category', ''))), 'B') ||
+                setweight(to_tsvector('simple',
+                    unaccent(coalesce(NEW.data->>'institution', ''))), 'C') ||
+                setweight(to_tsvector('simple',
+                    unaccent(coalesce(NEW.data->>'description', ''))), 'D');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # 4. Only recompute the vector when the searched columns change
+    op.execute(
+        """
+        CREATE TRIGGER datasets_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF name, data ON datasets
+        FOR EACH ROW EXECUTE FUNCTION datasets_search_vector_update();
+        """
+    )
+
+    # 5. Populate the weighted vector for existing records
+    op.execute("UPDATE datasets SET name = name WHERE name IS NOT NULL")
+
+    # 6. Create GIN index on the stored vector
+    op.execute(
+        "CREATE INDEX idx_datasets_search_vector ON datasets USING GIN(search_vector)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_datasets_search_vector")
+    op.execute("DROP TRIGGER IF EXISTS datasets_search_vector_trigger ON datasets")
+
+    op.execute(
+        """
+        ALTER TABLE datasets
+        ALTER COLUMN search_vector TYPE text
+        USING NULL
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION datasets_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := unaccent(
+                coalesce(NEW.name, '') || ' ' ||
+                coalesce(NEW.data->>'category', '') || ' ' ||
+                coalesce(NEW.data->>'institution', '') || ' ' ||
+                coalesce(NEW.data->>'description', '')
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER datasets_search_vector_trigger
+        BEFORE INSERT OR UPDATE ON datasets
+        FOR EACH ROW EXECUTE FUNCTION datasets_search_vector_update();
+        """
+    )
+
+    op.execute("UPDATE datasets SET name = name WHERE name IS NOT NULL")
+
+    op.execute(
+        """
+        CREATE INDEX idx_datasets_search_vector
+        ON datasets USING GIN(to_tsvector('simple', coalesce(search_vector, '')))
+        """
+    )
@@ -0,0 +1,71 @@
+"""Index dataset structured filters with a JSONB GIN index
+
+Revision ID: 9c4e6a8b0d21
+Revises: 7a2d4c6e8f10
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e6a8b0d21"
+down_revision: Union[str, None] = "7a2d4c6e8f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Options of app/resources/available_filters.json when this revision was
+# written, by Dataset.data key: (value, label). Option ids are
+# "<key>_<lowercase value>"
+FILTER_OPTIONS = {
+    "category": [
+        ("AEROSOLS", "Aerosols"),
+        ("PRECIPITATION", "Precipitation"),
+        ("ATMOSPHERIC_STATE", "Atmospheric State"),
+        ("CLOUD_PROPERTIES", "Cloud Properties"),
+        ("RADIOMETRIC", "Radiometric"),
+        ("SURFACE_PROPERTIES", "Surface Properties"),
+        ("SUBSOIL_GROUNDWATER_PROPERTIES", "Subsoil and Groundwater Properties"),
+        ("RENEWABLE_ENERGY", "Reneweble"),
+    ],
+    "data_type": [("ROUTINE", "Routine"), ("EXPORADIC", "Exporadic")],
+    "level": [("L1", "L1"), ("L2", "L2"), ("L3", "L3")],
+}
+
+
+def upgrade() -> None:
+    # 1. Backfill: store the exact option value wherever a dataset holds the
+    # value, id or label of an option with different casing or spacing, as
+    # AvailableFilters.normalize_data does on write, so the containment
+    # filters match it
+    for key, options in FILTER_OPTIONS.items():
+        for value, label in options:
+            op.execute(
+                sa.text(
+                    """
+                    UPDATE datasets
+                    SET data = jsonb_set(
+                        data, ARRAY[:key], to_jsonb(CAST(:value AS text))
+                    )
+                    WHERE lower(trim(data->>:key))
+                        IN (lower(:value), lower(:id), lower(:label))
+                    AND data->>:key <> :value
+                    """
+                ).bindparams(
+                    key=key, value=value, id=f"{key}_{value.lower()}", label=label
+                )
+            )
+
+    # 2. Create GIN index answering data @> '{"category": "..."}' containment
+    op.execute(
+        "CREATE INDEX idx_datasets_data ON datasets USING GIN(data jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    # Backfilled values are valid option values, they are kept
+    op.execute("DROP INDEX IF EXISTS idx_datasets_data")
@@ -0,0 +1,34 @@
+"""Add trigram index on dataset names for typeahead
+
+Revision ID: b1d3f5a7c9e2
+Revises: 9c4e6a8b0d21
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b1d3f5a7c9e2"
+down_revision: Union[str, None] = "9c4e6a8b0d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Enable pg_trgm for similarity matching and indexed ILIKE
+    # Note: DB user needs CREATE privilege, or extension pre-installed on managed DBs
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # 2. Create GIN trigram index answering name ILIKE '%...%' and name % '...'
+    op.execute(
+        "CREATE INDEX idx_datasets_name_trgm ON datasets USING GIN(name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_datasets_name_trgm")
+
+    # Note: Not dropping pg_trgm extension as other things may depend on it
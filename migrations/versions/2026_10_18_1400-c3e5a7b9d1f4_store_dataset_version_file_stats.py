@@ -0,0 +1,211 @@
+"""Store file count, size and extension breakdown on dataset_versions
+
+Revision ID: c3e5a7b9d1f4
+Revises: b1d3f5a7c9e2
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e5a7b9d1f4"
+down_revision: Union[str, None] = "b1d3f5a7c9e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Aggregate columns, an empty version has no files
+    op.add_column(
+        "dataset_versions",
+        sa.Column("files_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "dataset_versions",
+        sa.Column(
+            "files_size_in_bytes", sa.BigInteger(), nullable=False, server_default="0"
+        ),
+    )
+    op.add_column(
+        "dataset_versions",
+        sa.Column(
+            "files_extensions",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+
+    # 2. Extension of a file name as shown in the snapshot files summary:
+    # "data.backup.csv" is ".csv", "readme" is "(no extension)"
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION data_file_extension(file_name text)
+        RETURNS text AS $$
+            SELECT CASE
+                WHEN position('.' IN file_name) > 0
+                THEN '.' || substring(file_name FROM '[^.]*$')
+                ELSE '(no extension)'
+            END;
+        $$ LANGUAGE sql IMMUTABLE;
+        """
+    )
+
+    # 3. Add (sign = 1) or remove (sign = -1) one file from a version
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION dataset_version_file_stats_apply(
+            version_id uuid, file_name text, file_size bigint, sign integer
+        ) RETURNS void AS $$
+        DECLARE
+            ext text := data_file_extension(file_name);
+            size bigint := sign * coalesce(file_size, 0);
+        BEGIN
+            UPDATE dataset_versions
+            SET files_count = files_count + sign,
+                files_size_in_bytes = files_size_in_bytes + size,
+                files_extensions = CASE
+                    WHEN coalesce(
+                        (files_extensions->ext->>'count')::integer, 0
+                    ) + sign <= 0
+                    THEN files_extensions - ext
+                    ELSE jsonb_set(
+                        files_extensions,
+                        ARRAY[ext],
+                        jsonb_build_object(
+                            'count',
+                            coalesce(
+                                (files_extensions->ext->>'count')::integer, 0
+                            ) + sign,
+                            'total_size_bytes',
+                            coalesce(
+                                (files_extensions->ext->>'total_size_bytes')::bigint,
+                                0
+                            ) + size
+                        )
+                    )
+                END
+            WHERE id = version_id;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # 4. Keep the aggregates in the transaction attaching or detaching files
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION dataset_versions_data_files_stats_update()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM dataset_version_file_stats_apply(
+                    NEW.dataset_version_id, f.name, f.size_bytes, 1
+                )
+                FROM data_files f WHERE f.id = NEW.data_file_id;
+                RETURN NEW;
+            END IF;
+
+            PERFORM dataset_version_file_stats_apply(
+                OLD.dataset_version_id, f.name, f.size_bytes, -1
+            )
+            FROM data_files f WHERE f.id = OLD.data_file_id;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER dataset_versions_data_files_stats_trigger
+        AFTER INSERT OR DELETE ON dataset_versions_data_files
+        FOR EACH ROW EXECUTE FUNCTION dataset_versions_data_files_stats_update();
+        """
+    )
+
+    # 5. A renamed or resized file moves between buckets of every version holding it
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION data_files_stats_update() RETURNS trigger AS $$
+        BEGIN
+            PERFORM dataset_version_file_stats_apply(
+                        a.dataset_version_id, OLD.name, OLD.size_bytes, -1
+                    ),
+                    dataset_version_file_stats_apply(
+                        a.dataset_version_id, NEW.name, NEW.size_bytes, 1
+                    )
+            FROM dataset_versions_data_files a WHERE a.data_file_id = NEW.id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER data_files_stats_trigger
+        AFTER UPDATE OF name, size_bytes ON data_files
+        FOR EACH ROW
+        WHEN (
+            OLD.name IS DISTINCT FROM NEW.name
+            OR OLD.size_bytes IS DISTINCT FROM NEW.size_bytes
+        )
+        EXECUTE FUNCTION data_files_stats_update();
+        """
+    )
+
+    # 6. Populate the aggregates for existing versions
+    op.execute(
+        """
+        WITH per_extension AS (
+            SELECT a.dataset_version_id,
+                   data_file_extension(f.name) AS extension,
+                   count(*) AS files_count,
+                   coalesce(sum(f.size_bytes), 0) AS files_size_in_bytes
+            FROM dataset_versions_data_files a
+            JOIN data_files f ON f.id = a.data_file_id
+            GROUP BY 1, 2
+        )
+        UPDATE dataset_versions v
+        SET files_count = s.files_count,
+            files_size_in_bytes = s.files_size_in_bytes,
+            files_extensions = s.files_extensions
+        FROM (
+            SELECT dataset_version_id,
+                   sum(files_count) AS files_count,
+                   sum(files_size_in_bytes) AS files_size_in_bytes,
+                   jsonb_object_agg(
+                       extension,
+                       jsonb_build_object(
+                           'count', files_count,
+                           'total_size_bytes', files_size_in_bytes
+                       )
+                   ) AS files_extensions
+            FROM per_extension
+            GROUP BY dataset_version_id
+        ) s
+        WHERE v.id = s.dataset_version_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS data_files_stats_trigger ON data_files")
+    op.execute(
+        "DROP TRIGGER IF EXISTS dataset_versions_data_files_stats_trigger "
+        "ON dataset_versions_data_files"
+    )
+    op.execute("DROP FUNCTION IF EXISTS data_files_stats_update()")
+    op.execute("DROP FUNCTION IF EXISTS dataset_versions_data_files_stats_update()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "dataset_version_file_stats_apply(uuid, text, bigint, integer)"
+    )
+    op.execute("DROP FUNCTION IF EXISTS data_file_extension(text)")
+
+    op.drop_column("dataset_versions", "files_extensions")
+    op.drop_column("dataset_versions", "files_size_in_bytes")
+    op.drop_column("dataset_versions", "files_count")
@@ -0,0 +1,165 @@
+"""Add current and latest published version pointers to datasets
+
+Revision ID: d5f7b9c1e3a6
+Revises: c3e5a7b9d1f4
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f7b9c1e3a6"
+down_revision: Union[str, None] = "c3e5a7b9d1f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Pointer columns
+    op.add_column(
+        "datasets",
+        sa.Column("current_version_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "datasets",
+        sa.Column(
+            "latest_published_version_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+        ),
+    )
+    op.create_foreign_key(
+        "fk_datasets_current_version_id",
+        "datasets",
+        "dataset_versions",
+        ["current_version_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_foreign_key(
+        "fk_datasets_latest_published_version_id",
+        "datasets",
+        "dataset_versions",
+        ["latest_published_version_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    # 2. Recomputing the pointers reads the versions of one dataset by date
+    op.create_index(
+        "idx_dataset_versions_dataset_id_created_at",
+        "dataset_versions",
+        ["dataset_id", "created_at"],
+    )
+
+    # 3. Current version: the most recent one. Latest published version: the
+    # most recent enabled one with a DOI
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION datasets_version_pointers_refresh(target uuid)
+        RETURNS void AS $$
+        BEGIN
+            UPDATE datasets
+            SET current_version_id = (
+                    SELECT v.id FROM dataset_versions v
+                    WHERE v.dataset_id = target
+                    ORDER BY v.created_at DESC
+                    LIMIT 1
+                ),
+                latest_published_version_id = (
+                    SELECT v.id FROM dataset_versions v
+                    WHERE v.dataset_id = target
+                    AND v.is_enabled
+                    AND EXISTS (SELECT 1 FROM dois d WHERE d.version_id = v.id)
+                    ORDER BY v.created_at DESC
+                    LIMIT 1
+                )
+            WHERE id = target;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # 4. Refresh in the transaction creating, enabling or disabling a version
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION dataset_versions_pointers_update()
+        RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' AND OLD.dataset_id IS NOT NULL THEN
+                PERFORM datasets_version_pointers_refresh(OLD.dataset_id);
+            END IF;
+            IF TG_OP <> 'DELETE' AND NEW.dataset_id IS NOT NULL
+                AND (
+                    TG_OP = 'INSERT' OR NEW.dataset_id IS DISTINCT FROM OLD.dataset_id
+                ) THEN
+                PERFORM datasets_version_pointers_refresh(NEW.dataset_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER dataset_versions_pointers_trigger
+        AFTER INSERT OR DELETE
+        OR UPDATE OF dataset_id, design_state, is_enabled, created_at
+        ON dataset_versions
+        FOR EACH ROW EXECUTE FUNCTION dataset_versions_pointers_update();
+        """
+    )
+
+    # 5. A version counts as published once it holds a DOI
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION dois_version_pointers_update() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                PERFORM datasets_version_pointers_refresh(v.dataset_id)
+                FROM dataset_versions v WHERE v.id = OLD.version_id;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                PERFORM datasets_version_pointers_refresh(v.dataset_id)
+                FROM dataset_versions v WHERE v.id = NEW.version_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER dois_version_pointers_trigger
+        AFTER INSERT OR DELETE OR UPDATE OF version_id ON dois
+        FOR EACH ROW EXECUTE FUNCTION dois_version_pointers_update();
+        """
+    )
+
+    # 6. Populate the pointers of existing datasets
+    op.execute("SELECT datasets_version_pointers_refresh(id) FROM datasets")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS dois_version_pointers_trigger ON dois")
+    op.execute(
+        "DROP TRIGGER IF EXISTS dataset_versions_pointers_trigger ON dataset_versions"
+    )
+    op.execute("DROP FUNCTION IF EXISTS dois_version_pointers_update()")
+    op.execute("DROP FUNCTION IF EXISTS dataset_versions_pointers_update()")
+    op.execute("DROP FUNCTION IF EXISTS datasets_version_pointers_refresh(uuid)")
+
+    op.drop_index(
+        "idx_dataset_versions_dataset_id_created_at", table_name="dataset_versions"
+    )
+    op.drop_constraint(
+        "fk_datasets_latest_published_version_id", "datasets", type_="foreignkey"
+    )
+    op.drop_constraint("fk_datasets_current_version_id", "datasets", type_="foreignkey")
+    op.drop_column("datasets", "latest_published_version_id")
+    op.drop_column("datasets", "current_version_id")
@@ -0,0 +1,72 @@
+"""Add composite and partial indexes for hot repository queries
+
+Revision ID: e9b1d3f5a7c8
+Revises: d5f7b9c1e3a6
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e9b1d3f5a7c8"
+down_revision: Union[str, None] = "d5f7b9c1e3a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. DatasetVersionRepository.fetch_draft_version: newest draft of a dataset.
+    # fetch_version_by_name is served by uc_dataset_versions_name_dataset_id
+    op.create_index(
+        "idx_dataset_versions_dataset_id_design_state_created_at",
+        "dataset_versions",
+        ["dataset_id", "design_state", sa.text("created_at DESC")],
+    )
+
+    # 2. DatasetRepository.search: enabled datasets of the tenancies, newest first
+    op.create_index(
+        "idx_datasets_enabled_tenancy_created_at",
+        "datasets",
+        ["tenancy", sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("is_enabled"),
+    )
+
+    # 3. DatasetRepository.fetch_by_collocation_status: enabled datasets by status,
+    # oldest first
+    op.create_index(
+        "idx_datasets_enabled_collocation_status_created_at",
+        "datasets",
+        ["file_collocation_status", "created_at"],
+        postgresql_where=sa.text("is_enabled"),
+    )
+
+    # 4. Eager loads of DatasetVersion.files and DatasetVersion.doi, and the file
+    # statistics trigger looking up the versions holding a file
+    op.create_index("idx_data_files_version_id", "data_files", ["version_id"])
+    op.create_index("idx_dois_version_id", "dois", ["version_id"])
+    op.create_index(
+        "idx_dataset_versions_data_files_data_file_id",
+        "dataset_versions_data_files",
+        ["data_file_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_dataset_versions_data_files_data_file_id",
+        table_name="dataset_versions_data_files",
+    )
+    op.drop_index("idx_dois_version_id", table_name="dois")
+    op.drop_index("idx_data_files_version_id", table_name="data_files")
+    op.drop_index(
+        "idx_datasets_enabled_collocation_status_created_at", table_name="datasets"
+    )
+    op.drop_index("idx_datasets_enabled_tenancy_created_at", table_name="datasets")
+    op.drop_index(
+        "idx_dataset_versions_dataset_id_design_state_created_at",
+        table_name="dataset_versions",
+    )
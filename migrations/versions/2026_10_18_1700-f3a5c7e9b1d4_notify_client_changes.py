@@ -0,0 +1,59 @@
+"""Notify listeners when clients change
+
+Revision ID: f3a5c7e9b1d4
+Revises: e9b1d3f5a7c8
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a5c7e9b1d4"
+down_revision: Union[str, None] = "e9b1d3f5a7c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 1. Create trigger function publishing the changed key on clients_changed
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION clients_notify_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                PERFORM pg_notify('clients_changed', '');
+            ELSE
+                PERFORM pg_notify('clients_changed', OLD.key::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+    # 2. Notify once per row, processes only drop the cached entries of that key
+    op.execute(
+        """
+        CREATE TRIGGER clients_notify_change_trigger
+        AFTER UPDATE OR DELETE ON clients
+        FOR EACH ROW EXECUTE FUNCTION clients_notify_change();
+        """
+    )
+
+    # 3. An empty payload makes processes drop every cached client
+    op.execute(
+        """
+        CREATE TRIGGER clients_notify_truncate_trigger
+        AFTER TRUNCATE ON clients
+        FOR EACH STATEMENT EXECUTE FUNCTION clients_notify_change();
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS clients_notify_truncate_trigger ON clients")
+    op.execute("DROP TRIGGER IF EXISTS clients_notify_change_trigger ON clients")
+    op.execute("DROP FUNCTION IF EXISTS clients_notify_change()")
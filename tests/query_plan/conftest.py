@@ -0,0 +1,147 @@
+"""
+Query plan regression suite.
+
+Seeds a realistic volume of datasets, versions, files and DOIs inside a
+transaction, runs the hot repository methods against it and EXPLAINs every
+statement they issue. The transaction is rolled back at the end, so the suite
+can run against the integration test database (see `make query-plan-test`).
+"""
+
+import os
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.engine import URL
+from sqlalchemy.orm import Session
+
+# Every mapped model must be imported to configure the relationships
+from app.model.db import casbin_rule, client, dataset, doi, tenancy, user  # noqa: F401
+
+DATASETS = 20_000
+TENANCIES = 50
+VERSIONS_PER_DATASET = 3
+FILES_PER_VERSION = 2
+
+# Seeded tenancies are "query-plan/0" to "query-plan/49"
+TENANCY_PREFIX = "query-plan/"
+
+SEED = [
+    """
+    INSERT INTO datasets (
+        name, data, is_enabled, tenancy, design_state, visibility,
+        file_collocation_status, created_at
+    )
+    SELECT
+        'query plan dataset ' || i || ' ' || md5(i::text),
+        jsonb_build_object(
+            'category', (ARRAY['AEROSOLS', 'PRECIPITATION', 'RADIOMETRIC'])[1 + i % 3],
+            'data_type', 'ROUTINE',
+            'level', 'L' || (1 + i % 3),
+            'description', md5(i::text)
+        ),
+        i % 20 <> 0,
+        :tenancy_prefix || (i % :tenancies),
+        CASE WHEN i % 2 = 0 THEN 'PUBLISHED' ELSE 'DRAFT' END,
+        CAST('PRIVATE' AS visibilitystatus),
+        CAST(CASE WHEN i % 100 = 0 THEN 'pending' ELSE 'completed' END
+            AS filecollocationstatus),
+        now() - make_interval(mins => i)
+    FROM generate_series(1, :datasets) AS i
+    """,
+    """
+    INSERT INTO dataset_versions
+        (name, dataset_id, design_state, is_enabled, created_at)
+    SELECT
+        n::text,
+        d.id,
+        CASE WHEN n = :versions THEN 'DRAFT' ELSE 'PUBLISHED' END,
+        true,
+        d.created_at + make_interval(days => n)
+    FROM datasets d
+    CROSS JOIN generate_series(1, :versions) AS n
+    WHERE d.tenancy LIKE :tenancy_pattern
+    """,
+    """
+    INSERT INTO dois (identifier, mode, state, version_id)
+    SELECT '10.0000/query-plan-' || v.id, 'AUTO', 'FINDABLE', v.id
+    FROM dataset_versions v
+    JOIN datasets d ON d.id = v.dataset_id
+    WHERE d.tenancy LIKE :tenancy_pattern AND v.design_state = 'PUBLISHED'
+    """,
+    """
+    INSERT INTO data_files (name, size_bytes, extension, version_id, created_at)
+    SELECT 'file-' || f || '.csv', 1024 * f, 'csv', v.id, v.created_at
+    FROM dataset_versions v
+    JOIN datasets d ON d.id = v.dataset_id
+    CROSS JOIN generate_series(1, :files) AS f
+    WHERE d.tenancy LIKE :tenancy_pattern
+    """,
+    """
+    INSERT INTO dataset_versions_data_files (dataset_version_id, data_file_id)
+    SELECT f.version_id, f.id
+    FROM data_files f
+    JOIN dataset_versions v ON v.id = f.version_id
+    JOIN datasets d ON d.id = v.dataset_id
+    WHERE d.tenancy LIKE :tenancy_pattern
+    """,
+    "ANALYZE datasets, dataset_versions, dataset_versions_data_files, data_files, dois",
+]
+
+
+def _database_url() -> URL:
+    # The integration test database, published on localhost:5433
+    return URL.create(
+        "postgresql",
+        username=os.getenv("POSTGRES_USER", "gk_admin"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+        host=os.getenv("QUERY_PLAN_POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("QUERY_PLAN_POSTGRES_PORT", "5433")),
+        database=os.getenv("POSTGRES_DB", "gatekeeper_db"),
+    )
+
+
+@pytest.fixture(scope="session")
+def connection():
+    """Connection holding the seeded rows in a transaction rolled back at the end."""
+    engine = create_engine(_database_url())
+    try:
+        connection = engine.connect()
+    except exc.OperationalError as e:
+        pytest.skip(f"Database not accessible: {e}")
+
+    transaction = connection.begin()
+    try:
+        for statement in SEED:
+            connection.execute(
+                text(statement),
+                {
+                    "datasets": DATASETS,
+                    "tenancies": TENANCIES,
+                    "versions": VERSIONS_PER_DATASET,
+                    "files": FILES_PER_VERSION,
+                    "tenancy_prefix": TENANCY_PREFIX,
+                    "tenancy_pattern": TENANCY_PREFIX + "%",
+                },
+            )
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def session_factory(connection):
+    """
+    Session factory of the repositories. Every call shares one session bound
+    to the seeded connection, which repositories never commit when reading.
+    """
+    session = Session(bind=connection)
+
+    @contextmanager
+    def factory():
+        yield session
+
+    yield factory
+    session.close()
@@ -0,0 +1,70 @@
+"""Capture the statements of a repository call and inspect their plans."""
+
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+
+from app.repository.explain import root_plan
+
+# Tables large enough in production that a sequential scan is a regression
+HOT_TABLES = {
+    "datasets",
+    "dataset_versions",
+    "dataset_versions_data_files",
+    "data_files",
+    "dois",
+}
+
+
+@contextmanager
+def capture_statements(connection: Connection) -> Iterator[list[tuple]]:
+    """Collects the SELECT statements, with their parameters, run on the connection."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+def explain(connection: Connection, statement: str, parameters) -> dict:
+    result = connection.exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + statement, parameters
+    ).scalar()
+    return root_plan(result)
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Hot tables read by a sequential scan anywhere in the plan."""
+    scans = []
+    if plan["Node Type"] == "Seq Scan" and plan.get("Relation Name") in HOT_TABLES:
+        scans.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        scans.extend(seq_scans(child))
+    return scans
+
+
+def assert_no_seq_scan(connection: Connection, call: Callable[[], object]) -> None:
+    """
+    Runs `call`, then EXPLAINs every statement it issued and fails when one of
+    them reads a hot table sequentially.
+    """
+    with capture_statements(connection) as statements:
+        call()
+
+    assert statements, "the call did not query the database"
+
+    regressions = []
+    for statement, parameters in statements:
+        scans = seq_scans(explain(connection, statement, parameters))
+        if scans:
+            regressions.append(f"Seq Scan on {', '.join(scans)}:\n{statement}")
+
+    assert not regressions, "\n\n".join(regressions)
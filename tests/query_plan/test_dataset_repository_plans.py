@@ -0,0 +1,140 @@
+import pytest
+from sqlalchemy import text
+
+from app.model.dataset import DatasetQuery, FileCollocationStatus
+from app.repository.dataset import DatasetRepository
+from app.repository.dataset_version import DatasetVersionRepository
+from app.repository.load_plan import DATASET_WITH_VERSIONS, VERSION_WITH_DOI
+from tests.query_plan.conftest import TENANCY_PREFIX
+from tests.query_plan.plans import assert_no_seq_scan
+
+TENANCIES = [TENANCY_PREFIX + "7", TENANCY_PREFIX + "8"]
+
+
+@pytest.fixture(scope="module")
+def sample(connection):
+    """An enabled dataset of the first tenancy with its versions."""
+    return connection.execute(
+        text(
+            """
+            SELECT d.id AS dataset_id, v.id AS version_id, v.name AS version_name
+            FROM datasets d
+            JOIN dataset_versions v ON v.id = d.current_version_id
+            WHERE d.tenancy = :tenancy AND d.is_enabled
+            ORDER BY d.created_at DESC
+            LIMIT 1
+            """
+        ),
+        {"tenancy": TENANCIES[0]},
+    ).one()
+
+
+@pytest.fixture
+def dataset_repository(session_factory):
+    with session_factory() as session:
+        # Loaded rows would be served by the identity map instead of a query
+        session.expire_all()
+    return DatasetRepository(session_factory=session_factory)
+
+
+@pytest.fixture
+def version_repository(session_factory):
+    with session_factory() as session:
+        session.expire_all()
+    return DatasetVersionRepository(session_factory=session_factory)
+
+
+class TestDatasetRepositoryPlans:
+    def test_fetch(self, connection, dataset_repository, sample):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.fetch(sample.dataset_id, tenancies=TENANCIES),
+        )
+
+    def test_fetch_latest_version(self, connection, dataset_repository, sample):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.fetch(
+                sample.dataset_id, tenancies=TENANCIES, latest_version=True
+            ),
+        )
+
+    def test_search(self, connection, dataset_repository):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.search(DatasetQuery(), tenancies=TENANCIES),
+        )
+
+    def test_search_full_text(self, connection, dataset_repository):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.search(
+                DatasetQuery(full_text="dataset"), tenancies=TENANCIES
+            ),
+        )
+
+    def test_search_minimal(self, connection, dataset_repository):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.search_minimal(
+                DatasetQuery(minimal=True), tenancies=TENANCIES
+            ),
+        )
+
+    def test_count_facets(self, connection, dataset_repository):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.count_facets(
+                DatasetQuery(), tenancies=TENANCIES
+            ),
+        )
+
+    def test_suggest(self, connection, dataset_repository):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.suggest("query plan", tenancies=TENANCIES),
+        )
+
+    def test_fetch_by_collocation_status(self, connection, dataset_repository):
+        assert_no_seq_scan(
+            connection,
+            lambda: dataset_repository.fetch_by_collocation_status(
+                [None, FileCollocationStatus.PENDING],
+                load_plan=DATASET_WITH_VERSIONS,
+            ),
+        )
+
+
+class TestDatasetVersionRepositoryPlans:
+    def test_fetch_draft_version(self, connection, version_repository, sample):
+        assert_no_seq_scan(
+            connection,
+            lambda: version_repository.fetch_draft_version(sample.dataset_id),
+        )
+
+    def test_fetch_version_by_name(self, connection, version_repository, sample):
+        assert_no_seq_scan(
+            connection,
+            lambda: version_repository.fetch_version_by_name(
+                sample.dataset_id, sample.version_name
+            ),
+        )
+
+    def test_fetch_by_id(self, connection, version_repository, sample):
+        assert_no_seq_scan(
+            connection,
+            lambda: version_repository.fetch_by_id(
+                sample.version_id, load_plan=VERSION_WITH_DOI
+            ),
+        )
+
+    def test_fetch_published_version_by_name(
+        self, connection, version_repository, sample
+    ):
+        # The first version of every seeded dataset is published with a DOI
+        assert_no_seq_scan(
+            connection,
+            lambda: version_repository.fetch_version_by_name(
+                sample.dataset_id, "1", load_plan=VERSION_WITH_DOI
+            ),
+        )
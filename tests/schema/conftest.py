@@ -0,0 +1,128 @@
+"""
+Schema regression suite.
+
+Builds a throwaway database on the integration test server with
+`Database.create_database`, as the app does on a fresh database before any
+migration runs, and checks that the columns maintained by triggers are kept
+on that schema too (see `make schema-test`).
+"""
+
+import asyncio
+import os
+from unittest.mock import Mock
+from uuid import UUID
+
+import pytest
+from pydantic import PostgresDsn
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.engine import URL
+
+from app.cache import TTLCache
+from app.database import Database
+from app.model.auth_context import AuthContext
+
+# Every mapped model must be imported to build the whole schema
+from app.model.db import casbin_rule, client, dataset, doi, tenancy, user  # noqa: F401
+from app.repository.datafile import DataFileRepository
+from app.repository.dataset import DatasetRepository
+from app.repository.dataset_version import DatasetVersionRepository
+from app.service.auth_context import AuthContextService
+from app.service.available_filters import AvailableFilters
+from app.service.dataset import DatasetService
+from app.service.dataset_cache import DatasetCache
+
+SCHEMA_DATABASE = "gatekeeper_schema_test"
+
+# Tenancy of the datasets created by the tests
+TENANCY = "schema-test"
+
+
+def _database_url(database: str) -> URL:
+    # The integration test database server, published on localhost:5433
+    return URL.create(
+        "postgresql",
+        username=os.getenv("POSTGRES_USER", "gk_admin"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+        host=os.getenv("SCHEMA_POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("SCHEMA_POSTGRES_PORT", "5433")),
+        database=database,
+    )
+
+
+@pytest.fixture(scope="session")
+def database():
+    """Database built by `create_database`, dropped at the end."""
+    admin_engine = create_engine(
+        _database_url(os.getenv("POSTGRES_DB", "gatekeeper_db")),
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        admin = admin_engine.connect()
+    except exc.OperationalError as e:
+        pytest.skip(f"Database not accessible: {e}")
+
+    admin.execute(text(f"DROP DATABASE IF EXISTS {SCHEMA_DATABASE}"))
+    admin.execute(text(f"CREATE DATABASE {SCHEMA_DATABASE}"))
+    database = Database(
+        db_url=PostgresDsn(
+            _database_url(SCHEMA_DATABASE).render_as_string(hide_password=False)
+        ),
+        log_enabled=False,
+        async_enabled=True,
+    )
+    try:
+        database.create_database()
+        yield database
+    finally:
+        database.get_engine().dispose()
+        asyncio.run(database.dispose_async_engine())
+        admin.execute(text(f"DROP DATABASE IF EXISTS {SCHEMA_DATABASE}"))
+        admin.close()
+        admin_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def user_id(database) -> UUID:
+    with database.session() as session:
+        user_id = session.execute(
+            text(
+                "INSERT INTO users (name, email, is_enabled) "
+                "VALUES ('schema test', 'schema-test@example.com', true) "
+                "RETURNING id"
+            )
+        ).scalar_one()
+        session.commit()
+    return user_id
+
+
+@pytest.fixture
+def dataset_service(database, user_id) -> DatasetService:
+    """Dataset service on the real repositories, members of TENANCY."""
+    auth_context_service = Mock(spec=AuthContextService)
+    auth_context_service.resolve.return_value = AuthContext(
+        user_id=user_id, tenancies={TENANCY: True}
+    )
+    return DatasetService(
+        repository=DatasetRepository(
+            session_factory=database.session,
+            read_session_factory=database.read_session,
+        ),
+        version_repository=DatasetVersionRepository(session_factory=database.session),
+        data_file_repository=DataFileRepository(session_factory=database.session),
+        auth_context_service=auth_context_service,
+        doi_service=Mock(),
+        minio_gateway=Mock(),
+        tenancy_registry=Mock(),
+        dataset_bucket="dataset_bucket",
+        count_cache=TTLCache(max_size=10, ttl_seconds=60),
+        default_count_strategy="exact",
+        count_estimate_threshold=1000,
+        facet_cache=TTLCache(max_size=10, ttl_seconds=60),
+        available_filters=AvailableFilters(),
+        unit_of_work=database.unit_of_work,
+        dataset_cache=DatasetCache(
+            local=TTLCache(max_size=10, ttl_seconds=60),
+            generations=TTLCache(max_size=10, ttl_seconds=60),
+            ttl_seconds=60,
+        ),
+    )
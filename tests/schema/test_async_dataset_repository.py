@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.model.dataset import CountStrategy, Dataset, DatasetQuery
+from app.model.db.dataset import DesignState
+from app.repository.aio.dataset import AsyncDatasetRepository
+from tests.schema.conftest import TENANCY
+
+
+@pytest.fixture
+def repository(database) -> AsyncDatasetRepository:
+    return AsyncDatasetRepository(
+        session_factory=database.async_session,
+        read_session_factory=database.async_read_session,
+    )
+
+
+@pytest.fixture
+def dataset(dataset_service, user_id) -> Dataset:
+    """A dataset with a draft version 1, disabled, and a draft version 2."""
+    created = dataset_service.create_dataset(
+        Dataset(
+            name="async repository",
+            data={"category": "aerosols", "level": "L1"},
+            tenancy=TENANCY,
+        ),
+        user_id=user_id,
+    )
+    dataset_service.create_new_version(dataset_id=created.id, user_id=user_id)
+    return created
+
+
+def test_fetch_latest_version(repository, dataset):
+    fetched = asyncio.run(
+        repository.fetch(dataset.id, tenancies=[TENANCY], latest_version=True)
+    )
+
+    assert fetched is not None
+    current = next(v for v in fetched.versions if v.id == fetched.current_version_id)
+    assert current.name == "2"
+
+    published = asyncio.run(
+        repository.fetch(
+            dataset.id,
+            tenancies=[TENANCY],
+            latest_version=True,
+            version_design_state=DesignState.PUBLISHED,
+        )
+    )
+    assert published is None
+
+
+def test_search_minimal(repository, dataset):
+    result = asyncio.run(
+        repository.search_minimal(
+            DatasetQuery(categories=["AEROSOLS"], level="L1", page_size=20),
+            tenancies=[TENANCY],
+        )
+    )
+
+    item = next(item for item in result.items if item.id == dataset.id)
+    assert item.data["category"] == "AEROSOLS"
+    assert [version.name for version in item.versions] == ["1", "2"]
+    assert item.current_version.name == "2"
+    assert result.total_count == len(result.items)
+
+
+def test_estimate_count(repository, dataset):
+    estimate = asyncio.run(
+        repository.estimate_count(
+            DatasetQuery(count_strategy=CountStrategy.ESTIMATED), tenancies=[TENANCY]
+        )
+    )
+
+    assert isinstance(estimate, int)
+    assert estimate >= 0
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import text
+
+from app.model.dataset import DataFile, Dataset
+from app.repository.dataset import DatasetRepository
+from app.repository.dataset_version import DatasetVersionRepository
+from app.repository.load_plan import VERSION_WITH_DOI
+from tests.schema.conftest import TENANCY
+
+
+@pytest.mark.parametrize(
+    "file_name, extension",
+    [
+        ("data.csv", ".csv"),
+        ("data.backup.csv", ".csv"),
+        ("readme", "(no extension)"),
+        (".hidden", ".hidden"),
+    ],
+)
+def test_data_file_extension(database, file_name, extension):
+    with database.session() as session:
+        assert (
+            session.execute(
+                text("SELECT data_file_extension(:file_name)"),
+                {"file_name": file_name},
+            ).scalar_one()
+            == extension
+        )
+
+
+def test_create_data_file_updates_version_stats(database, dataset_service, user_id):
+    created = dataset_service.create_dataset(
+        Dataset(name="file stats", data={"title": "Test Dataset"}, tenancy=TENANCY),
+        user_id=user_id,
+    )
+    files = [
+        ("data.csv", 1024),
+        ("metadata.json", 512),
+        ("report.csv", 2048),
+        ("readme", 256),
+        ("data.backup.csv", 512),
+        (".hidden", 128),
+    ]
+    for name, size_bytes in files:
+        dataset_service.create_data_file(
+            DataFile(name=name, size_bytes=size_bytes),
+            dataset_id=created.id,
+            user_id=user_id,
+        )
+
+    version = DatasetVersionRepository(session_factory=database.session).fetch_by_id(
+        id=created.current_version.id, load_plan=VERSION_WITH_DOI
+    )
+    assert version.files_count == 6
+    assert version.files_size_in_bytes == 4480
+    assert version.files_extensions == {
+        ".csv": {"count": 3, "total_size_bytes": 3584},
+        ".json": {"count": 1, "total_size_bytes": 512},
+        ".hidden": {"count": 1, "total_size_bytes": 128},
+        "(no extension)": {"count": 1, "total_size_bytes": 256},
+    }
+
+    dataset = DatasetRepository(session_factory=database.session).fetch(
+        dataset_id=created.id, tenancies=[TENANCY]
+    )
+    summary = dataset_service._create_dataset_json_snapshot(dataset, version)[
+        "files_summary"
+    ]
+    assert summary["total_files"] == 6
+    assert summary["total_size_bytes"] == 4480
+    assert summary["extensions_breakdown"][0] == {
+        "extension": ".csv",
+        "count": 3,
+        "total_size_bytes": 3584,
+    }
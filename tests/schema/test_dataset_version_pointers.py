@@ -0,0 +1,72 @@
+from sqlalchemy import text
+
+from app.model.dataset import Dataset
+from app.repository.dataset import DatasetRepository
+from tests.schema.conftest import TENANCY
+
+
+def _pointers(database, dataset_id):
+    with database.session() as session:
+        return session.execute(
+            text(
+                "SELECT current_version_id, latest_published_version_id "
+                "FROM datasets WHERE id = :id"
+            ),
+            {"id": dataset_id},
+        ).one()
+
+
+def test_create_dataset_points_to_first_version(database, dataset_service, user_id):
+    created = dataset_service.create_dataset(
+        Dataset(name="pointers first version", data={}, tenancy=TENANCY),
+        user_id=user_id,
+    )
+
+    assert created.current_version is not None
+    assert created.current_version.name == "1"
+    current_version_id, latest_published_version_id = _pointers(database, created.id)
+    assert current_version_id == created.current_version.id
+    assert latest_published_version_id is None
+
+
+def test_create_new_version_moves_current_version(database, dataset_service, user_id):
+    created = dataset_service.create_dataset(
+        Dataset(name="pointers new version", data={}, tenancy=TENANCY),
+        user_id=user_id,
+    )
+
+    new_version = dataset_service.create_new_version(
+        dataset_id=created.id, user_id=user_id
+    )
+
+    assert new_version.name == "2"
+    current_version_id, _ = _pointers(database, created.id)
+    assert current_version_id == new_version.id
+    latest = DatasetRepository(session_factory=database.session).fetch(
+        dataset_id=created.id, tenancies=[TENANCY], latest_version=True
+    )
+    assert latest is not None
+    assert latest.current_version_id == new_version.id
+
+
+def test_doi_marks_latest_published_version(database, dataset_service, user_id):
+    created = dataset_service.create_dataset(
+        Dataset(name="pointers published version", data={}, tenancy=TENANCY),
+        user_id=user_id,
+    )
+
+    with database.session() as session:
+        session.execute(
+            text(
+                "INSERT INTO dois (identifier, mode, version_id) "
+                "VALUES (:identifier, 'MANUAL', :version_id)"
+            ),
+            {
+                "identifier": f"10.0000/{created.id}",
+                "version_id": created.current_version.id,
+            },
+        )
+        session.commit()
+
+    _, latest_published_version_id = _pointers(database, created.id)
+    assert latest_published_version_id == created.current_version.id